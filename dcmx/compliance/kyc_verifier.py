@@ -7,16 +7,72 @@ import logging
 import os
 import re
 import sqlite3
+import sys
+import threading
 import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, List, Optional, Tuple
 
+import msgpack
 from cryptography.fernet import Fernet
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses (Python 3.10+) avoid a per-instance __dict__
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Encrypted fields packed into the single kyc_profiles.envelope_encrypted token.
+# Record fields (pii, document, address, biometric) are dicts; the rest are strings.
+ENVELOPE_FIELDS = ("pii", "email", "document", "address", "biometric", "source_of_funds")
+_RECORD_FIELDS = ("pii", "document", "address", "biometric")
+# Leading format byte, so the layout can change without guessing at old rows
+_ENVELOPE_VERSION = 1
+
+
+def _pack_envelope(fields: Dict[str, Any]) -> bytes:
+    """Pack envelope fields as [u8 version] + one msgpack map."""
+    return bytes([_ENVELOPE_VERSION]) + msgpack.packb(fields, use_bin_type=True)
+
+
+def _unpack_envelope(blob: bytes) -> Dict[str, Any]:
+    """Decode an envelope produced by _pack_envelope."""
+    version = blob[0]
+    if version != _ENVELOPE_VERSION:
+        raise ValueError(f"Unsupported KYC envelope version: {version}")
+    return msgpack.unpackb(blob[1:], raw=False)
+
+
+def _dumps_json(data: Dict[str, Any]) -> str:
+    """Serialize to JSON text, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+def _loads_json(text: str) -> Any:
+    """Parse JSON text, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+_INSERT_SQL: Final[str] = """
+    INSERT OR REPLACE INTO kyc_profiles (
+        user_id, wallet_address, email_verified, kyc_level,
+        verification_status, verification_timestamp, jurisdiction,
+        risk_assessment, source_of_funds_verified, created_at,
+        updated_at, expires_at, envelope_encrypted
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class KYCLevel(Enum):
     """KYC verification levels."""
@@ -26,6 +82,14 @@ class KYCLevel(Enum):
     ENHANCED = 3     # Full verification + source of funds
 
 
+# Precomputed level values/names for hot comparison paths
+_LVL_STANDARD = KYCLevel.STANDARD.value
+_LVL_ENHANCED = KYCLevel.ENHANCED.value
+_NAME_STANDARD = KYCLevel.STANDARD.name
+_NAME_ENHANCED = KYCLevel.ENHANCED.name
+_KYC_LEVEL_BY_VALUE = {level.value: level for level in KYCLevel}
+
+
 class VerificationStatus(Enum):
     """Status of a verification step."""
     PENDING = "pending"
@@ -52,7 +116,7 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DocumentVerification:
     """Result of document verification."""
     document_type: DocumentType
@@ -64,8 +128,21 @@ class DocumentVerification:
     verification_timestamp: Optional[str] = None
     rejection_reason: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "document_type": self.document_type.value,
+            "document_number": self.document_number,
+            "issuing_country": self.issuing_country,
+            "expiry_date": self.expiry_date,
+            "verified": self.verified,
+            "confidence_score": self.confidence_score,
+            "verification_timestamp": self.verification_timestamp,
+            "rejection_reason": self.rejection_reason,
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AddressVerification:
     """Result of address verification."""
     address_line1: str
@@ -78,8 +155,22 @@ class AddressVerification:
     verification_method: str = ""  # utility_bill, bank_statement, etc.
     verification_timestamp: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "address_line1": self.address_line1,
+            "address_line2": self.address_line2,
+            "city": self.city,
+            "state": self.state,
+            "postal_code": self.postal_code,
+            "country": self.country,
+            "verified": self.verified,
+            "verification_method": self.verification_method,
+            "verification_timestamp": self.verification_timestamp,
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BiometricVerification:
     """Result of biometric/liveness verification."""
     liveness_check_passed: bool = False
@@ -88,8 +179,18 @@ class BiometricVerification:
     verification_timestamp: Optional[str] = None
     provider_reference: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "liveness_check_passed": self.liveness_check_passed,
+            "face_match_score": self.face_match_score,
+            "face_match_passed": self.face_match_passed,
+            "verification_timestamp": self.verification_timestamp,
+            "provider_reference": self.provider_reference,
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RiskAssessment:
     """Risk scoring for a user."""
     overall_score: float = 0.0
@@ -98,8 +199,18 @@ class RiskAssessment:
     flags: List[str] = field(default_factory=list)
     assessment_timestamp: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "overall_score": self.overall_score,
+            "risk_level": self.risk_level.value,
+            "factors": dict(self.factors),
+            "flags": list(self.flags),
+            "assessment_timestamp": self.assessment_timestamp,
+        }
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class UserProfile:
     """User identity profile with KYC data."""
     user_id: str
@@ -195,6 +306,10 @@ class KYCVerifier:
         # In-memory cache
         self.verified_users: Dict[str, UserProfile] = {}
 
+        # Shared connection so SQLite's statement cache is reused across calls
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+
         # Initialize database
         self._init_database()
 
@@ -204,7 +319,7 @@ class KYCVerifier:
         """Initialize SQLite database for KYC records."""
         os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -226,18 +341,49 @@ class KYCVerifier:
                 source_of_funds_verified INTEGER DEFAULT 0,
                 created_at TEXT,
                 updated_at TEXT,
-                expires_at TEXT
+                expires_at TEXT,
+                envelope_encrypted TEXT
             )
         """)
 
+        # Databases created before the fused envelope column
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(kyc_profiles)")}
+        if "envelope_encrypted" not in columns:
+            cursor.execute("ALTER TABLE kyc_profiles ADD COLUMN envelope_encrypted TEXT")
+
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_wallet ON kyc_profiles(wallet_address)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_kyc_level ON kyc_profiles(kyc_level)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_status ON kyc_profiles(verification_status)")
+        # Covering index so level lookups never touch the encrypted row data
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_user_kyc_level
+            ON kyc_profiles(user_id, kyc_level, verification_status, expires_at)
+        """)
+        try:
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_risk_level
+                ON kyc_profiles(json_extract(risk_assessment, '$.risk_level'))
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite JSON1 unavailable, skipping risk level index: {e}")
 
         conn.commit()
-        conn.close()
         logger.info(f"KYC database initialized: {self.db_path}")
 
+    def _connection(self) -> sqlite3.Connection:
+        """Return the shared SQLite connection, opening it on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def _encrypt(self, data: str) -> str:
         """Encrypt sensitive data."""
         return self._fernet.encrypt(data.encode()).decode()
@@ -845,83 +991,91 @@ class KYCVerifier:
 
     async def _store_profile(self, profile: UserProfile) -> None:
         """Store user profile with encrypted PII."""
+        # Encryption and SQLite I/O block, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._store_profile_sync, profile)
+
+    def _store_profile_sync(self, profile: UserProfile) -> None:
+        """Encrypt and write a profile row (blocking)."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Encrypt sensitive data
-            pii_data = json.dumps({
-                "legal_name": profile.legal_name,
-                "date_of_birth": profile.date_of_birth,
-                "nationality": profile.nationality,
-                "occupation": profile.occupation,
-                "employer": profile.employer,
-            })
-            pii_encrypted = self._encrypt(pii_data)
-
-            email_encrypted = self._encrypt(profile.email) if profile.email else None
-
-            document_data = None
-            if profile.document_verification:
-                doc_dict = asdict(profile.document_verification)
-                doc_dict["document_type"] = profile.document_verification.document_type.value
-                document_data = self._encrypt(json.dumps(doc_dict))
-
-            address_data = None
-            if profile.address_verification:
-                address_data = self._encrypt(json.dumps(asdict(profile.address_verification)))
-
-            biometric_data = None
-            if profile.biometric_verification:
-                biometric_data = self._encrypt(json.dumps(asdict(profile.biometric_verification)))
-
-            source_of_funds_encrypted = None
-            if profile.source_of_funds:
-                source_of_funds_encrypted = self._encrypt(profile.source_of_funds)
+            document = profile.document_verification
+            address = profile.address_verification
+            biometric = profile.biometric_verification
+
+            # Encrypt all sensitive fields as one token instead of one per field
+            envelope_encrypted = self._fernet.encrypt(_pack_envelope({
+                "pii": {
+                    "legal_name": profile.legal_name,
+                    "date_of_birth": profile.date_of_birth,
+                    "nationality": profile.nationality,
+                    "occupation": profile.occupation,
+                    "employer": profile.employer,
+                },
+                "email": profile.email or None,
+                "document": document.to_dict() if document else None,
+                "address": address.to_dict() if address else None,
+                "biometric": biometric.to_dict() if biometric else None,
+                "source_of_funds": profile.source_of_funds or None,
+            })).decode()
 
             risk_assessment_json = None
             if profile.risk_assessment:
-                risk_dict = asdict(profile.risk_assessment)
-                risk_dict["risk_level"] = profile.risk_assessment.risk_level.value
-                risk_assessment_json = json.dumps(risk_dict)
+                risk_assessment_json = _dumps_json(profile.risk_assessment.to_dict())
 
-            cursor.execute("""
-                INSERT OR REPLACE INTO kyc_profiles (
-                    user_id, wallet_address, email_encrypted, email_verified,
-                    kyc_level, verification_status, verification_timestamp,
-                    jurisdiction, pii_encrypted, document_data_encrypted,
-                    address_data_encrypted, biometric_data_encrypted,
-                    risk_assessment, source_of_funds_encrypted,
-                    source_of_funds_verified, created_at, updated_at, expires_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                profile.user_id,
-                profile.wallet_address,
-                email_encrypted,
-                1 if profile.email_verified else 0,
-                profile.kyc_level.value,
-                profile.verification_status.value,
-                profile.verification_timestamp,
-                profile.jurisdiction,
-                pii_encrypted,
-                document_data,
-                address_data,
-                biometric_data,
-                risk_assessment_json,
-                source_of_funds_encrypted,
-                1 if profile.source_of_funds_verified else 0,
-                profile.created_at,
-                profile.updated_at,
-                profile.expires_at,
-            ))
-
-            conn.commit()
-            conn.close()
+            row = self._profile_to_row(profile, risk_assessment_json, envelope_encrypted)
+            with self._conn_lock:
+                conn = self._connection()
+                conn.execute(_INSERT_SQL, row)
+                conn.commit()
 
         except Exception as e:
             logger.error(f"Failed to store KYC profile for {profile.user_id}: {e}")
             raise
 
+    def _update_status_sync(
+        self,
+        user_id: str,
+        kyc_level: int,
+        verification_status: str,
+        updated_at: str,
+        risk_assessment_json: Optional[str],
+    ) -> None:
+        """Update a profile's status columns without re-encrypting it (blocking)."""
+        with self._conn_lock:
+            conn = self._connection()
+            conn.execute(
+                """
+                UPDATE kyc_profiles
+                SET kyc_level = ?, verification_status = ?, updated_at = ?, risk_assessment = ?
+                WHERE user_id = ?
+                """,
+                (kyc_level, verification_status, updated_at, risk_assessment_json, user_id),
+            )
+            conn.commit()
+
+    @staticmethod
+    def _profile_to_row(
+        profile: UserProfile,
+        risk_assessment_json: Optional[str],
+        envelope_encrypted: str,
+    ) -> Tuple[Any, ...]:
+        """Build the _INSERT_SQL parameter tuple for a profile."""
+        return (
+            profile.user_id,
+            profile.wallet_address,
+            int(profile.email_verified),
+            profile.kyc_level.value,
+            profile.verification_status.value,
+            profile.verification_timestamp,
+            profile.jurisdiction,
+            risk_assessment_json,
+            int(profile.source_of_funds_verified),
+            profile.created_at,
+            profile.updated_at,
+            profile.expires_at,
+            envelope_encrypted,
+        )
+
     async def get_profile(self, user_id: str) -> Optional[UserProfile]:
         """
         Retrieve user's KYC profile.
@@ -936,27 +1090,47 @@ class KYCVerifier:
         if user_id in self.verified_users:
             return self.verified_users[user_id]
 
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        loop = asyncio.get_running_loop()
+        profile = await loop.run_in_executor(None, self._load_profile_sync, user_id)
+
+        # Cache the profile
+        if profile:
+            self.verified_users[user_id] = profile
+        return profile
 
-            cursor.execute("SELECT * FROM kyc_profiles WHERE user_id = ?", (user_id,))
-            row = cursor.fetchone()
-            conn.close()
+    def _load_profile_sync(self, user_id: str) -> Optional[UserProfile]:
+        """Read and decrypt a profile row (blocking)."""
+        try:
+            with self._conn_lock:
+                row = self._connection().execute(
+                    "SELECT * FROM kyc_profiles WHERE user_id = ?", (user_id,)
+                ).fetchone()
 
             if not row:
                 return None
 
-            # Decrypt and reconstruct profile
-            pii_data = json.loads(self._decrypt(row["pii_encrypted"])) if row["pii_encrypted"] else {}
+            # Decrypt sensitive fields: one envelope token, or per-column for legacy rows
+            if row["envelope_encrypted"]:
+                fields = _unpack_envelope(self._fernet.decrypt(row["envelope_encrypted"].encode()))
+            else:
+                legacy_columns = (
+                    "pii_encrypted", "email_encrypted", "document_data_encrypted",
+                    "address_data_encrypted", "biometric_data_encrypted", "source_of_funds_encrypted",
+                )
+                fields = {}
+                for name, column in zip(ENVELOPE_FIELDS, legacy_columns):
+                    value = self._decrypt(row[column]) if row[column] else None
+                    fields[name] = json.loads(value) if value and name in _RECORD_FIELDS else value
+
+            # Reconstruct profile
+            pii_data = fields["pii"] or {}
 
             profile = UserProfile(
                 user_id=row["user_id"],
                 wallet_address=row["wallet_address"],
-                email=self._decrypt(row["email_encrypted"]) if row["email_encrypted"] else None,
+                email=fields["email"],
                 email_verified=bool(row["email_verified"]),
-                kyc_level=KYCLevel(row["kyc_level"]),
+                kyc_level=_KYC_LEVEL_BY_VALUE[row["kyc_level"]],
                 verification_status=VerificationStatus(row["verification_status"]),
                 verification_timestamp=row["verification_timestamp"],
                 jurisdiction=row["jurisdiction"],
@@ -971,12 +1145,12 @@ class KYCVerifier:
                 expires_at=row["expires_at"],
             )
 
-            if row["source_of_funds_encrypted"]:
-                profile.source_of_funds = self._decrypt(row["source_of_funds_encrypted"])
+            if fields["source_of_funds"]:
+                profile.source_of_funds = fields["source_of_funds"]
 
             # Reconstruct document verification
-            if row["document_data_encrypted"]:
-                doc_data = json.loads(self._decrypt(row["document_data_encrypted"]))
+            if fields["document"]:
+                doc_data = fields["document"]
                 profile.document_verification = DocumentVerification(
                     document_type=DocumentType(doc_data["document_type"]),
                     document_number=doc_data["document_number"],
@@ -989,18 +1163,16 @@ class KYCVerifier:
                 )
 
             # Reconstruct address verification
-            if row["address_data_encrypted"]:
-                addr_data = json.loads(self._decrypt(row["address_data_encrypted"]))
-                profile.address_verification = AddressVerification(**addr_data)
+            if fields["address"]:
+                profile.address_verification = AddressVerification(**fields["address"])
 
             # Reconstruct biometric verification
-            if row["biometric_data_encrypted"]:
-                bio_data = json.loads(self._decrypt(row["biometric_data_encrypted"]))
-                profile.biometric_verification = BiometricVerification(**bio_data)
+            if fields["biometric"]:
+                profile.biometric_verification = BiometricVerification(**fields["biometric"])
 
             # Reconstruct risk assessment
             if row["risk_assessment"]:
-                risk_data = json.loads(row["risk_assessment"])
+                risk_data = _loads_json(row["risk_assessment"])
                 profile.risk_assessment = RiskAssessment(
                     overall_score=risk_data["overall_score"],
                     risk_level=RiskLevel(risk_data["risk_level"]),
@@ -1009,14 +1181,20 @@ class KYCVerifier:
                     assessment_timestamp=risk_data.get("assessment_timestamp"),
                 )
 
-            # Cache the profile
-            self.verified_users[user_id] = profile
             return profile
 
         except Exception as e:
             logger.error(f"Failed to retrieve KYC profile for {user_id}: {e}")
             return None
 
+    def _get_kyc_level_fast(self, user_id: str) -> Optional[int]:
+        """Read only the stored KYC level, skipping decryption of the profile."""
+        with self._conn_lock:
+            row = self._connection().execute(
+                "SELECT kyc_level FROM kyc_profiles WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return row[0] if row else None
+
     async def get_verification_level(self, user_id: str) -> KYCLevel:
         """
         Get current KYC verification level.
@@ -1027,10 +1205,51 @@ class KYCVerifier:
         Returns:
             KYCLevel
         """
-        profile = await self.get_profile(user_id)
-        if profile:
-            return profile.kyc_level
-        return KYCLevel.UNVERIFIED
+        if user_id in self.verified_users:
+            return self.verified_users[user_id].kyc_level
+
+        try:
+            loop = asyncio.get_running_loop()
+            level = await loop.run_in_executor(None, self._get_kyc_level_fast, user_id)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to retrieve KYC level for {user_id}: {e}")
+            return KYCLevel.UNVERIFIED
+
+        if level is None:
+            return KYCLevel.UNVERIFIED
+        return _KYC_LEVEL_BY_VALUE[level]
+
+    def _get_risk_level_fast(self, user_id: str) -> Optional[str]:
+        """Read only the stored risk level via JSON1, skipping the Python JSON parse."""
+        with self._conn_lock:
+            row = self._connection().execute(
+                "SELECT json_extract(risk_assessment, '$.risk_level') FROM kyc_profiles WHERE user_id = ?",
+                (user_id,),
+            ).fetchone()
+        return row[0] if row else None
+
+    async def get_risk_level(self, user_id: str) -> Optional[RiskLevel]:
+        """
+        Get user's current risk classification.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            RiskLevel, or None if the user has no risk assessment
+        """
+        if user_id in self.verified_users:
+            assessment = self.verified_users[user_id].risk_assessment
+            return assessment.risk_level if assessment else None
+
+        try:
+            loop = asyncio.get_running_loop()
+            level = await loop.run_in_executor(None, self._get_risk_level_fast, user_id)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to retrieve risk level for {user_id}: {e}")
+            return None
+
+        return RiskLevel(level) if level else None
 
     async def is_transaction_allowed(
         self,
@@ -1047,32 +1266,43 @@ class KYCVerifier:
             lifetime_spend_usd: User's lifetime spending in USD
 
         Returns:
-            Dict with allowed status and required KYC level if not allowed
+            Dict with allowed status and required KYC level if not allowed.
+            Below the Standard threshold no level lookup is done and
+            current_level is None.
         """
-        level = await self.get_verification_level(user_id)
         total_spend = lifetime_spend_usd + transaction_amount_usd
 
+        # No KYC gating applies below the lowest threshold
+        if total_spend <= self.KYC_THRESHOLD_USD:
+            return {
+                "allowed": True,
+                "current_level": None,
+                "current_level_name": "n/a",
+            }
+
+        level = await self.get_verification_level(user_id)
+
         # Enhanced KYC required for >$50K
         if total_spend > self.ENHANCED_THRESHOLD_USD:
-            if level.value < KYCLevel.ENHANCED.value:
+            if level.value < _LVL_ENHANCED:
                 logger.warning(f"Transaction blocked for {user_id}: Enhanced KYC required for >${self.ENHANCED_THRESHOLD_USD}")
                 return {
                     "allowed": False,
                     "reason": "Enhanced KYC required",
-                    "required_level": KYCLevel.ENHANCED.value,
-                    "required_level_name": KYCLevel.ENHANCED.name,
+                    "required_level": _LVL_ENHANCED,
+                    "required_level_name": _NAME_ENHANCED,
                     "threshold": self.ENHANCED_THRESHOLD_USD,
                 }
 
         # Standard KYC required for >$10K
         if total_spend > self.KYC_THRESHOLD_USD:
-            if level.value < KYCLevel.STANDARD.value:
+            if level.value < _LVL_STANDARD:
                 logger.warning(f"Transaction blocked for {user_id}: Standard KYC required for >${self.KYC_THRESHOLD_USD}")
                 return {
                     "allowed": False,
                     "reason": "Standard KYC required",
-                    "required_level": KYCLevel.STANDARD.value,
-                    "required_level_name": KYCLevel.STANDARD.name,
+                    "required_level": _LVL_STANDARD,
+                    "required_level_name": _NAME_STANDARD,
                     "threshold": self.KYC_THRESHOLD_USD,
                 }
 
@@ -1106,10 +1336,22 @@ class KYCVerifier:
             profile.verification_status = VerificationStatus.REJECTED
             profile.updated_at = datetime.now(timezone.utc).isoformat()
 
+            risk_assessment_json = None
             if profile.risk_assessment:
                 profile.risk_assessment.flags.append(f"revoked:{reason}")
-
-            await self._store_profile(profile)
+                risk_assessment_json = _dumps_json(profile.risk_assessment.to_dict())
+
+            # Only status columns change; the encrypted envelope is left as-is
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None,
+                self._update_status_sync,
+                user_id,
+                profile.kyc_level.value,
+                profile.verification_status.value,
+                profile.updated_at,
+                risk_assessment_json,
+            )
             self.verified_users[user_id] = profile
 
             logger.warning(f"KYC verification revoked for {user_id}: {reason}")
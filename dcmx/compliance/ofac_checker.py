@@ -1,50 +1,227 @@
 """OFAC sanctions checking for DCMX compliance."""
 
 import logging
+import csv
+import functools
+import gzip
 import hashlib
+import io
 import json
+import math
 import os
-from typing import Set, Optional, List, Dict, Any
+import re
+import sys
+import string
+from collections import Counter, OrderedDict
+from typing import Set, Optional, List, Dict, Any, Tuple, Iterable, NamedTuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from pathlib import Path
 import aiohttp
 import asyncio
+import msgpack
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from rapidfuzz import process as fuzz_process
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# ASCII punctuation except '_' (a word character) and the C0/DEL control
+# characters that aren't whitespace, deleted in one C pass; non-ASCII names
+# fall back to the regex, which drops the same characters plus Unicode
+# punctuation
+_ASCII_CONTROLS = ''.join(c for c in map(chr, [*range(0x20), 0x7F]) if not c.isspace())
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation.replace('_', '') + _ASCII_CONTROLS)
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# ETH, bech32 and legacy BTC addresses, plus any other currency's address
+# tagged "Digital Currency Address - <ticker>" in SDN remarks
+_CRYPTO_ADDRESS_RE = re.compile(
+    r'(?P<eth>0x[a-fA-F0-9]{40})'
+    r'|(?P<bech32>bc1[a-zA-HJ-NP-Z0-9]{39,59})'
+    r'|(?P<btc>[13][a-km-zA-HJ-NP-Z1-9]{25,34})'
+    r'|Digital Currency Address - \S+ (?P<tagged>[A-Za-z0-9]{21,})'
+)
+
+
+def _levenshtein_py(s1: str, s2: str) -> int:
+    """Levenshtein distance via the two-row DP (s1 should be the shorter)."""
+    previous_row = list(range(len(s1) + 1))
+    for i, c2 in enumerate(s2):
+        current_row = [i + 1]
+        for j, c1 in enumerate(s1):
+            insertions = previous_row[j + 1] + 1
+            deletions = current_row[j] + 1
+            substitutions = previous_row[j] + (c1 != c2)
+            current_row.append(min(insertions, deletions, substitutions))
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def _eth_key(address: str) -> Optional[bytes]:
+    """
+    Raw 20-byte key for a lowercased 0x ETH address, or None if not one.
+    
+    Keys live in an 'S20' array, which drops trailing NUL bytes, so the
+    key is stripped the same way to compare equal to what the array returns.
+    """
+    if len(address) != 42 or not address.startswith("0x"):
+        return None
+    try:
+        raw = bytes.fromhex(address[2:])
+    except ValueError:
+        return None
+    return raw.rstrip(b"\0") if len(raw) == 20 else None
+
+
+def _normalize_name(name: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    name = name.lower()
+    if name.isascii():
+        name = name.translate(_PUNCT_TABLE)
+    else:
+        name = _NON_WORD_RE.sub('', name)
+    return ' '.join(name.split())
+
+
+# Memoized for check_name queries, which repeat under retries and bots;
+# index builds call _normalize_name directly so they don't flush it
+_normalize_query = functools.lru_cache(maxsize=10_000)(_normalize_name)
+
+
+def _qgrams(name: str, q: int) -> Set[str]:
+    """Distinct q-grams of a string."""
+    return {name[i:i + q] for i in range(len(name) - q + 1)}
+
+
+def _encode_name(name: str) -> np.ndarray:
+    """Encode a string as a uint32 array of code points for the JIT kernels."""
+    return np.frombuffer(name.encode("utf-32-le"), dtype=np.uint32)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _levenshtein_codes(a, b):
+        """Levenshtein distance over code point arrays (a should be the shorter)."""
+        n = a.shape[0]
+        row = np.empty(n + 1, dtype=np.int64)
+        for j in range(n + 1):
+            row[j] = j
+        for i in range(b.shape[0]):
+            diagonal = row[0]
+            row[0] = i + 1
+            c2 = b[i]
+            for j in range(n):
+                above = row[j + 1]
+                best = diagonal + (1 if a[j] != c2 else 0)
+                if above + 1 < best:
+                    best = above + 1
+                if row[j] + 1 < best:
+                    best = row[j] + 1
+                row[j + 1] = best
+                diagonal = above
+        return row[n]
+
+    @njit(cache=True, nogil=True)
+    def _bloom_probe(blocks, block, h2, rehash):
+        """Test every sectorized probe bit of h2 against one bloom block."""
+        for w in range(rehash.shape[0]):
+            bit = (h2 * rehash[w]) >> np.uint64(58)
+            if (blocks[block, w] >> bit) & np.uint64(1) == np.uint64(0):
+                return False
+        return True
+
 
 class BloomFilter:
     """
     Simple bloom filter for O(1) membership checking.
     
     Used for fast preliminary OFAC lookups before exact matching.
+    
+    Blocked layout: each item maps to one 512-bit block (a 64-byte cache
+    line of 8 uint64 words) and all of its probe bits are set inside that
+    block, so a lookup touches a single cache line. Probes are sectorized,
+    one bit per word, so the whole probe mask is built and tested with
+    vectorized numpy ops; up to 8 probes cost the same.
     """
     
+    BLOCK_BITS = 512
+    WORDS_PER_BLOCK = 8
+    # Odd multipliers that remix h2 into one bit position per word
+    REHASH = np.array([
+        0x9E3779B97F4A7C15, 0xBF58476D1CE4E5B9, 0x94D049BB133111EB, 0xD6E8FEB86659FD93,
+        0xA0761D6478BD642F, 0xE7037ED1A0B428DB, 0x8EBC6AF09C88C6E3, 0x589965CC75374CC3,
+    ], dtype=np.uint64)
+    
     def __init__(self, size: int = 100000, hash_count: int = 7):
         """
         Initialize bloom filter.
         
         Args:
-            size: Number of bits in the filter
-            hash_count: Number of hash functions to use
+            size: Number of bits in the filter (rounded up to whole blocks)
+            hash_count: Number of hash functions to use (at most 8, one per word)
         """
         self.size = size
-        self.hash_count = hash_count
-        self.bit_array = [False] * size
+        self.hash_count = max(1, min(hash_count, self.WORDS_PER_BLOCK))
+        self._rehash = self.REHASH[:self.hash_count]
+        self._rehash_ints = [int(c) for c in self._rehash]
+        self.num_blocks = max(1, -(-size // self.BLOCK_BITS))
+        self.blocks = np.zeros((self.num_blocks, self.WORDS_PER_BLOCK), dtype=np.uint64)
+    
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.001) -> "BloomFilter":
+        """
+        Create a bloom filter sized for an expected number of items.
+        
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate
+        
+        Returns:
+            BloomFilter with optimal bit and hash counts
+        """
+        capacity = max(capacity, 1)
+        size = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        hash_count = max(1, int(round(size / capacity * math.log(2))))
+        return cls(size=size, hash_count=hash_count)
     
-    def _hashes(self, item: str) -> List[int]:
-        """Generate multiple hash values for an item."""
-        hashes = []
-        for i in range(self.hash_count):
-            h = hashlib.sha256(f"{item}{i}".encode()).hexdigest()
-            hashes.append(int(h, 16) % self.size)
-        return hashes
+    def _locate(self, item: str) -> Tuple[int, int]:
+        """
+        Hash an item to its block index and probe seed.
+        
+        One 128-bit BLAKE2b digest is split into h1/h2: h1 picks the block
+        (multiply-shift range reduction, no modulo) and h2 seeds the probes.
+        Probe w tests the bit given by the top 6 bits of h2 * REHASH[w]
+        in word w of the block.
+        """
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little')
+        return ((h1 & 0xFFFFFFFF) * self.num_blocks) >> 32, h2
+    
+    def _masks(self, seeds: np.ndarray) -> np.ndarray:
+        """Build the (n, hash_count) probe masks for an array of h2 seeds."""
+        shifts = (seeds[:, None] * self._rehash[None, :]) >> np.uint64(58)
+        return np.left_shift(np.uint64(1), shifts)
     
     def add(self, item: str) -> None:
         """Add an item to the bloom filter."""
-        for h in self._hashes(item.lower()):
-            self.bit_array[h] = True
+        block, h2 = self._locate(item.lower())
+        self.blocks[block, :self.hash_count] |= self._masks(np.array([h2], dtype=np.uint64))[0]
     
     def might_contain(self, item: str) -> bool:
         """
@@ -54,14 +231,233 @@ class BloomFilter:
             True if item might be present (may have false positives)
             False if item is definitely not present
         """
-        return all(self.bit_array[h] for h in self._hashes(item.lower()))
+        block, h2 = self._locate(item.lower())
+        if NUMBA_AVAILABLE:
+            return _bloom_probe(self.blocks, block, np.uint64(h2), self._rehash)
+        words = self.blocks[block].tolist()
+        for w, multiplier in enumerate(self._rehash_ints):
+            if not words[w] >> (((h2 * multiplier) & 0xFFFFFFFFFFFFFFFF) >> 58) & 1:
+                return False
+        return True
+    
+    def might_contain_many(self, items: List[str]) -> np.ndarray:
+        """
+        Check many items at once.
+        
+        Probe masks for every item are built and tested against their
+        blocks in a handful of vectorized numpy ops.
+        
+        Returns:
+            Boolean array, False where the item is definitely not present
+        """
+        if not items:
+            return np.zeros(0, dtype=bool)
+        located = [self._locate(item.lower()) for item in items]
+        blocks = np.fromiter((block for block, _ in located), dtype=np.int64, count=len(located))
+        seeds = np.fromiter((h2 for _, h2 in located), dtype=np.uint64, count=len(located))
+        masks = self._masks(seeds)
+        return ((self.blocks[blocks, :self.hash_count] & masks) == masks).all(axis=1)
     
     def clear(self) -> None:
         """Clear all entries from the filter."""
-        self.bit_array = [False] * self.size
+        self.blocks.fill(0)
+
+
+class LRUCache(OrderedDict):
+    """Dict bounded to maxsize entries that evicts the least recently used."""
+    
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def get(self, key, default=None):
+        """Return the value for key and mark it most recently used."""
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return super().__getitem__(key)
+    
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def _phf_hash(key: bytes) -> Tuple[int, int, int]:
+    """Bucket, base slot and slot stride hashes of a key for PerfectHashIndex."""
+    digest = hashlib.blake2b(key, digest_size=24).digest()
+    return (
+        int.from_bytes(digest[:8], 'little'),
+        int.from_bytes(digest[8:16], 'little'),
+        int.from_bytes(digest[16:], 'little'),
+    )
+
+
+class PerfectHashIndex:
+    """
+    Static minimal perfect hash over a fixed array of byte keys.
+    
+    Built with hash-and-displace: keys are grouped into buckets, and each
+    bucket gets a displacement (or, for single-key buckets, a direct slot)
+    so that every key lands in its own slot. A lookup is one bucket read,
+    one hash and one comparison. Slots store positions into the source
+    array, so keys are not duplicated (the source may be memory-mapped).
+    
+    Hashes are BLAKE2b digests of the key bytes, so the table is the same
+    in every process and can be saved next to the keys (see from_table).
+    """
+    
+    KEYS_PER_BUCKET = 1
+    # Displacements tried per bucket. Keys whose hashes fully collide can
+    # never be separated, so the search has to give up at some point
+    MAX_DISPLACEMENT = 1 << 16
+    
+    def __init__(self, keys: np.ndarray):
+        """
+        Build the index.
+        
+        Args:
+            keys: Array of byte keys (e.g. a sorted 'S' array); duplicates
+                are indexed once
+        
+        Raises:
+            ValueError: If no displacement separates a bucket's keys
+        """
+        first_index: Dict[bytes, int] = {}
+        for i, key in enumerate(keys.tolist()):
+            first_index.setdefault(key, i)
+        
+        size = len(first_index)
+        # Entries are slot positions, -slot - 1 or displacements below MAX_DISPLACEMENT
+        dtype = np.int32 if max(len(keys), self.MAX_DISPLACEMENT) < 2 ** 31 else np.int64
+        self._bind(keys, np.zeros(self.table_length(size), dtype=dtype), size)
+        
+        buckets: Dict[int, List[Tuple[int, int, int]]] = {}
+        for key, i in first_index.items():
+            bucket_hash, base, stride = _phf_hash(key)
+            buckets.setdefault(bucket_hash % self.bucket_count, []).append((i, base, stride))
+        
+        taken = [False] * self.size
+        singles = []
+        # Place the largest buckets first while the table is still sparse
+        for bucket, members in sorted(buckets.items(), key=lambda item: -len(item[1])):
+            if len(members) == 1:
+                singles.append((bucket, members[0][0]))
+                continue
+            for d in range(self.MAX_DISPLACEMENT):
+                positions = [self._position(base, stride, d) for _, base, stride in members]
+                if len(set(positions)) == len(positions) and not any(taken[p] for p in positions):
+                    break
+            else:
+                raise ValueError(f"No displacement places a bucket of {len(members)} keys")
+            self.displacements[bucket] = d
+            for (i, _, _), position in zip(members, positions):
+                taken[position] = True
+                self.slots[position] = i
+        
+        # Single-key buckets point straight at a free slot (encoded as -slot - 1)
+        free = (position for position, used in enumerate(taken) if not used)
+        for bucket, i in singles:
+            position = next(free)
+            self.displacements[bucket] = -position - 1
+            self.slots[position] = i
+    
+    @classmethod
+    def from_table(cls, keys: np.ndarray, table: np.ndarray) -> "PerfectHashIndex":
+        """
+        Wrap a table saved from an index built over the same keys.
+        
+        Args:
+            keys: Array of unique byte keys the table was built over
+            table: The built index's table array
+        
+        Raises:
+            ValueError: If the table does not fit the number of keys
+        """
+        if len(table) != cls.table_length(len(keys)):
+            raise ValueError(f"Table of {len(table)} entries does not fit {len(keys)} keys")
+        index = cls.__new__(cls)
+        index._bind(keys, table, len(keys))
+        return index
+    
+    @classmethod
+    def table_length(cls, size: int) -> int:
+        """Length of the table (displacements, then slots) for size unique keys."""
+        return max(1, size // cls.KEYS_PER_BUCKET) + size
+    
+    def _bind(self, keys: np.ndarray, table: np.ndarray, size: int) -> None:
+        """Point the displacement and slot views at a table for size keys."""
+        self.keys = keys
+        self.table = table
+        self.size = size
+        self.bucket_count = len(table) - size
+        self.displacements = table[:self.bucket_count]
+        self.slots = table[self.bucket_count:]
+    
+    def _position(self, base: int, stride: int, d: int) -> int:
+        """Slot for displacement d: each offset from base, then the next stride."""
+        return (base + d % self.size + (d // self.size) * stride) % self.size
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __contains__(self, key: bytes) -> bool:
+        if not self.size:
+            return False
+        bucket_hash, base, stride = _phf_hash(key)
+        d = int(self.displacements[bucket_hash % self.bucket_count])
+        position = -d - 1 if d < 0 else self._position(base, stride, d)
+        return self.keys[self.slots[position]] == key
+
+
+class SortedKeyIndex:
+    """Binary-search membership over a sorted array of byte keys."""
+    
+    def __init__(self, keys: np.ndarray):
+        self.keys = keys
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def __contains__(self, key: bytes) -> bool:
+        position = int(np.searchsorted(self.keys, key))
+        return position < len(self.keys) and self.keys[position] == key
+
+
+def _key_table(keys: np.ndarray, table: Optional[np.ndarray] = None):
+    """
+    Perfect-hash table over sorted keys, or binary search if it can't be built.
+    
+    A table saved from an earlier build is reused as is; an empty one
+    records that the build fell back to binary search.
+    """
+    if table is not None:
+        return PerfectHashIndex.from_table(keys, table) if len(table) else SortedKeyIndex(keys)
+    try:
+        return PerfectHashIndex(keys)
+    except ValueError as e:
+        logger.warning(f"Perfect hash build failed ({e}); using sorted lookup")
+        return SortedKeyIndex(keys)
 
 
-@dataclass
+def _table_array(table) -> np.ndarray:
+    """Saveable form of a key table; empty for the binary-search fallback."""
+    if isinstance(table, PerfectHashIndex):
+        return table.table
+    return np.empty(0, dtype=np.int64)
+
+
+class _AddressIndexes(NamedTuple):
+    """Address lookup arrays persisted next to the cache, in file order."""
+    address_index: np.ndarray  # sorted lowercased non-ETH addresses
+    eth_index: np.ndarray  # sorted raw 20-byte ETH addresses
+    address_table: np.ndarray  # perfect-hash table over address_index
+    eth_table: np.ndarray  # perfect-hash table over eth_index
+    bloom_blocks: np.ndarray  # bloom filter bits over both
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SDNEntry:
     """Represents an entry from the OFAC SDN list."""
     uid: str
@@ -74,6 +470,12 @@ class SDNEntry:
     crypto_addresses: List[str] = field(default_factory=list)
 
 
+# SDNEntry fields in constructor order; the cache stores one column per field
+_SDN_FIELDS = (
+    "uid", "name", "entry_type", "programs", "aliases", "addresses", "ids", "crypto_addresses",
+)
+
+
 class OFACChecker:
     """
     Checks wallet addresses and users against OFAC sanctions list.
@@ -87,22 +489,47 @@ class OFACChecker:
     CONS_CSV_URL = "https://www.treasury.gov/ofac/downloads/consolidated/cons_prim.csv"
     
     CACHE_DIR = Path.home() / ".dcmx" / "compliance"
-    CACHE_FILE = CACHE_DIR / "sdn_cache.json"
+    CACHE_FILE = CACHE_DIR / "sdn_cache.msgpack.gz"
+    LEGACY_CACHE_FILE = CACHE_DIR / "sdn_cache.json"
+    ADDRESS_INDEX_FILE = CACHE_DIR / "sdn_addresses.npy"
+    ETH_INDEX_FILE = CACHE_DIR / "sdn_eth_addresses.npy"
+    ADDRESS_TABLE_FILE = CACHE_DIR / "sdn_addresses.phf.npy"
+    ETH_TABLE_FILE = CACHE_DIR / "sdn_eth_addresses.phf.npy"
+    BLOOM_FILE = CACHE_DIR / "sdn_addresses.bloom.npy"
     CACHE_MAX_AGE_DAYS = 7
+    
+    BLOOM_MIN_CAPACITY = 1024
+    BLOOM_ERROR_RATE = 0.001
+    QGRAM_SIZE = 2
+    ENTITY_CACHE_SIZE = 100_000
 
     def __init__(self, cache_dir: Optional[Path] = None):
         """Initialize OFAC checker."""
         self.sdn_entries: Dict[str, SDNEntry] = {}
         self.crypto_addresses: Set[str] = set()
         self.names_index: Dict[str, List[str]] = {}  # normalized name -> UIDs
-        self.entity_cache: Dict[str, bool] = {}
+        self.name_codes: Dict[str, np.ndarray] = {}  # normalized name -> code points (JIT path)
+        self.qgram_index: Dict[str, List[str]] = {}  # q-gram -> normalized names
+        self.qgram_counts: Dict[str, int] = {}  # normalized name -> distinct q-gram count
+        self.entity_cache: Dict[str, bool] = LRUCache(self.ENTITY_CACHE_SIZE)
+        self.address_index: np.ndarray = np.empty(0, dtype="S1")  # sorted lowercased non-ETH addresses
+        self.address_table = PerfectHashIndex(self.address_index)
+        self.eth_index: np.ndarray = np.empty(0, dtype="S20")  # sorted raw 20-byte ETH addresses
+        self.eth_table = PerfectHashIndex(self.eth_index)
         self.last_update: Optional[datetime] = None
+        self.session: Optional[aiohttp.ClientSession] = None
         
         self.bloom_filter = BloomFilter(size=100000, hash_count=7)
         
         if cache_dir:
             self.CACHE_DIR = Path(cache_dir)
-            self.CACHE_FILE = self.CACHE_DIR / "sdn_cache.json"
+            self.CACHE_FILE = self.CACHE_DIR / "sdn_cache.msgpack.gz"
+            self.LEGACY_CACHE_FILE = self.CACHE_DIR / "sdn_cache.json"
+            self.ADDRESS_INDEX_FILE = self.CACHE_DIR / "sdn_addresses.npy"
+            self.ETH_INDEX_FILE = self.CACHE_DIR / "sdn_eth_addresses.npy"
+            self.ADDRESS_TABLE_FILE = self.CACHE_DIR / "sdn_addresses.phf.npy"
+            self.ETH_TABLE_FILE = self.CACHE_DIR / "sdn_eth_addresses.phf.npy"
+            self.BLOOM_FILE = self.CACHE_DIR / "sdn_addresses.bloom.npy"
 
         logger.info("OFACChecker initialized")
 
@@ -126,7 +553,7 @@ class OFACChecker:
             
             self.last_update = datetime.now()
             logger.info(f"Loaded OFAC SDN list: {len(self.sdn_entries)} entries, "
-                       f"{len(self.crypto_addresses)} crypto addresses")
+                       f"{len(self.address_index) + len(self.eth_index)} crypto addresses")
         except Exception as e:
             logger.error(f"Failed to load OFAC list: {e}")
             if await self._load_from_cache(ignore_expiry=True):
@@ -134,13 +561,28 @@ class OFACChecker:
             else:
                 raise RuntimeError(f"Cannot load OFAC list and no cache available: {e}")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the HTTP session reused across list refreshes."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=60),
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=300),
+            )
+        return self.session
+
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
     async def _download_and_parse_sdn(self) -> None:
         """Download and parse SDN list from Treasury."""
-        timeout = aiohttp.ClientTimeout(total=60)
-        
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            sdn_data = await self._fetch_csv(session, self.SDN_CSV_URL)
-            add_data = await self._fetch_csv(session, self.SDN_ADD_URL)
+        session = await self._get_session()
+        sdn_data, add_data = await asyncio.gather(
+            self._fetch_csv(session, self.SDN_CSV_URL),
+            self._fetch_csv(session, self.SDN_ADD_URL),
+        )
         
         self._parse_sdn_csv(sdn_data, add_data)
         self._build_indexes()
@@ -162,7 +604,7 @@ class OFACChecker:
         """
         Parse SDN CSV files.
         
-        SDN.CSV format (pipe-delimited):
+        SDN.CSV format (comma-delimited, double-quoted fields):
         ent_num, SDN_Name, SDN_Type, Program, Title, Call_Sign, Vess_type, Tonnage, GRT, 
         Vess_flag, Vess_owner, Remarks
         
@@ -174,35 +616,15 @@ class OFACChecker:
         
         entries_by_id: Dict[str, SDNEntry] = {}
         
-        for line in sdn_csv.strip().split('\n'):
-            if not line.strip():
-                continue
-            
-            parts = line.split('"')
-            if len(parts) >= 3:
-                fields = []
-                in_quotes = False
-                current = ""
-                for char in line:
-                    if char == '"':
-                        in_quotes = not in_quotes
-                    elif char == ',' and not in_quotes:
-                        fields.append(current.strip())
-                        current = ""
-                    else:
-                        current += char
-                fields.append(current.strip())
-            else:
-                fields = [f.strip().strip('"') for f in line.split(',')]
-            
+        for fields in csv.reader(io.StringIO(sdn_csv.strip())):
             if len(fields) < 4:
                 continue
             
             ent_num = fields[0].strip()
-            name = fields[1].strip() if len(fields) > 1 else ""
-            sdn_type = fields[2].strip() if len(fields) > 2 else ""
-            program = fields[3].strip() if len(fields) > 3 else ""
-            remarks = fields[-1] if len(fields) > 4 else ""
+            name = fields[1].strip()
+            sdn_type = fields[2].strip()
+            program = fields[3].strip()
+            remarks = fields[-1].strip() if len(fields) > 4 else ""
             
             if not ent_num or not name:
                 continue
@@ -220,17 +642,13 @@ class OFACChecker:
             entries_by_id[ent_num] = entry
             self.crypto_addresses.update(addr.lower() for addr in crypto_addrs)
         
-        for line in add_csv.strip().split('\n'):
-            if not line.strip():
-                continue
-            
-            fields = [f.strip().strip('"') for f in line.split(',')]
+        for fields in csv.reader(io.StringIO(add_csv.strip())):
             if len(fields) < 2:
                 continue
             
             ent_num = fields[0].strip()
             if ent_num in entries_by_id:
-                address = ', '.join(f for f in fields[2:5] if f.strip())
+                address = ', '.join(f.strip() for f in fields[2:5] if f.strip())
                 if address:
                     entries_by_id[ent_num].addresses.append(address)
         
@@ -238,42 +656,40 @@ class OFACChecker:
 
     def _extract_crypto_addresses(self, remarks: str) -> List[str]:
         """Extract cryptocurrency addresses from SDN remarks field."""
-        addresses = []
-        
-        import re
-        eth_pattern = r'0x[a-fA-F0-9]{40}'
-        btc_pattern = r'[13][a-km-zA-HJ-NP-Z1-9]{25,34}'
-        btc_bech32_pattern = r'bc1[a-zA-HJ-NP-Z0-9]{39,59}'
-        
-        addresses.extend(re.findall(eth_pattern, remarks))
-        addresses.extend(re.findall(btc_pattern, remarks))
-        addresses.extend(re.findall(btc_bech32_pattern, remarks))
-        
-        if "Digital Currency Address" in remarks or "alt. Digital Currency Address" in remarks:
-            parts = remarks.split(';')
-            for part in parts:
-                if "Digital Currency Address" in part:
-                    addr_parts = part.split()
-                    for ap in addr_parts:
-                        ap = ap.strip('();,')
-                        if len(ap) > 20 and ap.isalnum():
-                            addresses.append(ap)
-        
-        return list(set(addresses))
-
-    def _build_indexes(self) -> None:
-        """Build search indexes for fast lookup."""
-        self.bloom_filter.clear()
-        self.names_index.clear()
+        return list({m.group(m.lastgroup) for m in _CRYPTO_ADDRESS_RE.finditer(remarks)})
 
-        # Add all addresses from crypto_addresses set to bloom filter
-        for addr in self.crypto_addresses:
-            self.bloom_filter.add(addr.lower())
+    def _build_indexes(self, address_indexes: Optional[_AddressIndexes] = None) -> None:
+        """
+        Build search indexes for fast lookup.
+        
+        Args:
+            address_indexes: Address keys, lookup tables and bloom filter
+                bits saved by an earlier build (e.g. memory-mapped from
+                cache); built from crypto_addresses if not given, which
+                is then released
+        """
+        if address_indexes is None:
+            self.address_index, self.eth_index = self._build_address_index(self.crypto_addresses)
+            self.address_table = _key_table(self.address_index)
+            self.eth_table = _key_table(self.eth_index)
+            self.bloom_filter = self._new_bloom_filter()
+            for addr in self.crypto_addresses:
+                self.bloom_filter.add(addr)
+        else:
+            self.address_index = address_indexes.address_index
+            self.eth_index = address_indexes.eth_index
+            self.address_table = _key_table(self.address_index, address_indexes.address_table)
+            self.eth_table = _key_table(self.eth_index, address_indexes.eth_table)
+            self.bloom_filter = self._new_bloom_filter()
+            self.bloom_filter.blocks = np.array(address_indexes.bloom_blocks)
+        # The arrays hold the list now; don't keep a second copy as str objects
+        self.crypto_addresses = set()
+        
+        self.names_index.clear()
+        # Cached verdicts were made against the previous list
+        self.entity_cache.clear()
 
         for uid, entry in self.sdn_entries.items():
-            for addr in entry.crypto_addresses:
-                self.bloom_filter.add(addr.lower())
-
             normalized = self._normalize_name(entry.name)
             if normalized not in self.names_index:
                 self.names_index[normalized] = []
@@ -285,22 +701,169 @@ class OFACChecker:
                     self.names_index[normalized_alias] = []
                 self.names_index[normalized_alias].append(uid)
 
+        self.qgram_index = {}
+        self.qgram_counts = {}
+        for name in self.names_index:
+            grams = _qgrams(name, self.QGRAM_SIZE)
+            self.qgram_counts[name] = len(grams)
+            for gram in grams:
+                self.qgram_index.setdefault(gram, []).append(name)
+
+        # Encode index names once so fuzzy matching doesn't re-encode per query
+        self.name_codes = (
+            {name: _encode_name(name) for name in self.names_index}
+            if NUMBA_AVAILABLE and not RAPIDFUZZ_AVAILABLE else {}
+        )
+
+    def _new_bloom_filter(self) -> BloomFilter:
+        """Empty bloom filter sized to the address indexes, so negatives stay cheap to reject."""
+        capacity = max((len(self.address_index) + len(self.eth_index)) * 2, self.BLOOM_MIN_CAPACITY)
+        return BloomFilter.for_capacity(capacity, self.BLOOM_ERROR_RATE)
+
+    def _fuzzy_candidates(self, normalized: str, fuzzy_threshold: float) -> Iterable[str]:
+        """
+        Select index names that could reach the fuzzy threshold.
+        
+        Uses the q-gram lemma: a string within edit distance d of another
+        shares at least max(G1, G2) - q*d of its distinct q-grams. Matches
+        can be at most twice the query length (_fuzzy_similarity rejects
+        larger length gaps), so if the query has too few q-grams to
+        guarantee one shared gram at that length, fall back to every name.
+        """
+        q = self.QGRAM_SIZE
+        grams = _qgrams(normalized, q)
+        slack = 1.0 - fuzzy_threshold
+        if len(grams) - q * int(slack * 2 * len(normalized) + 1e-9) < 1:
+            return self.names_index.keys()
+        
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.qgram_index.get(gram, ()))
+        
+        candidates = []
+        for name, count in shared.items():
+            max_edits = int(slack * max(len(name), len(normalized)) + 1e-9)
+            if count >= max(len(grams), self.qgram_counts[name]) - q * max_edits:
+                candidates.append(name)
+        return candidates
+
+    def _name_codes(self, name: str) -> np.ndarray:
+        """Code point array for a name, pre-encoded for indexed names."""
+        codes = self.name_codes.get(name)
+        return codes if codes is not None else _encode_name(name)
+
+    @staticmethod
+    def _build_address_index(addresses: Set[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build sorted fixed-width byte arrays of lowercased addresses.
+        
+        ETH addresses are stored as their raw 20 bytes in a separate
+        'S20' array (half the size of the hex string, and not padded to
+        the longest address on the list); everything else is kept as
+        lowercased text.
+        
+        Returns:
+            (address_index, eth_index)
+        """
+        eth_keys = []
+        other_keys = []
+        for addr in addresses:
+            normalized = addr.lower()
+            key = _eth_key(normalized)
+            if key is not None:
+                eth_keys.append(key)
+            else:
+                other_keys.append(normalized.encode())
+        
+        address_index = (
+            np.array(sorted(other_keys), dtype=bytes) if other_keys
+            else np.empty(0, dtype="S1")
+        )
+        eth_index = np.array(sorted(eth_keys), dtype="S20")
+        return address_index, eth_index
+
+    def _contains_address(self, normalized: str) -> bool:
+        """Exact membership test against the perfect-hash address tables."""
+        key = _eth_key(normalized)
+        if key is not None:
+            return key in self.eth_table
+        return normalized.encode() in self.address_table
+
+    def _index_files(self) -> Tuple[Path, ...]:
+        """Sidecar files holding the _AddressIndexes arrays, in field order."""
+        return (
+            self.ADDRESS_INDEX_FILE, self.ETH_INDEX_FILE,
+            self.ADDRESS_TABLE_FILE, self.ETH_TABLE_FILE, self.BLOOM_FILE,
+        )
+
+    def _index_addresses(self) -> List[str]:
+        """Addresses held by the address indexes, as lowercased text."""
+        return (
+            [key.decode() for key in self.address_index.tolist()]
+            + ["0x" + key.ljust(20, b"\0").hex() for key in self.eth_index.tolist()]
+        )
+
+    def _index_digest(self, address_indexes: _AddressIndexes) -> str:
+        """
+        Digest of the address index arrays, recorded in the cache metadata.
+        
+        Covers the table and bloom filter layout parameters too, so arrays
+        saved by a build with different settings are not reused.
+        """
+        digest = hashlib.sha256(
+            f"{PerfectHashIndex.KEYS_PER_BUCKET}:{self.BLOOM_MIN_CAPACITY}:{self.BLOOM_ERROR_RATE}".encode()
+        )
+        for array in address_indexes:
+            digest.update(f"{array.dtype.str}{array.shape}".encode())
+            digest.update(np.ascontiguousarray(array).data)
+        return digest.hexdigest()
+
+    def _load_address_index(self, digest: Optional[str]) -> Optional[_AddressIndexes]:
+        """
+        Memory-map the persisted address indexes if they match the cache.
+        
+        The sidecars are written before the cache file that records their
+        digest, so sidecars that are half-written or were built from another
+        list fail the check; the index is then rebuilt from the cached
+        address list.
+        """
+        if not digest:
+            return None
+        try:
+            address_indexes = _AddressIndexes(
+                *(np.load(path, mmap_mode='r') for path in self._index_files())
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Address index corrupted: {e}")
+            return None
+        
+        if self._index_digest(address_indexes) != digest:
+            logger.info("Address index does not match the cached list, rebuilding")
+            return None
+        return address_indexes
+
     def _normalize_name(self, name: str) -> str:
         """Normalize name for matching."""
-        import re
-        name = name.lower().strip()
-        name = re.sub(r'[^\w\s]', '', name)
-        name = ' '.join(name.split())
-        return name
+        return _normalize_name(name)
+
+    def _read_cache_file(self) -> Optional[Dict[str, Any]]:
+        """Read the gzipped msgpack cache, falling back to a legacy JSON cache."""
+        if self.CACHE_FILE.exists():
+            with gzip.open(self.CACHE_FILE, 'rb') as f:
+                return msgpack.unpackb(f.read(), raw=False)
+        if self.LEGACY_CACHE_FILE.exists():
+            with open(self.LEGACY_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        return None
 
     async def _load_from_cache(self, ignore_expiry: bool = False) -> bool:
         """Load SDN list from cache file."""
-        if not self.CACHE_FILE.exists():
-            return False
-        
         try:
-            with open(self.CACHE_FILE, 'r') as f:
-                cache_data = json.load(f)
+            # Decompressing and unpacking a multi-MB file blocks; keep it off the loop
+            loop = asyncio.get_running_loop()
+            cache_data = await loop.run_in_executor(None, self._read_cache_file)
+            if cache_data is None:
+                return False
             
             cached_time = datetime.fromisoformat(cache_data.get('timestamp', '1970-01-01'))
             age = datetime.now() - cached_time
@@ -309,45 +872,77 @@ class OFACChecker:
                 logger.info("Cache is stale, will refresh")
                 return False
             
-            self.sdn_entries = {
-                uid: SDNEntry(**entry_data)
-                for uid, entry_data in cache_data.get('entries', {}).items()
-            }
-            self.crypto_addresses = set(cache_data.get('crypto_addresses', []))
+            if 'columns' in cache_data:
+                columns = cache_data['columns']
+                rows = zip(*(columns[name] for name in _SDN_FIELDS))
+                self.sdn_entries = {row[0]: SDNEntry(*row) for row in rows}
+            else:
+                # Row-per-entry layout written by older releases
+                self.sdn_entries = {
+                    uid: SDNEntry(**entry_data)
+                    for uid, entry_data in cache_data.get('entries', {}).items()
+                }
             self.last_update = cached_time
             
-            self._build_indexes()
+            address_indexes = self._load_address_index(cache_data.get('address_index_digest'))
+            if address_indexes is None:
+                self.crypto_addresses = set(cache_data.get('crypto_addresses', []))
+            self._build_indexes(address_indexes=address_indexes)
             return True
             
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (OSError, ValueError, KeyError, TypeError, msgpack.UnpackException) as e:
             logger.warning(f"Cache file corrupted: {e}")
             return False
 
+    def _write_cache_file(
+        self,
+        cache_data: Dict[str, Any],
+        address_indexes: _AddressIndexes
+    ) -> None:
+        """Write the address index sidecars and then the gzipped msgpack cache."""
+        self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Replace files rather than overwrite them: live checkers may have
+        # the old sidecars memory-mapped
+        for path, array in zip(self._index_files(), address_indexes):
+            self._replace_file(path, lambda f, array=array: np.save(f, array))
+        self._replace_file(
+            self.CACHE_FILE,
+            lambda f: f.write(gzip.compress(msgpack.packb(cache_data, use_bin_type=True), compresslevel=1)),
+        )
+
+    @staticmethod
+    def _replace_file(path: Path, write) -> None:
+        """Write a file through a temporary sibling and rename it into place."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+
     async def _save_to_cache(self) -> None:
-        """Save SDN list to cache file."""
+        """Save SDN list and its built address indexes to cache files."""
         try:
-            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            
+            entries = list(self.sdn_entries.values())
+            address_indexes = _AddressIndexes(
+                self.address_index,
+                self.eth_index,
+                _table_array(self.address_table),
+                _table_array(self.eth_table),
+                self.bloom_filter.blocks,
+            )
             cache_data = {
                 'timestamp': (self.last_update or datetime.now()).isoformat(),
-                'entries': {
-                    uid: {
-                        'uid': entry.uid,
-                        'name': entry.name,
-                        'entry_type': entry.entry_type,
-                        'programs': entry.programs,
-                        'aliases': entry.aliases,
-                        'addresses': entry.addresses,
-                        'ids': entry.ids,
-                        'crypto_addresses': entry.crypto_addresses,
-                    }
-                    for uid, entry in self.sdn_entries.items()
+                # Struct-of-arrays: one list per field instead of a map per entry
+                'columns': {
+                    name: [getattr(entry, name) for entry in entries]
+                    for name in _SDN_FIELDS
                 },
-                'crypto_addresses': list(self.crypto_addresses),
+                # Fallback for rebuilding the indexes if the sidecars are lost
+                'crypto_addresses': self._index_addresses(),
+                'address_index_digest': self._index_digest(address_indexes),
             }
             
-            with open(self.CACHE_FILE, 'w') as f:
-                json.dump(cache_data, f)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_cache_file, cache_data, address_indexes)
             
             logger.info(f"Saved OFAC cache to {self.CACHE_FILE}")
             
@@ -372,14 +967,15 @@ class OFACChecker:
         try:
             normalized = wallet_address.lower().strip()
             
-            if normalized in self.entity_cache:
-                return self.entity_cache[normalized]
+            cached = self.entity_cache.get(normalized)
+            if cached is not None:
+                return cached
             
             if not self.bloom_filter.might_contain(normalized):
                 self.entity_cache[normalized] = False
                 return False
             
-            is_sanctioned = normalized in self.crypto_addresses
+            is_sanctioned = self._contains_address(normalized)
             
             if is_sanctioned:
                 logger.warning(f"OFAC block: wallet {wallet_address[:10]}... is sanctioned")
@@ -391,6 +987,84 @@ class OFACChecker:
             logger.error(f"OFAC check failed for {wallet_address}: {e}")
             return True
 
+    async def check_addresses(self, wallet_addresses: List[str]) -> List[bool]:
+        """
+        Check many wallet addresses, with the same caching as check_address.
+
+        Uncached addresses are probed against the bloom filter in one
+        vectorized pass; the few that survive it are matched in one vectorized
+        lookup against the sorted address indexes. Any failure blocks the
+        whole batch.
+
+        Args:
+            wallet_addresses: Blockchain wallet addresses to check
+
+        Returns:
+            List of bools, True where the address is blocked (sanctioned)
+        """
+        results: List[bool] = [False] * len(wallet_addresses)
+        try:
+            pending: Dict[str, List[int]] = {}
+            for i, wallet_address in enumerate(wallet_addresses):
+                if not wallet_address:
+                    continue
+                normalized = wallet_address.lower().strip()
+                cached = self.entity_cache.get(normalized)
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    pending.setdefault(normalized, []).append(i)
+            
+            if not pending:
+                return results
+            
+            candidates = list(pending)
+            maybe = self.bloom_filter.might_contain_many(candidates)
+            survivors = [normalized for normalized, hit in zip(candidates, maybe.tolist()) if hit]
+            blocked = set()
+            if survivors:
+                matched = self._match_addresses(survivors)
+                blocked = {normalized for normalized, hit in zip(survivors, matched.tolist()) if hit}
+            for normalized in candidates:
+                is_sanctioned = normalized in blocked
+                self.entity_cache[normalized] = is_sanctioned
+                if is_sanctioned:
+                    for i in pending[normalized]:
+                        results[i] = True
+            
+            if blocked:
+                logger.warning(f"OFAC block: {len(blocked)} sanctioned wallets in batch of {len(wallet_addresses)}")
+            return results
+            
+        except Exception as e:
+            logger.error(f"OFAC batch check failed for {len(wallet_addresses)} wallets: {e}")
+            return [True] * len(wallet_addresses)
+
+    def _match_addresses(self, wallet_addresses: List[str]) -> np.ndarray:
+        """Exact-match normalized addresses against the sorted indexes in one pass."""
+        blocked = np.zeros(len(wallet_addresses), dtype=bool)
+        eth_rows, eth_keys, other_rows, other_keys = [], [], [], []
+        for row, normalized in enumerate(wallet_addresses):
+            key = _eth_key(normalized)
+            if key is not None:
+                eth_rows.append(row)
+                eth_keys.append(key)
+            else:
+                other_rows.append(row)
+                other_keys.append(normalized.encode())
+
+        for rows, keys, index in (
+            (eth_rows, eth_keys, self.eth_index),
+            (other_rows, other_keys, self.address_index),
+        ):
+            if not keys or not len(index):
+                continue
+            keys = np.array(keys, dtype=bytes)
+            positions = np.searchsorted(index, keys)
+            found = (positions < len(index)) & (index[np.minimum(positions, len(index) - 1)] == keys)
+            blocked[np.array(rows)[found]] = True
+        return blocked
+
     async def check_name(
         self, 
         name: str, 
@@ -414,7 +1088,7 @@ class OFACChecker:
             return {"blocked": False, "matches": [], "score": 0.0}
         
         try:
-            normalized = self._normalize_name(name)
+            normalized = _normalize_query(name)
             
             if normalized in self.names_index:
                 matches = [
@@ -433,12 +1107,13 @@ class OFACChecker:
             best_score = 0.0
             best_matches = []
             
-            for index_name, uids in self.names_index.items():
-                score = self._fuzzy_similarity(normalized, index_name)
+            candidates = self._fuzzy_candidates(normalized, fuzzy_threshold)
+            for index_name, score in self._score_names(normalized, candidates, fuzzy_threshold):
+                uids = self.names_index[index_name]
                 if score >= fuzzy_threshold:
                     if score > best_score:
                         best_score = score
-                        best_matches = uids
+                        best_matches = list(uids)
                     elif score == best_score:
                         best_matches.extend(uids)
             
@@ -461,6 +1136,36 @@ class OFACChecker:
             logger.error(f"OFAC name check failed for '{name}': {e}")
             return {"blocked": True, "matches": [], "score": 0.0}
 
+    def _score_names(
+        self,
+        normalized: str,
+        names: Iterable[str],
+        fuzzy_threshold: float
+    ) -> Iterable[Tuple[str, float]]:
+        """
+        Score candidate names against a query, yielding (name, score).
+        
+        With rapidfuzz the whole batch is scored in one C++ call with the
+        threshold as a cutoff; otherwise each name goes through
+        _fuzzy_similarity. Both use normalized Levenshtein similarity.
+        """
+        if not RAPIDFUZZ_AVAILABLE:
+            return ((name, self._fuzzy_similarity(normalized, name)) for name in names)
+        
+        matches = fuzz_process.extract(
+            normalized,
+            list(names),
+            scorer=Levenshtein.normalized_similarity,
+            score_cutoff=fuzzy_threshold,
+            limit=None,
+        )
+        query_len = len(normalized)
+        # Keep _fuzzy_similarity's rejection of large length gaps
+        return [
+            (name, score) for name, score, _ in matches
+            if abs(len(name) - query_len) <= max(len(name), query_len) * 0.5
+        ]
+
     def _fuzzy_similarity(self, s1: str, s2: str) -> float:
         """
         Calculate similarity between two strings using Levenshtein distance.
@@ -481,17 +1186,12 @@ class OFACChecker:
             s1, s2 = s2, s1
             len1, len2 = len2, len1
         
-        previous_row = list(range(len1 + 1))
-        for i, c2 in enumerate(s2):
-            current_row = [i + 1]
-            for j, c1 in enumerate(s1):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-        
-        distance = previous_row[-1]
+        if RAPIDFUZZ_AVAILABLE:
+            distance = Levenshtein.distance(s1, s2)
+        elif NUMBA_AVAILABLE:
+            distance = int(_levenshtein_codes(self._name_codes(s1), self._name_codes(s2)))
+        else:
+            distance = _levenshtein_py(s1, s2)
         max_len = max(len1, len2)
         return 1.0 - (distance / max_len)
 
@@ -508,7 +1208,7 @@ class OFACChecker:
         result = await self.check_name(entity_name)
         return result["blocked"]
 
-    async def is_list_stale(self, max_age_days: int = 7) -> bool:
+    def is_list_stale(self, max_age_days: int = 7) -> bool:
         """
         Check if OFAC list needs updating.
 
@@ -531,7 +1231,7 @@ class OFACChecker:
         Returns:
             True if list was refreshed, False if still fresh
         """
-        if await self.is_list_stale():
+        if self.is_list_stale():
             await self.load_sdn_list(force_refresh=True)
             return True
         return False
@@ -540,9 +1240,8 @@ class OFACChecker:
         """Get statistics about the loaded SDN list."""
         return {
             "total_entries": len(self.sdn_entries),
-            "crypto_addresses": len(self.crypto_addresses),
+            "crypto_addresses": len(self.address_index) + len(self.eth_index),
             "cached_lookups": len(self.entity_cache),
             "last_update": self.last_update.isoformat() if self.last_update else None,
-            "is_stale": asyncio.get_event_loop().run_until_complete(self.is_list_stale())
-            if self.last_update else True
+            "is_stale": self.is_list_stale(),
         }
@@ -0,0 +1,72 @@
+"""Sliding-window audio fingerprints for near-duplicate detection."""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+FNV_PRIME = np.uint64(0x100000001B3)
+
+
+def _window_starts(length: int, window: int, stride: int) -> int:
+    """Number of full windows of `window` bytes taken every `stride` bytes."""
+    if length < window:
+        return 0
+    return (length - window) // stride + 1
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, nogil=True)
+    def _fnv1a_windows(buf, window, stride, count):
+        """FNV-1a over each window, one window per parallel iteration."""
+        out = np.empty(count, dtype=np.uint64)
+        for i in prange(count):
+            h = FNV_OFFSET
+            start = i * stride
+            for j in range(window):
+                h = (h ^ np.uint64(buf[start + j])) * FNV_PRIME
+            out[i] = h
+        return out
+
+
+def _fnv1a_windows_numpy(buf: np.ndarray, window: int, stride: int, count: int) -> np.ndarray:
+    """FNV-1a over each window, vectorized across windows one byte at a time."""
+    starts = np.arange(count, dtype=np.int64) * stride
+    h = np.full(count, FNV_OFFSET, dtype=np.uint64)
+    for j in range(window):
+        h ^= buf[starts + j].astype(np.uint64)
+        h *= FNV_PRIME
+    return h
+
+
+def window_fingerprints(buf: np.ndarray, window: int, stride: int) -> np.ndarray:
+    """
+    Compute 64-bit FNV-1a fingerprints of fixed-size windows of audio.
+
+    Cheap, non-cryptographic hashes for spotting repeated segments
+    across tracks; use the SHA-256 content hash for integrity.
+
+    Args:
+        buf: Audio bytes as a uint8 array
+        window: Window size in bytes
+        stride: Distance between window starts in bytes
+
+    Returns:
+        uint64 array with one fingerprint per full window
+    """
+    if window <= 0 or stride <= 0:
+        raise ValueError("window and stride must be positive")
+
+    buf = np.ascontiguousarray(buf, dtype=np.uint8)
+    count = _window_starts(len(buf), window, stride)
+    if count == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    if NUMBA_AVAILABLE:
+        return _fnv1a_windows(buf, window, stride, count)
+    return _fnv1a_windows_numpy(buf, window, stride, count)
@@ -2,9 +2,12 @@
 
 import asyncio
 import logging
+from collections import defaultdict
 from typing import Dict, Set, List, Optional
 from pathlib import Path
 
+from aiohttp import web
+
 from dcmx.core.track import Track
 from dcmx.network.peer import Peer
 from dcmx.network.protocol import Protocol
@@ -22,6 +25,9 @@ class Node:
     and handles content discovery and distribution across the network.
     """
     
+    # Peers raced at once when downloading a track
+    MAX_PARALLEL_DOWNLOADS = 4
+    
     def __init__(
         self,
         host: str = "127.0.0.1",
@@ -43,6 +49,7 @@ class Node:
         # Network components
         self.protocol = Protocol(self.peer)
         self.peers: Dict[str, Peer] = {}  # peer_id -> Peer
+        self._track_to_peers: Dict[str, Set[str]] = defaultdict(set)  # content_hash -> peer_ids
         
         # Content storage
         self.content_store = ContentStore(self.data_dir / "content")
@@ -63,7 +70,6 @@ class Node:
         self._running = True
         
         # Start HTTP server for peer communication
-        from aiohttp import web
         app = web.Application()
         app.router.add_get('/ping', self._handle_ping)
         app.router.add_get('/peers', self._handle_get_peers)
@@ -129,6 +135,87 @@ class Node:
         """
         return self.content_store.retrieve(content_hash)
     
+    def _register_peer(self, peer: Peer):
+        """
+        Add or replace a peer and index the tracks it advertises.
+        
+        Args:
+            peer: Peer to register
+        """
+        if peer.peer_id in self.peers:
+            self._unindex_peer(self.peers[peer.peer_id])
+        self.peers[peer.peer_id] = peer
+        for content_hash in peer.available_tracks:
+            self._track_to_peers[content_hash].add(peer.peer_id)
+    
+    def _unindex_peer(self, peer: Peer):
+        """Drop a peer's tracks from the track -> peers index."""
+        for content_hash in peer.available_tracks:
+            holders = self._track_to_peers.get(content_hash)
+            if holders is not None:
+                holders.discard(peer.peer_id)
+                if not holders:
+                    del self._track_to_peers[content_hash]
+    
+    def remove_peer(self, peer_id: str) -> bool:
+        """
+        Forget a peer.
+        
+        Args:
+            peer_id: ID of the peer to remove
+            
+        Returns:
+            True if the peer was known
+        """
+        peer = self.peers.pop(peer_id, None)
+        if peer is None:
+            return False
+        self._unindex_peer(peer)
+        return True
+    
+    def add_peer_track(self, peer_id: str, content_hash: str) -> bool:
+        """
+        Record that a known peer now has a track.
+        
+        Goes through the node so the track -> peers index stays current;
+        calling Peer.add_track directly leaves the track undiscoverable.
+        
+        Args:
+            peer_id: ID of the peer
+            content_hash: Content hash of the track
+            
+        Returns:
+            True if the peer was known
+        """
+        peer = self.peers.get(peer_id)
+        if peer is None:
+            return False
+        peer.add_track(content_hash)
+        self._track_to_peers[content_hash].add(peer_id)
+        return True
+    
+    def remove_peer_track(self, peer_id: str, content_hash: str) -> bool:
+        """
+        Record that a known peer no longer has a track.
+        
+        Args:
+            peer_id: ID of the peer
+            content_hash: Content hash of the track
+            
+        Returns:
+            True if the peer was known
+        """
+        peer = self.peers.get(peer_id)
+        if peer is None:
+            return False
+        peer.remove_track(content_hash)
+        holders = self._track_to_peers.get(content_hash)
+        if holders is not None:
+            holders.discard(peer_id)
+            if not holders:
+                del self._track_to_peers[content_hash]
+        return True
+    
     async def connect_to_peer(self, host: str, port: int) -> bool:
         """
         Connect to a peer and exchange information.
@@ -143,7 +230,7 @@ class Node:
         try:
             peer = await self.protocol.connect(host, port)
             if peer:
-                self.peers[peer.peer_id] = peer
+                self._register_peer(peer)
                 logger.info(f"Connected to peer {peer}")
                 return True
         except Exception as e:
@@ -160,7 +247,14 @@ class Node:
         Returns:
             List of peers that have the track
         """
-        return [peer for peer in self.peers.values() if peer.has_track(content_hash)]
+        peers = []
+        for peer_id in self._track_to_peers.get(content_hash, ()):
+            peer = self.peers.get(peer_id)
+            # The index can lag Peer.remove_track calls or direct writes to
+            # self.peers, so confirm against the peer itself
+            if peer is not None and peer.has_track(content_hash):
+                peers.append(peer)
+        return peers
     
     async def request_track(self, content_hash: str) -> Optional[bytes]:
         """
@@ -184,20 +278,58 @@ class Node:
             logger.warning(f"No peers have track {content_hash[:16]}...")
             return None
         
-        # Try to download from first available peer
-        for peer in peers_with_track:
-            try:
-                content = await self.protocol.request_content(peer, content_hash)
-                if content:
-                    # Cache locally
-                    self.content_store.store(content_hash, content)
-                    logger.info(f"Downloaded track {content_hash[:16]}... from {peer}")
-                    return content
-            except Exception as e:
-                logger.error(f"Failed to download from {peer}: {e}")
+        # Race peers in batches; the first verified copy wins
+        for start in range(0, len(peers_with_track), self.MAX_PARALLEL_DOWNLOADS):
+            batch = peers_with_track[start:start + self.MAX_PARALLEL_DOWNLOADS]
+            content = await self._download_first(batch, content_hash)
+            if content:
+                # Cache locally
+                self.content_store.store(content_hash, content)
+                return content
         
         return None
     
+    async def _download_first(self, peers: List[Peer], content_hash: str) -> Optional[bytes]:
+        """
+        Request a track from several peers at once.
+        
+        Returns the first response whose SHA-256 matches the content hash
+        and cancels the outstanding requests.
+        
+        Args:
+            peers: Peers to request from
+            content_hash: Content hash of the track
+            
+        Returns:
+            Verified track content, or None if every peer failed
+        """
+        tasks = {
+            asyncio.ensure_future(self.protocol.request_content(peer, content_hash)): peer
+            for peer in peers
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    peer = tasks[task]
+                    try:
+                        content = task.result()
+                    except Exception as e:
+                        logger.error(f"Failed to download from {peer}: {e}")
+                        continue
+                    if not content:
+                        continue
+                    if Track.compute_content_hash(content) != content_hash:
+                        logger.warning(f"Discarding track {content_hash[:16]}... from {peer}: hash mismatch")
+                        continue
+                    logger.info(f"Downloaded track {content_hash[:16]}... from {peer}")
+                    return content
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+    
     def get_stats(self) -> dict:
         """
         Get node statistics.
@@ -216,30 +348,26 @@ class Node:
     # HTTP handlers
     async def _handle_ping(self, request):
         """Handle ping request."""
-        from aiohttp import web
         return web.json_response({"status": "ok", "peer_id": self.peer.peer_id})
     
     async def _handle_get_peers(self, request):
         """Handle request for peer list."""
-        from aiohttp import web
         peers_data = [peer.to_dict() for peer in self.peers.values()]
         return web.json_response({"peers": peers_data})
     
     async def _handle_get_tracks(self, request):
         """Handle request for available tracks."""
-        from aiohttp import web
         tracks_data = [track.to_dict() for track in self.tracks.values()]
         return web.json_response({"tracks": tracks_data})
     
     async def _handle_discover(self, request):
         """Handle peer discovery request."""
-        from aiohttp import web
         data = await request.json()
         peer_data = data.get("peer")
         
         if peer_data:
             peer = Peer.from_dict(peer_data)
-            self.peers[peer.peer_id] = peer
+            self._register_peer(peer)
             logger.info(f"Discovered peer {peer}")
         
         return web.json_response({
@@ -2,12 +2,90 @@
 
 import hashlib
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO, Iterable, Iterator, Union
 from datetime import datetime, timezone
 
+import msgpack
+import numpy as np
 
-@dataclass
+from dcmx.core.fingerprint import window_fingerprints
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Shared default timestamp while bulk-loading (see Track.batch_timestamp);
+# a context variable so concurrent tasks and threads don't see each other's
+_batch_timestamp: ContextVar[Optional[str]] = ContextVar("track_batch_timestamp", default=None)
+
+# Fields hashed by Track.get_metadata_hash, in sorted order
+_METADATA_HASH_FIELDS = (
+    "album", "artist", "content_hash", "duration", "format", "genre",
+    "metadata", "size", "timestamp", "title", "year",
+)
+
+
+def _str_keys(value: Any) -> Any:
+    """Copy of value with every dict key as the string JSON would write for it."""
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key): _str_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_str_keys(item) for item in value]
+    return value
+
+
+def _canonical_json(value: Any) -> bytes:
+    """
+    Compact, key-sorted UTF-8 JSON.
+    
+    Always the stdlib encoder: hashes must not depend on which optional
+    JSON library is installed, and orjson formats floats (1e16 vs 1e+16)
+    and NaN differently. Keys are stringified before sorting so mixed
+    int/str keys sort instead of raising.
+    """
+    return json.dumps(
+        _str_keys(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def _canonical_field(value: Any) -> bytes:
+    """
+    Canonical bytes for one metadata field.
+    
+    Each value is framed as <type tag><length>:<payload> so None, "None"
+    and 0 hash differently and no value can run into the next one.
+    Strings and ints are encoded directly; anything else (the metadata
+    dict) goes through compact, key-sorted JSON.
+    """
+    if value is None:
+        return b"n0:"
+    if isinstance(value, str):
+        tag, payload = b"s", value.encode()
+    elif isinstance(value, int) and not isinstance(value, bool):
+        tag, payload = b"i", str(value).encode()
+    else:
+        tag, payload = b"j", _canonical_json(value)
+    return tag + str(len(payload)).encode() + b":" + payload
+
+
+def _digest_file(path: Union[str, os.PathLike]) -> str:
+    """SHA-256 of a file, using hashlib.file_digest where available (3.11+)."""
+    if hasattr(hashlib, "file_digest"):
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    return Track.compute_content_hash_stream(path)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Track:
     """
     Represents a music track in the DCMX network.
@@ -31,7 +109,34 @@ class Track:
     def __post_init__(self):
         """Initialize timestamp if not provided."""
         if self.timestamp is None:
-            self.timestamp = datetime.now(timezone.utc).isoformat()
+            self.timestamp = _batch_timestamp.get() or datetime.now(timezone.utc).isoformat()
+    
+    @staticmethod
+    @contextmanager
+    def batch_timestamp(timestamp: Optional[str] = None) -> Iterator[str]:
+        """
+        Use one timestamp for every Track created inside the block.
+        
+        Bulk loaders wrap the construction of many tracks in this so each
+        one skips the clock read and isoformat call. The previous value is
+        restored on exit, even if the block raises.
+        
+        Usage:
+            with Track.batch_timestamp():
+                tracks = [Track(**row) for row in rows]
+        
+        Args:
+            timestamp: ISO timestamp to use (defaults to now)
+            
+        Yields:
+            The batch timestamp
+        """
+        stamp = timestamp or datetime.now(timezone.utc).isoformat()
+        token = _batch_timestamp.set(stamp)
+        try:
+            yield stamp
+        finally:
+            _batch_timestamp.reset(token)
     
     @staticmethod
     def compute_content_hash(data: bytes) -> str:
@@ -46,6 +151,129 @@ class Track:
         """
         return hashlib.sha256(data).hexdigest()
     
+    @staticmethod
+    def compute_content_digest(data: bytes) -> bytes:
+        """
+        Compute SHA-256 hash of audio content as raw bytes.
+        
+        Args:
+            data: Raw audio file bytes
+            
+        Returns:
+            32-byte digest (content_hash is its hex form)
+        """
+        return hashlib.sha256(data).digest()
+    
+    @staticmethod
+    def compute_content_hash_stream(
+        source: Union[str, os.PathLike, BinaryIO],
+        chunk_size: int = 1 << 20,
+    ) -> str:
+        """
+        Compute SHA-256 hash of audio content without loading it all.
+        
+        Reads fixed-size chunks into one reused buffer, so peak memory is
+        chunk_size rather than the file size. Produces the same hash as
+        compute_content_hash on the full bytes.
+        
+        Args:
+            source: Path to the audio file, or a binary file object
+            chunk_size: Bytes read per chunk
+            
+        Returns:
+            Hexadecimal string representation of the hash
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb", buffering=0) as f:
+                return Track.compute_content_hash_stream(f, chunk_size)
+        
+        digest = hashlib.sha256()
+        view = memoryview(bytearray(chunk_size))
+        while True:
+            n = source.readinto(view)
+            if not n:
+                break
+            digest.update(view[:n])
+        return digest.hexdigest()
+    
+    @staticmethod
+    def compute_content_hashes(
+        paths: Iterable[Union[str, os.PathLike]],
+        max_workers: Optional[int] = None,
+    ) -> Dict[Union[str, os.PathLike], str]:
+        """
+        Compute SHA-256 hashes of many audio files in parallel.
+        
+        hashlib releases the GIL while hashing, so a thread pool keeps
+        several cores busy when importing a library.
+        
+        Args:
+            paths: Paths of the audio files
+            max_workers: Worker threads (defaults to the CPU count)
+            
+        Returns:
+            Mapping of each path to its content hash
+        """
+        paths = list(paths)
+        if not paths:
+            return {}
+        workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(paths, executor.map(_digest_file, paths)))
+    
+    @staticmethod
+    def compute_fingerprints(data: bytes, window: int = 4096, stride: int = 1024) -> np.ndarray:
+        """
+        Compute sliding-window fingerprints of audio content.
+        
+        Args:
+            data: Raw audio file bytes
+            window: Window size in bytes
+            stride: Distance between window starts in bytes
+            
+        Returns:
+            uint64 array with one fingerprint per full window
+        """
+        return window_fingerprints(np.frombuffer(data, dtype=np.uint8), window, stride)
+    
+    @staticmethod
+    def digest_matrix(tracks: Iterable["Track"]) -> np.ndarray:
+        """
+        Stack the raw content digests of many tracks.
+        
+        Args:
+            tracks: Tracks with hex content hashes
+            
+        Returns:
+            (N, 32) uint8 array, one row per track
+        """
+        raw = bytes.fromhex("".join(track.content_hash for track in tracks))
+        return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 32)
+    
+    @staticmethod
+    def dedupe_hashes(hashes: np.ndarray) -> np.ndarray:
+        """
+        Find the first occurrence of each distinct content digest.
+        
+        Each 32-byte row is viewed as one opaque value so np.unique
+        compares whole digests in C instead of building a set of strings.
+        
+        Args:
+            hashes: (N, 32) uint8 array of digests (see digest_matrix)
+            
+        Returns:
+            Ascending row indices of the unique digests
+        """
+        rows = np.ascontiguousarray(hashes, dtype=np.uint8).view(np.dtype((np.void, 32))).ravel()
+        _, first = np.unique(rows, return_index=True)
+        first.sort()
+        return first
+    
+    @property
+    def content_digest(self) -> bytes:
+        """Raw 32-byte form of content_hash, for compact bulk comparisons."""
+        return bytes.fromhex(self.content_hash)
+    
     def get_metadata_hash(self) -> str:
         """
         Compute hash of track metadata for verification.
@@ -53,9 +281,8 @@ class Track:
         Returns:
             SHA-256 hash of the metadata
         """
-        metadata_dict = asdict(self)
-        metadata_json = json.dumps(metadata_dict, sort_keys=True)
-        return hashlib.sha256(metadata_json.encode()).hexdigest()
+        canonical = b"".join(_canonical_field(getattr(self, name)) for name in _METADATA_HASH_FIELDS)
+        return hashlib.sha256(canonical).hexdigest()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert track to dictionary representation."""
@@ -74,6 +301,28 @@ class Track:
         """
         return cls(**data)
     
+    def to_msgpack(self) -> bytes:
+        """
+        Serialize track for peer-to-peer transport.
+        
+        msgpack is smaller and faster than JSON for these small records.
+        Integrity checks still use get_metadata_hash, not these bytes.
+        """
+        return msgpack.packb(self.to_dict(), use_bin_type=True)
+    
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "Track":
+        """
+        Create Track instance from to_msgpack bytes.
+        
+        Args:
+            data: msgpack-encoded track
+            
+        Returns:
+            Track instance
+        """
+        return cls.from_dict(msgpack.unpackb(data, raw=False))
+    
     def __str__(self) -> str:
         """String representation of the track."""
         return f"{self.artist} - {self.title} ({self.format}, {self.duration}s)"
@@ -11,72 +11,59 @@ Provides database infrastructure for persistent storage across all DCMX systems:
 - Web3/TRON blockchain integration
 """
 
+import importlib
+
 from dcmx.database.config import DatabaseConfig
-from dcmx.database.database import DatabaseManager, get_session, get_async_session
-from dcmx.database.models import (
-    Base,
-    AcceptanceRecord,
-    AuditEvent,
-    DataDeletionRequest,
-    Wallet,
-    User,
-    UserRole,
-    UserSession,
-    NFTCertificate,
-    MusicNFT,
-    NFTSale,
-    NFTRoyalty,
-    RewardClaim,
-    SharingReward,
-    ListeningReward,
-    BandwidthReward,
-    RoyaltyPayment,
-    RevenuePool,
-    Transaction,
-    VotingRecord,
-    SkipRecord,
-    BlockchainTransaction,
-    SystemConfiguration,
-    AdminAction,
-    MultisigProposal,
-)
-from dcmx.database.dal import DataAccessLayer
-from dcmx.database.sync import sync_blockchain_data
-from dcmx.database.queries import DatabaseQueries
 
-__all__ = [
-    "DatabaseConfig",
-    "DatabaseManager",
-    "get_session",
-    "get_async_session",
-    "Base",
-    "AcceptanceRecord",
-    "AuditEvent",
-    "DataDeletionRequest",
-    "Wallet",
-    "User",
-    "UserRole",
-    "UserSession",
-    "NFTCertificate",
-    "MusicNFT",
-    "NFTSale",
-    "NFTRoyalty",
-    "RewardClaim",
-    "SharingReward",
-    "ListeningReward",
-    "BandwidthReward",
-    "RoyaltyPayment",
-    "RevenuePool",
-    "Transaction",
-    "VotingRecord",
-    "SkipRecord",
-    "BlockchainTransaction",
-    "SystemConfiguration",
-    "AdminAction",
-    "MultisigProposal",
-    "DataAccessLayer",
-    "sync_blockchain_data",
-    "DatabaseQueries",
-]
+# Public names resolved on first access (PEP 562), so importing the package
+# or DatabaseConfig doesn't pull in SQLAlchemy, the ORM models, or TRON sync
+_LAZY_IMPORTS = {
+    "DatabaseManager": "dcmx.database.database",
+    "get_session": "dcmx.database.database",
+    "get_async_session": "dcmx.database.database",
+    "Base": "dcmx.database.models",
+    "AcceptanceRecord": "dcmx.database.models",
+    "AuditEvent": "dcmx.database.models",
+    "DataDeletionRequest": "dcmx.database.models",
+    "Wallet": "dcmx.database.models",
+    "User": "dcmx.database.models",
+    "UserRole": "dcmx.database.models",
+    "UserSession": "dcmx.database.models",
+    "NFTCertificate": "dcmx.database.models",
+    "MusicNFT": "dcmx.database.models",
+    "NFTSale": "dcmx.database.models",
+    "NFTRoyalty": "dcmx.database.models",
+    "RewardClaim": "dcmx.database.models",
+    "SharingReward": "dcmx.database.models",
+    "ListeningReward": "dcmx.database.models",
+    "BandwidthReward": "dcmx.database.models",
+    "RoyaltyPayment": "dcmx.database.models",
+    "RevenuePool": "dcmx.database.models",
+    "Transaction": "dcmx.database.models",
+    "VotingRecord": "dcmx.database.models",
+    "SkipRecord": "dcmx.database.models",
+    "BlockchainTransaction": "dcmx.database.models",
+    "SystemConfiguration": "dcmx.database.models",
+    "AdminAction": "dcmx.database.models",
+    "MultisigProposal": "dcmx.database.models",
+    "DataAccessLayer": "dcmx.database.dal",
+    "DALSession": "dcmx.database.dal",
+    "sync_blockchain_data": "dcmx.database.sync",
+    "DatabaseQueries": "dcmx.database.queries",
+}
+
+__all__ = ("DatabaseConfig", *_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
-]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
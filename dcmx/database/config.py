@@ -1,14 +1,15 @@
 """Database configuration for DCMX."""
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
 from urllib.parse import quote_plus
 
 
-@dataclass
+@dataclass(frozen=True)
 class DatabaseConfig:
-    """Database configuration."""
+    """Database configuration (immutable, so derived URLs are cached)."""
     
     # Database connection parameters
     host: str = "localhost"
@@ -22,6 +23,13 @@ class DatabaseConfig:
     max_overflow: int = 20
     pool_timeout: int = 30
     pool_recycle: int = 3600
+    # Pre-ping costs a SELECT 1 round-trip per checkout; pool_recycle alone
+    # is enough on stable networks, so enable only for flaky links
+    pool_pre_ping: bool = False
+    # Behind PgBouncer in transaction mode: never pre-ping (it can pin a
+    # backend), recycle faster than server_idle_timeout, and skip
+    # server-side prepared statements, which don't survive backend switches
+    pgbouncer_mode: bool = False
     
     # SQLite fallback for development
     use_sqlite: bool = False
@@ -30,6 +38,7 @@ class DatabaseConfig:
     # Async settings
     async_pool_size: int = 5
     async_max_overflow: int = 10
+    async_pool_recycle: int = 1800
     
     @classmethod
     def from_env(cls) -> "DatabaseConfig":
@@ -44,28 +53,57 @@ class DatabaseConfig:
             max_overflow=int(os.getenv("DCMX_DB_MAX_OVERFLOW", "20")),
             pool_timeout=int(os.getenv("DCMX_DB_POOL_TIMEOUT", "30")),
             pool_recycle=int(os.getenv("DCMX_DB_POOL_RECYCLE", "3600")),
+            pool_pre_ping=os.getenv("DCMX_DB_POOL_PRE_PING", "false").lower() == "true",
+            pgbouncer_mode=os.getenv("DCMX_DB_PGBOUNCER_MODE", "false").lower() == "true",
             use_sqlite=os.getenv("DCMX_DB_USE_SQLITE", "false").lower() == "true",
             sqlite_path=os.getenv("DCMX_DB_SQLITE_PATH", "dcmx.db"),
             async_pool_size=int(os.getenv("DCMX_DB_ASYNC_POOL_SIZE", "5")),
             async_max_overflow=int(os.getenv("DCMX_DB_ASYNC_MAX_OVERFLOW", "10")),
+            async_pool_recycle=int(os.getenv("DCMX_DB_ASYNC_POOL_RECYCLE", "1800")),
         )
     
-    def get_sync_url(self) -> str:
-        """Get synchronous database URL."""
+    @functools.cached_property
+    def _quoted_password(self) -> str:
+        """Password escaped for use in a URL."""
+        return quote_plus(self.password)
+    
+    @functools.cached_property
+    def _sync_url(self) -> str:
+        """Synchronous database URL, built once."""
         if self.use_sqlite:
             return f"sqlite:///{self.sqlite_path}"
         
-        password = quote_plus(self.password)
-        return f"postgresql://{self.username}:{password}@{self.host}:{self.port}/{self.database}"
+        return f"postgresql+psycopg2://{self.username}:{self._quoted_password}@{self.host}:{self.port}/{self.database}"
     
-    def get_async_url(self) -> str:
-        """Get asynchronous database URL."""
+    @functools.cached_property
+    def _async_url(self) -> str:
+        """Asynchronous database URL, built once."""
         if self.use_sqlite:
             return f"sqlite+aiosqlite:///{self.sqlite_path}"
         
-        password = quote_plus(self.password)
-        return f"postgresql+asyncpg://{self.username}:{password}@{self.host}:{self.port}/{self.database}"
+        return f"postgresql+asyncpg://{self.username}:{self._quoted_password}@{self.host}:{self.port}/{self.database}"
+    
+    def get_sync_url(self) -> str:
+        """Get synchronous database URL."""
+        return self._sync_url
+    
+    def get_async_url(self) -> str:
+        """Get asynchronous database URL."""
+        return self._async_url
+
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> DatabaseConfig:
+    """
+    Get the global configuration, reading the environment on first use.
+    
+    Call get_config.cache_clear() to pick up environment changes.
+    """
+    return DatabaseConfig.from_env()
 
 
-# Global configuration instance
-config = DatabaseConfig.from_env()
+def __getattr__(name: str):
+    """Resolve the legacy module-level ``config`` lazily."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,13 +9,20 @@ Provides high-level async and sync methods for common database operations:
 - Transactions and activity
 """
 
+import copy
+import functools
 import logging
-from typing import List, Optional, Dict, Any
+import time
+from collections import OrderedDict, defaultdict
+from typing import AsyncIterator, Iterable, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-from uuid import uuid4
 
-from sqlalchemy import select, and_, or_, func, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    BigInteger, bindparam, cast, column, event, select, insert, update, union_all, and_, func, desc, case,
+    table, true
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, aliased, make_transient_to_detached
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from dcmx.database.models import (
@@ -25,14 +32,342 @@ from dcmx.database.models import (
     RewardClaim, SharingReward, ListeningReward, BandwidthReward,
     RoyaltyPayment, RevenuePool,
     Transaction, VotingRecord, SkipRecord, BlockchainTransaction,
-    SystemConfiguration, AdminAction, MultisigProposal
+    SystemConfiguration, AdminAction, MultisigProposal, uuid7
 )
 
 logger = logging.getLogger(__name__)
 
+# Analytics results by (function, database, epochs, args) -> (expires_at, value),
+# least recently used first
+_stats_cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+# Bumped by invalidate_analytics_cache() so results computed before it are never reused
+_cache_epoch = 0
+# Per-table epochs, bumped when a write to the table commits
+_table_epochs: Dict[str, int] = defaultdict(int)
+# Tables each cached analytics function reads, by function name
+_cached_query_tables: Dict[str, Tuple[str, ...]] = {}
+STATS_CACHE_MAX_ENTRIES = 1024
+
+# MusicNFT column values by (database, table, key) -> (expires_at, values),
+# least recently used first. Wallets are not cached: their balance changes
+# with every transfer
+_row_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+ROW_CACHE_SECONDS = 30
+ROW_CACHE_MAX_ENTRIES = 10_000
+# Bumped on every eviction, so a read that raced a commit never caches what it saw
+_row_generation = 0
+# Cached models and the column their cache key is taken from
+_CACHED_ROW_KEYS = {MusicNFT: 'nft_id'}
+
+# session.info keys: the session has written in its current transaction (so
+# its reads may be uncommitted and must not populate shared caches), and the
+# cached rows to evict once that transaction commits
+_SESSION_WROTE = 'dcmx_session_wrote'
+_STALE_ROWS = 'dcmx_stale_rows'
+# session.info key: tables written in the current transaction, whose cached
+# analytics are invalidated once it commits
+_STALE_ANALYTICS = 'dcmx_stale_analytics'
+
+
+def invalidate_row_cache():
+    """Drop every cached NFT row."""
+    global _row_generation
+    _row_generation += 1
+    _row_cache.clear()
+
+
+def _row_cache_key(session, model, key: str) -> Optional[tuple]:
+    """Cache key for a row, or None when the session has no single bind."""
+    if session.bind is None:
+        return None
+    return (str(session.bind.url), model.__tablename__, key)
+
+
+def _forget_row(session, model, key: str):
+    """Evict a row the session is changing once its transaction commits."""
+    session.info[_SESSION_WROTE] = True
+    cache_key = _row_cache_key(session, model, key)
+    if cache_key is not None:
+        session.info.setdefault(_STALE_ROWS, set()).add(cache_key)
+
+
+def _forget_analytics(session, table_name: str):
+    """Invalidate analytics reading a table once the session's transaction commits."""
+    session.info.setdefault(_STALE_ANALYTICS, set()).add(table_name)
+
+
+class DALSession(Session):
+    """
+    Session class whose commits keep the DAL's row and analytics caches current.
+    
+    The write-tracking hooks are registered on this class rather than on
+    Session, so sessions elsewhere in the process don't run them. Use it as
+    the sync_session_class of async sessions handed to the DAL, as
+    DatabaseManager does; other sessions bypass the caches.
+    """
+
+
+def _uses_caches(session) -> bool:
+    """Whether the session's commits evict what it changes (see DALSession)."""
+    return isinstance(getattr(session, 'sync_session', session), DALSession)
+
+
+def _has_uncommitted_writes(session) -> bool:
+    """Whether the session's reads may include its own uncommitted changes."""
+    return bool(session.info.get(_SESSION_WROTE) or session.new or session.dirty or session.deleted)
+
+
+@event.listens_for(DALSession, "do_orm_execute")
+def _track_statement_writes(orm_execute_state):
+    """Flag sessions that run INSERT/UPDATE/DELETE statements directly."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        session = orm_execute_state.session
+        session.info[_SESSION_WROTE] = True
+        target = getattr(orm_execute_state.statement, 'table', None)
+        if target is not None:
+            _forget_analytics(session, target.name)
+
+
+@event.listens_for(DALSession, "after_flush")
+def _track_flushed_writes(session, flush_context):
+    """Flag flushing sessions and note the cached rows they change."""
+    session.info[_SESSION_WROTE] = True
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        _forget_analytics(session, type(instance).__tablename__)
+        key_attr = _CACHED_ROW_KEYS.get(type(instance))
+        if key_attr is not None:
+            _forget_row(session, type(instance), getattr(instance, key_attr))
+
+
+@event.listens_for(DALSession, "after_commit")
+def _evict_committed_rows(session):
+    """Evict rows and analytics only once the change is visible to other sessions."""
+    global _row_generation
+    session.info.pop(_SESSION_WROTE, None)
+    written = session.info.pop(_STALE_ANALYTICS, None)
+    if written:
+        invalidate_analytics_cache(written)
+    stale = session.info.pop(_STALE_ROWS, None)
+    if stale:
+        _row_generation += 1
+        for cache_key in stale:
+            _row_cache.pop(cache_key, None)
+
+
+@event.listens_for(DALSession, "after_rollback")
+def _discard_rolled_back_writes(session):
+    """Nothing a rolled-back transaction wrote needs invalidating."""
+    session.info.pop(_SESSION_WROTE, None)
+    session.info.pop(_STALE_ROWS, None)
+    session.info.pop(_STALE_ANALYTICS, None)
+
+
+async def _cached_row(session: AsyncSession, model, key: str, stmt, params: Dict[str, Any]):
+    """
+    Load one row through the per-process row cache.
+    
+    Hits are rebuilt from the cached column values and attached with
+    merge(load=False), so they cost no query and behave like loaded
+    objects. A row already in the session is always loaded normally, so
+    its unflushed edits are kept. Rows changed outside this process stay
+    stale for up to ROW_CACHE_SECONDS. Sessions that are not DALSessions
+    always query.
+    """
+    mapper = model.__mapper__
+    cache_key = _row_cache_key(session, model, key) if _uses_caches(session) else None
+    now = time.monotonic()
+    cached = _row_cache.get(cache_key) if cache_key is not None else None
+    if cached is not None and cached[0] > now:
+        identity = mapper.identity_key_from_primary_key(
+            [cached[1][mapper.get_property_by_column(pk).key] for pk in mapper.primary_key]
+        )
+        if identity not in session.identity_map:
+            _row_cache.move_to_end(cache_key)
+            instance = model(**copy.deepcopy(cached[1]))
+            make_transient_to_detached(instance)
+            return await session.merge(instance, load=False)
+    
+    generation = _row_generation
+    instance = (await session.execute(stmt, params)).scalars().first()
+    if (
+        instance is not None
+        and cache_key is not None
+        and generation == _row_generation
+        and not _has_uncommitted_writes(session)
+    ):
+        values = {attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs}
+        _row_cache[cache_key] = (now + ROW_CACHE_SECONDS, copy.deepcopy(values))
+        _row_cache.move_to_end(cache_key)
+        while len(_row_cache) > ROW_CACHE_MAX_ENTRIES:
+            _row_cache.popitem(last=False)
+    return instance
+
+
+# PostgreSQL planner statistics, for approximate row counts
+_pg_class = table('pg_class', column('relname'), column('reltuples'))
+
+
+def _user_transactions_stmt():
+    """Newest sent and received transactions, one indexed branch per side."""
+    # Self-transfers only come from the sent branch
+    sent = select(Transaction).where(
+        Transaction.from_wallet == bindparam('address')
+    ).order_by(desc(Transaction.created_at)).limit(bindparam('limit'))
+    received = select(Transaction).where(
+        Transaction.to_wallet == bindparam('address'),
+        Transaction.from_wallet != bindparam('address')
+    ).order_by(desc(Transaction.created_at)).limit(bindparam('limit'))
+    
+    history = union_all(select(sent.subquery()), select(received.subquery())).subquery()
+    tx = aliased(Transaction, history)
+    return select(tx).order_by(desc(tx.created_at)).limit(bindparam('limit'))
+
+
+# Hot lookups, built once; callers supply the bound values
+_GET_WALLET = select(Wallet).where(Wallet.address == bindparam('address'))
+_GET_NFT = select(MusicNFT).where(MusicNFT.nft_id == bindparam('nft_id'))
+_GET_USER_TRANSACTIONS = _user_transactions_stmt()
+
+
+def invalidate_analytics_cache(tables: Optional[Iterable[str]] = None):
+    """
+    Drop cached analytics results.
+    
+    Args:
+        tables: Names of changed tables; only results that read one of
+            them are dropped. Drops everything if not given.
+    """
+    global _cache_epoch
+    if tables is None:
+        _cache_epoch += 1
+        _stats_cache.clear()
+        return
+    
+    tables = set(tables)
+    for name in tables:
+        _table_epochs[name] += 1
+    for key in [k for k in _stats_cache if tables.intersection(_cached_query_tables[k[0]])]:
+        del _stats_cache[key]
+
+
+def ttl_cache(seconds: float, tables: Tuple[Any, ...]):
+    """
+    Cache an async DAL query's result per database for a few seconds.
+    
+    Results are dropped when a write to one of the tables the query reads
+    commits (or when the TTL runs out). Sessions with uncommitted writes,
+    and sessions that are not DALSessions, bypass the cache, so results
+    that include changes it won't be told about are neither served from
+    nor stored in it. Cached values are shared between callers and must
+    not be mutated.
+    
+    Args:
+        seconds: Time to live of a cached result
+        tables: Models whose tables the query reads
+    """
+    table_names = tuple(model.__tablename__ for model in tables)
+    
+    def decorator(func):
+        _cached_query_tables[func.__name__] = table_names
+        
+        @functools.wraps(func)
+        async def wrapper(session, *args, **kwargs):
+            if session.bind is None or not _uses_caches(session) or _has_uncommitted_writes(session):
+                return await func(session, *args, **kwargs)
+            
+            # Epochs are read before querying, so a result that raced a
+            # commit is stored under a key that is already out of date
+            epochs = (_cache_epoch, *(_table_epochs[name] for name in table_names))
+            key = (func.__name__, str(session.bind.url), epochs, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            cached = _stats_cache.get(key)
+            if cached is not None and cached[0] > now:
+                _stats_cache.move_to_end(key)
+                return cached[1]
+            
+            value = await func(session, *args, **kwargs)
+            _stats_cache[key] = (now + seconds, value)
+            _stats_cache.move_to_end(key)
+            while len(_stats_cache) > STATS_CACHE_MAX_ENTRIES:
+                _stats_cache.popitem(last=False)
+            return value
+        return wrapper
+    return decorator
+
 
 class DataAccessLayer:
-    """Data access layer for DCMX database operations."""
+    """
+    Data access layer for DCMX database operations.
+    
+    Writers stage their rows with session.add. Called outside a transaction
+    they commit on their own; called inside one (including after a read in
+    the same session) they only flush, so many writes share the caller's
+    single commit.
+    """
+    
+    # Batches at least this large are loaded with COPY on PostgreSQL
+    COPY_THRESHOLD = 100
+    # Rows fetched per round trip by the iter_* streaming readers
+    STREAM_BATCH_SIZE = 200
+    
+    @staticmethod
+    async def _finish(session: AsyncSession, owns_transaction: bool):
+        """Commit a writer's own transaction, or flush into the caller's."""
+        if owns_transaction:
+            await session.commit()
+        else:
+            await session.flush()
+    
+    @staticmethod
+    def _with_defaults(model, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill client-side column defaults (ids, timestamps) that COPY skips."""
+        defaults = [
+            (column.key, column.default)
+            for column in model.__table__.columns
+            if column.default is not None and (column.default.is_scalar or column.default.is_callable)
+        ]
+        filled = []
+        for row in rows:
+            row = dict(row)
+            for key, default in defaults:
+                if key not in row:
+                    row[key] = default.arg(None) if default.is_callable else default.arg
+            filled.append(row)
+        return filled
+    
+    @staticmethod
+    async def _bulk_create(session: AsyncSession, model, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many rows of an append-only table.
+        
+        Large batches on PostgreSQL stream through asyncpg's binary COPY on
+        the session's own connection, so they stay in its transaction.
+        Smaller batches and other backends use one executemany INSERT.
+        """
+        if not rows:
+            return 0
+        
+        owns_transaction = not session.in_transaction()
+        conn = await session.connection()
+        
+        if len(rows) >= DataAccessLayer.COPY_THRESHOLD and conn.dialect.name == "postgresql":
+            columns = [column.name for column in model.__table__.columns]
+            records = [
+                tuple(row.get(name) for name in columns)
+                for row in DataAccessLayer._with_defaults(model, rows)
+            ]
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                model.__tablename__, records=records, columns=columns
+            )
+            # COPY bypasses the session, so its write hooks never see it
+            session.info[_SESSION_WROTE] = True
+            _forget_analytics(session, model.__tablename__)
+        else:
+            await session.execute(insert(model), rows)
+        
+        await DataAccessLayer._finish(session, owns_transaction)
+        return len(rows)
     
     # ========================================================================
     # LEGAL COMPLIANCE METHODS
@@ -52,6 +387,7 @@ class DataAccessLayer:
         document_hash: Optional[str] = None
     ) -> AcceptanceRecord:
         """Record legal document acceptance."""
+        owns_transaction = not session.in_transaction()
         record = AcceptanceRecord(
             user_id=user_id,
             wallet_address=wallet_address,
@@ -66,8 +402,7 @@ class DataAccessLayer:
         )
         
         session.add(record)
-        await session.commit()
-        await session.refresh(record)
+        await DataAccessLayer._finish(session, owns_transaction)
         
         logger.info(f"Acceptance recorded: {user_id} accepted {document_type} v{version}")
         return record
@@ -108,8 +443,9 @@ class DataAccessLayer:
         **kwargs
     ) -> AuditEvent:
         """Log compliance audit event."""
+        owns_transaction = not session.in_transaction()
         event = AuditEvent(
-            event_id=kwargs.get('event_id', f"{event_type}_{uuid4().hex[:12]}"),
+            event_id=kwargs.get('event_id', f"{event_type}_{uuid7().hex}"),
             event_type=event_type,
             user_id=user_id,
             wallet_address=wallet_address,
@@ -122,8 +458,7 @@ class DataAccessLayer:
         )
         
         session.add(event)
-        await session.commit()
-        await session.refresh(event)
+        await DataAccessLayer._finish(session, owns_transaction)
         
         return event
     
@@ -139,28 +474,26 @@ class DataAccessLayer:
         is_artist: bool = False
     ) -> Wallet:
         """Create or get wallet."""
-        # Check if wallet exists
+        owns_transaction = not session.in_transaction()
+        conn = await session.connection()
+        dialect_insert = postgresql.insert if conn.dialect.name == "postgresql" else sqlite.insert
+        
+        # INSERT ... ON CONFLICT DO NOTHING is race-free and needs no pre-check
         result = await session.execute(
-            select(Wallet).where(Wallet.address == address)
+            dialect_insert(Wallet)
+            .values(address=address, username=username, is_artist=is_artist, balance_dcmx=0)
+            .on_conflict_do_nothing(index_elements=[Wallet.address])
+            .returning(Wallet)
         )
-        existing = result.scalars().first()
+        wallet = result.scalars().first()
         
-        if existing:
+        if wallet is None:
             logger.warning(f"Wallet already exists: {address}")
-            return existing
+            wallet = await DataAccessLayer.get_wallet(session, address)
+        else:
+            logger.info(f"Wallet created: {address}")
         
-        wallet = Wallet(
-            address=address,
-            username=username,
-            is_artist=is_artist,
-            balance_dcmx=0
-        )
-        
-        session.add(wallet)
-        await session.commit()
-        await session.refresh(wallet)
-        
-        logger.info(f"Wallet created: {address}")
+        await DataAccessLayer._finish(session, owns_transaction)
         return wallet
     
     @staticmethod
@@ -169,9 +502,7 @@ class DataAccessLayer:
         address: str
     ) -> Optional[Wallet]:
         """Get wallet by address."""
-        result = await session.execute(
-            select(Wallet).where(Wallet.address == address)
-        )
+        result = await session.execute(_GET_WALLET, {'address': address})
         return result.scalars().first()
     
     @staticmethod
@@ -181,21 +512,31 @@ class DataAccessLayer:
         amount: float,
         operation: str = "add"
     ) -> Wallet:
-        """Update wallet balance."""
-        wallet = await DataAccessLayer.get_wallet(session, address)
-        if not wallet:
-            raise ValueError(f"Wallet not found: {address}")
-        
+        """Update wallet balance with a single atomic UPDATE ... RETURNING."""
         if operation == "add":
-            wallet.balance_dcmx += amount
+            balance = Wallet.balance_dcmx + amount
         elif operation == "subtract":
-            wallet.balance_dcmx -= amount
+            balance = Wallet.balance_dcmx - amount
         elif operation == "set":
-            wallet.balance_dcmx = amount
+            balance = amount
+        else:
+            raise ValueError(f"Unknown balance operation: {operation}")
+        
+        owns_transaction = not session.in_transaction()
+        result = await session.execute(
+            update(Wallet)
+            .where(Wallet.address == address)
+            .values(balance_dcmx=balance, last_activity=datetime.utcnow())
+            .returning(Wallet)
+            .execution_options(populate_existing=True)
+        )
+        wallet = result.scalars().first()
+        if wallet is None:
+            if owns_transaction:
+                await session.rollback()
+            raise ValueError(f"Wallet not found: {address}")
         
-        wallet.last_activity = datetime.utcnow()
-        await session.commit()
-        await session.refresh(wallet)
+        await DataAccessLayer._finish(session, owns_transaction)
         
         return wallet
     
@@ -216,6 +557,7 @@ class DataAccessLayer:
         **kwargs
     ) -> MusicNFT:
         """Create NFT record."""
+        owns_transaction = not session.in_transaction()
         nft = MusicNFT(
             nft_id=nft_id,
             title=title,
@@ -234,8 +576,7 @@ class DataAccessLayer:
         )
         
         session.add(nft)
-        await session.commit()
-        await session.refresh(nft)
+        await DataAccessLayer._finish(session, owns_transaction)
         
         logger.info(f"NFT created: {title} ({nft_id})")
         return nft
@@ -246,10 +587,7 @@ class DataAccessLayer:
         nft_id: str
     ) -> Optional[MusicNFT]:
         """Get NFT by ID."""
-        result = await session.execute(
-            select(MusicNFT).where(MusicNFT.nft_id == nft_id)
-        )
-        return result.scalars().first()
+        return await _cached_row(session, MusicNFT, nft_id, _GET_NFT, {'nft_id': nft_id})
     
     @staticmethod
     async def get_artist_nfts(
@@ -257,10 +595,21 @@ class DataAccessLayer:
         artist_wallet: str
     ) -> List[MusicNFT]:
         """Get all NFTs by artist."""
-        result = await session.execute(
-            select(MusicNFT).where(MusicNFT.artist_wallet == artist_wallet)
+        return [nft async for nft in DataAccessLayer.iter_artist_nfts(session, artist_wallet)]
+    
+    @staticmethod
+    async def iter_artist_nfts(
+        session: AsyncSession,
+        artist_wallet: str
+    ) -> AsyncIterator[MusicNFT]:
+        """Stream an artist's NFTs, STREAM_BATCH_SIZE rows at a time."""
+        result = await session.stream(
+            select(MusicNFT)
+            .where(MusicNFT.artist_wallet == artist_wallet)
+            .execution_options(yield_per=DataAccessLayer.STREAM_BATCH_SIZE)
         )
-        return list(result.scalars().all())
+        async for nft in result.scalars():
+            yield nft
     
     @staticmethod
     async def record_nft_purchase(
@@ -272,6 +621,7 @@ class DataAccessLayer:
         sale_type: str = "primary"
     ) -> NFTSale:
         """Record NFT purchase."""
+        owns_transaction = not session.in_transaction()
         # Get NFT
         nft = await DataAccessLayer.get_nft(session, nft_id)
         if not nft:
@@ -286,8 +636,7 @@ class DataAccessLayer:
         )
         
         session.add(sale)
-        await session.commit()
-        await session.refresh(sale)
+        await DataAccessLayer._finish(session, owns_transaction)
         
         logger.info(f"NFT purchase recorded: {buyer_wallet} bought {nft_id}")
         return sale
@@ -306,6 +655,7 @@ class DataAccessLayer:
         total_reward: float
     ) -> ListeningReward:
         """Record listening reward."""
+        owns_transaction = not session.in_transaction()
         reward = ListeningReward(
             user_wallet=user_wallet,
             nft_id=nft_id,
@@ -316,8 +666,7 @@ class DataAccessLayer:
         )
         
         session.add(reward)
-        await session.commit()
-        await session.refresh(reward)
+        await DataAccessLayer._finish(session, owns_transaction)
         
         return reward
     
@@ -330,6 +679,7 @@ class DataAccessLayer:
         reward_tokens: float = 0
     ) -> VotingRecord:
         """Record user vote on song."""
+        owns_transaction = not session.in_transaction()
         vote = VotingRecord(
             user_wallet=user_wallet,
             nft_id=nft_id,
@@ -338,8 +688,7 @@ class DataAccessLayer:
         )
         
         session.add(vote)
-        await session.commit()
-        await session.refresh(vote)
+        await DataAccessLayer._finish(session, owns_transaction)
         
         return vote
     
@@ -352,6 +701,7 @@ class DataAccessLayer:
         charge_applied: float = 0
     ) -> SkipRecord:
         """Record skip activity."""
+        owns_transaction = not session.in_transaction()
         skip = SkipRecord(
             user_wallet=user_wallet,
             nft_id=nft_id,
@@ -360,11 +710,43 @@ class DataAccessLayer:
         )
         
         session.add(skip)
-        await session.commit()
-        await session.refresh(skip)
+        await DataAccessLayer._finish(session, owns_transaction)
         
         return skip
     
+    @staticmethod
+    async def bulk_create_listening_rewards(
+        session: AsyncSession,
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Record many listening rewards (playback telemetry ingestion).
+        
+        Rows use ListeningReward column names; base_reward defaults to
+        total_reward as in create_listening_reward.
+        """
+        rows = [
+            row if 'base_reward' in row else {**row, 'base_reward': row['total_reward']}
+            for row in rows
+        ]
+        return await DataAccessLayer._bulk_create(session, ListeningReward, rows)
+    
+    @staticmethod
+    async def bulk_create_voting_records(
+        session: AsyncSession,
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        """Record many song votes; rows use VotingRecord column names."""
+        return await DataAccessLayer._bulk_create(session, VotingRecord, rows)
+    
+    @staticmethod
+    async def bulk_create_skip_records(
+        session: AsyncSession,
+        rows: List[Dict[str, Any]]
+    ) -> int:
+        """Record many skips; rows use SkipRecord column names."""
+        return await DataAccessLayer._bulk_create(session, SkipRecord, rows)
+    
     # ========================================================================
     # TRANSACTION METHODS
     # ========================================================================
@@ -379,8 +761,8 @@ class DataAccessLayer:
         **kwargs
     ) -> Transaction:
         """Create transaction record."""
+        owns_transaction = not session.in_transaction()
         transaction = Transaction(
-            transaction_id=kwargs.get('transaction_id', f"tx_{uuid4().hex}"),
             from_wallet=from_wallet,
             to_wallet=to_wallet,
             amount_dcmx=amount_dcmx,
@@ -388,15 +770,47 @@ class DataAccessLayer:
             status=kwargs.get('status', 'completed'),
             blockchain_hash=kwargs.get('blockchain_hash'),
             blockchain=kwargs.get('blockchain', 'polygon'),
-            metadata=kwargs.get('metadata', {})
+            transaction_metadata=kwargs.get('metadata', {})
         )
+        # Otherwise the column default assigns a time-ordered id at flush
+        if 'transaction_id' in kwargs:
+            transaction.transaction_id = kwargs['transaction_id']
         
         session.add(transaction)
-        await session.commit()
-        await session.refresh(transaction)
+        await DataAccessLayer._finish(session, owns_transaction)
         
         return transaction
     
+    @staticmethod
+    async def bulk_create_transactions(
+        session: AsyncSession,
+        rows: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Create many transaction records with one executemany INSERT.
+        
+        SQLAlchemy batches the rows into multi-row INSERT ... RETURNING
+        statements, so ids come back without a commit + refresh per row.
+        Rows use Transaction column names; status defaults to completed
+        as in create_transaction.
+        
+        Returns:
+            Primary keys of the new records, in row order
+        """
+        if not rows:
+            return []
+        
+        owns_transaction = not session.in_transaction()
+        rows = [{'status': 'completed', **row} for row in rows]
+        result = await session.scalars(
+            insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+            rows,
+        )
+        ids = list(result)
+        
+        await DataAccessLayer._finish(session, owns_transaction)
+        return ids
+    
     @staticmethod
     async def get_user_transactions(
         session: AsyncSession,
@@ -404,13 +818,9 @@ class DataAccessLayer:
         limit: int = 100
     ) -> List[Transaction]:
         """Get user transaction history."""
+        # UNION ALL of one indexed, limited branch per side instead of an OR filter
         result = await session.execute(
-            select(Transaction).where(
-                or_(
-                    Transaction.from_wallet == wallet_address,
-                    Transaction.to_wallet == wallet_address
-                )
-            ).order_by(desc(Transaction.created_at)).limit(limit)
+            _GET_USER_TRANSACTIONS, {'address': wallet_address, 'limit': limit}
         )
         return list(result.scalars().all())
     
@@ -419,33 +829,41 @@ class DataAccessLayer:
     # ========================================================================
     
     @staticmethod
-    async def get_platform_stats(session: AsyncSession) -> Dict[str, Any]:
-        """Get platform-wide statistics."""
-        # Total wallets
-        total_wallets_result = await session.execute(select(func.count(Wallet.id)))
-        total_wallets = total_wallets_result.scalar()
-        
-        # Total artists
-        total_artists_result = await session.execute(
-            select(func.count(Wallet.id)).where(Wallet.is_artist == True)
+    @ttl_cache(seconds=5, tables=(Wallet, MusicNFT, VotingRecord, SkipRecord))
+    async def get_platform_stats(
+        session: AsyncSession,
+        approximate: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get platform-wide statistics in a single round trip.
+        
+        Args:
+            session: Database session
+            approximate: On PostgreSQL, read whole-table row counts from
+                planner statistics (pg_class.reltuples) instead of
+                scanning; they drift until the next ANALYZE
+        """
+        conn = await session.connection()
+        estimate = approximate and conn.dialect.name == "postgresql"
+        
+        def row_count(model):
+            if estimate:
+                return select(
+                    cast(func.greatest(_pg_class.c.reltuples, 0), BigInteger)
+                ).where(_pg_class.c.relname == model.__tablename__).scalar_subquery()
+            return select(func.count()).select_from(model).scalar_subquery()
+        
+        stmt = select(
+            row_count(Wallet).label('total_wallets'),
+            select(func.count()).where(Wallet.is_artist == True).scalar_subquery().label('total_artists'),
+            row_count(MusicNFT).label('total_nfts'),
+            row_count(VotingRecord).label('total_votes'),
+            row_count(SkipRecord).label('total_skips'),
+            select(func.coalesce(func.sum(Wallet.balance_dcmx), 0)).scalar_subquery().label('total_balance'),
         )
-        total_artists = total_artists_result.scalar()
-        
-        # Total NFTs
-        total_nfts_result = await session.execute(select(func.count(MusicNFT.id)))
-        total_nfts = total_nfts_result.scalar()
-        
-        # Total votes
-        total_votes_result = await session.execute(select(func.count(VotingRecord.id)))
-        total_votes = total_votes_result.scalar()
-        
-        # Total skips
-        total_skips_result = await session.execute(select(func.count(SkipRecord.id)))
-        total_skips = total_skips_result.scalar()
-        
-        # Total platform balance
-        total_balance_result = await session.execute(select(func.sum(Wallet.balance_dcmx)))
-        total_balance = total_balance_result.scalar() or 0
+        total_wallets, total_artists, total_nfts, total_votes, total_skips, total_balance = (
+            await session.execute(stmt)
+        ).one()
         
         return {
             'total_users': total_wallets,
@@ -457,39 +875,54 @@ class DataAccessLayer:
         }
     
     @staticmethod
+    @ttl_cache(seconds=5, tables=(Wallet, MusicNFT))
     async def get_artist_earnings(
         session: AsyncSession,
         artist_wallet: str
     ) -> Dict[str, Any]:
-        """Get artist earnings summary."""
-        # Get artist wallet
-        wallet = await DataAccessLayer.get_wallet(session, artist_wallet)
-        if not wallet:
+        """Get artist earnings summary in a single round trip."""
+        # Wallet outer-joined to its songs; window aggregates carry the NFT
+        # count and sales total on every row
+        rows = (await session.execute(
+            select(
+                Wallet.username,
+                Wallet.balance_dcmx,
+                func.count(MusicNFT.id).over().label('nfts_created'),
+                func.coalesce(func.sum(MusicNFT.price_dcmx).over(), 0).label('total_sales'),
+                MusicNFT.nft_id,
+                MusicNFT.title,
+                MusicNFT.price_dcmx,
+                MusicNFT.edition,
+                MusicNFT.max_editions,
+                MusicNFT.likes,
+                MusicNFT.dislikes,
+                MusicNFT.listeners,
+            )
+            .outerjoin(MusicNFT, MusicNFT.artist_wallet == Wallet.address)
+            .where(Wallet.address == artist_wallet)
+        )).all()
+        if not rows:
             raise ValueError(f"Artist wallet not found: {artist_wallet}")
-        
-        # Get artist NFTs
-        nfts = await DataAccessLayer.get_artist_nfts(session, artist_wallet)
-        
-        # Calculate total sales
-        total_sales = sum(nft.price_dcmx for nft in nfts)
+        summary = rows[0]
+        songs = [row for row in rows if row.nft_id is not None]
         
         return {
             'artist': artist_wallet,
-            'username': wallet.username,
-            'nfts_created': len(nfts),
-            'total_sales_dcmx': float(total_sales),
-            'current_balance_dcmx': float(wallet.balance_dcmx),
+            'username': summary.username,
+            'nfts_created': summary.nfts_created,
+            'total_sales_dcmx': float(summary.total_sales),
+            'current_balance_dcmx': float(summary.balance_dcmx),
             'songs': [
                 {
-                    'id': nft.nft_id,
-                    'title': nft.title,
-                    'price': float(nft.price_dcmx),
-                    'edition': f"{nft.edition}/{nft.max_editions}",
-                    'likes': nft.likes,
-                    'dislikes': nft.dislikes,
-                    'listeners': nft.listeners
+                    'id': song.nft_id,
+                    'title': song.title,
+                    'price': float(song.price_dcmx),
+                    'edition': f"{song.edition}/{song.max_editions}",
+                    'likes': song.likes,
+                    'dislikes': song.dislikes,
+                    'listeners': song.listeners
                 }
-                for nft in nfts
+                for song in songs
             ]
         }
     
@@ -500,48 +933,66 @@ class DataAccessLayer:
         limit: int = 100
     ) -> List[VotingRecord]:
         """Get user voting history."""
-        result = await session.execute(
+        return [vote async for vote in DataAccessLayer.iter_user_votes(session, user_wallet, limit)]
+    
+    @staticmethod
+    async def iter_user_votes(
+        session: AsyncSession,
+        user_wallet: str,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[VotingRecord]:
+        """Stream user voting history, newest first, STREAM_BATCH_SIZE rows at a time."""
+        result = await session.stream(
             select(VotingRecord).where(
                 VotingRecord.user_wallet == user_wallet
             ).order_by(desc(VotingRecord.voted_at)).limit(limit)
+            .execution_options(yield_per=DataAccessLayer.STREAM_BATCH_SIZE)
         )
-        return list(result.scalars().all())
+        async for vote in result.scalars():
+            yield vote
     
     @staticmethod
     async def get_user_profile_stats(
         session: AsyncSession,
         user_wallet: str
     ) -> Dict[str, Any]:
-        """Get user profile and statistics."""
-        wallet = await DataAccessLayer.get_wallet(session, user_wallet)
-        if not wallet:
+        """Get user profile and statistics in a single round trip."""
+        votes = select(
+            func.count().label('votes_cast'),
+            func.coalesce(func.sum(case((VotingRecord.preference == "like", 1), else_=0)), 0).label('likes'),
+            func.coalesce(func.sum(case((VotingRecord.preference == "dislike", 1), else_=0)), 0).label('dislikes'),
+            func.coalesce(func.sum(VotingRecord.reward_tokens), 0).label('rewards'),
+        ).where(VotingRecord.user_wallet == user_wallet).subquery()
+        
+        skips = select(
+            func.count().label('songs_skipped'),
+            func.coalesce(func.sum(case((SkipRecord.charge_applied < 0, SkipRecord.charge_applied), else_=0)), 0).label('charges'),
+        ).where(SkipRecord.user_wallet == user_wallet).subquery()
+        
+        # Each aggregate subquery yields exactly one row, so joining on true
+        # just attaches the totals to the wallet
+        row = (await session.execute(
+            select(Wallet.username, Wallet.balance_dcmx, Wallet.is_artist, votes, skips)
+            .select_from(Wallet)
+            .join(votes, true())
+            .join(skips, true())
+            .where(Wallet.address == user_wallet)
+        )).first()
+        if row is None:
             raise ValueError(f"User wallet not found: {user_wallet}")
         
-        # Get votes
-        votes = await DataAccessLayer.get_user_votes(session, user_wallet, limit=1000)
-        likes_count = sum(1 for v in votes if v.preference == "like")
-        dislikes_count = sum(1 for v in votes if v.preference == "dislike")
-        total_rewards = sum(v.reward_tokens for v in votes)
-        
-        # Get skips
-        skips_result = await session.execute(
-            select(SkipRecord).where(SkipRecord.user_wallet == user_wallet)
-        )
-        skips = list(skips_result.scalars().all())
-        total_charges = sum(s.charge_applied for s in skips if s.charge_applied < 0)
-        
         return {
             'wallet': user_wallet,
-            'username': wallet.username,
-            'balance_dcmx': float(wallet.balance_dcmx),
-            'is_artist': wallet.is_artist,
+            'username': row.username,
+            'balance_dcmx': float(row.balance_dcmx),
+            'is_artist': row.is_artist,
             'statistics': {
-                'votes_cast': len(votes),
-                'likes': likes_count,
-                'dislikes': dislikes_count,
-                'songs_skipped': len(skips),
-                'total_rewards_earned': float(total_rewards),
-                'total_skip_charges': float(abs(total_charges)),
-                'net_earnings': float(total_rewards + total_charges)
+                'votes_cast': row.votes_cast,
+                'likes': row.likes,
+                'dislikes': row.dislikes,
+                'songs_skipped': row.songs_skipped,
+                'total_rewards_earned': float(row.rewards),
+                'total_skip_charges': float(abs(row.charges)),
+                'net_earnings': float(row.rewards + row.charges)
             }
         }
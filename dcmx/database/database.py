@@ -1,19 +1,70 @@
 """Database connection and session management for DCMX."""
 
 import logging
+import threading
 from contextlib import contextmanager, asynccontextmanager
 from typing import Generator, AsyncGenerator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.pool import QueuePool, NullPool
+from sqlalchemy.engine import AdaptedConnection, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
-from dcmx.database.config import config
-from dcmx.database.models import Base
+from dcmx.database.config import get_config
+from dcmx.database.connection import _batching_options, _server_settings_options
+from dcmx.database.dal import DALSession
+from dcmx.database.models import Base, create_all, drop_all
 
 logger = logging.getLogger(__name__)
 
+# Compiled statements SQLAlchemy keeps per engine (default 500); the DAL's
+# analytics and bulk paths add many distinct shapes on top of the ORM's own
+QUERY_CACHE_SIZE = 1200
+
+# Server-side prepared statements asyncpg keeps per connection
+ASYNCPG_STATEMENT_CACHE_SIZE = 512
+
+# Upper bound on pool_recycle behind PgBouncer; keep it under the bouncer's
+# server_idle_timeout so the pool never hands out a connection it dropped
+PGBOUNCER_POOL_RECYCLE = 60
+
+# Applied to every new SQLite connection. WAL lets readers run alongside the
+# writer and commits append to the log instead of fsyncing the database;
+# synchronous=NORMAL is durable in WAL mode except across power loss
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+)
+_SQLITE_PRAGMA_SCRIPT = "".join(f"{pragma};\n" for pragma in SQLITE_PRAGMAS)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Connect event handler that tunes a new SQLite connection in one call."""
+    if isinstance(dbapi_connection, AdaptedConnection):
+        # aiosqlite: the adapter has no executescript, the driver's is a coroutine
+        dbapi_connection.run_async(lambda conn: conn.executescript(_SQLITE_PRAGMA_SCRIPT))
+    else:
+        dbapi_connection.executescript(_SQLITE_PRAGMA_SCRIPT)
+
+
+def _sqlite_pool_options(database_url: str) -> dict:
+    """
+    Pool settings for a SQLite engine.
+    
+    File databases use the dialect's default queue pool, which keeps
+    connections open between sessions so the file open and connect
+    PRAGMAs happen once per connection rather than once per session. An
+    in-memory database exists only inside its one connection, so it is
+    shared through StaticPool.
+    """
+    if make_url(database_url).database in (None, "", ":memory:"):
+        return {'poolclass': StaticPool, 'connect_args': {'check_same_thread': False}}
+    return {}
+
 
 class DatabaseManager:
     """Manages database connections and sessions."""
@@ -25,7 +76,7 @@ class DatabaseManager:
         Args:
             database_config: Optional DatabaseConfig instance. Uses global config if None.
         """
-        self.config = database_config or config
+        self.config = database_config or get_config()
         
         # Synchronous engine
         self.sync_engine = None
@@ -35,92 +86,145 @@ class DatabaseManager:
         self.async_engine = None
         self.AsyncSessionLocal = None
         
+        # Table names known to exist since create_tables ran; None when the
+        # schema has to be inspected
+        self._table_cache = None
+        
+        # Serializes engine creation; the async path has no await points,
+        # so this also keeps threads running their own event loops from
+        # building a second engine
+        self._init_lock = threading.Lock()
+        
         self._initialized = False
     
-    def initialize_sync(self):
-        """Initialize synchronous database engine and session maker."""
-        if self.sync_engine is not None:
-            logger.warning("Sync engine already initialized")
-            return
+    def _pool_health_options(self, pool_recycle: int) -> dict:
+        """
+        PostgreSQL pool liveness settings.
+        
+        In PgBouncer transaction mode the pre-ping SELECT 1 costs a round
+        trip per checkout and can leave a server connection idle in
+        transaction, so it is turned off and a short pool_recycle retires
+        connections before the bouncer does.
+        """
+        if self.config.pgbouncer_mode:
+            return {
+                'pool_pre_ping': False,
+                'pool_recycle': min(pool_recycle, PGBOUNCER_POOL_RECYCLE),
+            }
+        return {
+            'pool_pre_ping': self.config.pool_pre_ping,
+            'pool_recycle': pool_recycle,
+        }
+    
+    def _engine_kwargs(self, is_async: bool) -> dict:
+        """
+        create_engine/create_async_engine options for the configured database.
+        
+        Both engines take their pooling, liveness and startup settings from
+        here so the sync and async pools cannot drift apart.
+        """
+        url = self.config.get_async_url() if is_async else self.config.get_sync_url()
+        kwargs = {
+            'query_cache_size': QUERY_CACHE_SIZE,
+            'echo': False,  # Set to True for SQL debugging
+        }
         
-        # Create engine with connection pooling
         if self.config.use_sqlite:
-            # SQLite-specific configuration
-            self.sync_engine = create_engine(
-                self.config.get_sync_url(),
-                poolclass=NullPool,
-                echo=False,  # Set to True for SQL debugging
-            )
-        else:
-            # PostgreSQL configuration
-            self.sync_engine = create_engine(
-                self.config.get_sync_url(),
-                poolclass=QueuePool,
-                pool_size=self.config.pool_size,
-                max_overflow=self.config.max_overflow,
-                pool_timeout=self.config.pool_timeout,
-                pool_recycle=self.config.pool_recycle,
-                echo=False,  # Set to True for SQL debugging
-            )
+            kwargs.update(_sqlite_pool_options(url))
+            return kwargs
+        
+        kwargs.update(
+            poolclass=AsyncAdaptedQueuePool if is_async else QueuePool,
+            pool_size=self.config.async_pool_size if is_async else self.config.pool_size,
+            max_overflow=self.config.async_max_overflow if is_async else self.config.max_overflow,
+            pool_timeout=self.config.pool_timeout,
+            **self._pool_health_options(
+                self.config.async_pool_recycle if is_async else self.config.pool_recycle
+            ),
+            # Multi-row VALUES inserts, plus psycopg2 execute_batch
+            **_batching_options(url),
+        )
         
-        # Create session maker
-        self.SyncSessionLocal = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self.sync_engine
+        # PgBouncer rejects unknown startup parameters
+        connect_args = {} if self.config.pgbouncer_mode else dict(
+            _server_settings_options(url).get('connect_args', {})
         )
+        if is_async:
+            connect_args['prepared_statement_cache_size'] = (
+                0 if self.config.pgbouncer_mode else ASYNCPG_STATEMENT_CACHE_SIZE
+            )
+        if connect_args:
+            kwargs['connect_args'] = connect_args
         
-        logger.info(f"Sync database engine initialized: {self.config.get_sync_url().split('@')[-1]}")
+        return kwargs
+    
+    def initialize_sync(self):
+        """Initialize synchronous database engine and session maker."""
+        with self._init_lock:
+            if self.sync_engine is not None:
+                logger.warning("Sync engine already initialized")
+                return
+            
+            self.sync_engine = create_engine(self.config.get_sync_url(), **self._engine_kwargs(is_async=False))
+            if self.config.use_sqlite:
+                event.listen(self.sync_engine, "connect", _set_sqlite_pragmas)
+            
+            # Create session maker
+            self.SyncSessionLocal = sessionmaker(
+                class_=DALSession,
+                autocommit=False,
+                autoflush=False,
+                expire_on_commit=False,
+                bind=self.sync_engine
+            )
+            
+            logger.info(f"Sync database engine initialized: {self.config.get_sync_url().split('@')[-1]}")
     
     async def initialize_async(self):
         """Initialize asynchronous database engine and session maker."""
-        if self.async_engine is not None:
-            logger.warning("Async engine already initialized")
-            return
-        
-        # Create async engine
-        if self.config.use_sqlite:
-            # SQLite-specific configuration
-            self.async_engine = create_async_engine(
-                self.config.get_async_url(),
-                poolclass=NullPool,
-                echo=False,  # Set to True for SQL debugging
-            )
-        else:
-            # PostgreSQL configuration
-            self.async_engine = create_async_engine(
-                self.config.get_async_url(),
-                poolclass=QueuePool,
-                pool_size=self.config.async_pool_size,
-                max_overflow=self.config.async_max_overflow,
-                echo=False,  # Set to True for SQL debugging
+        with self._init_lock:
+            if self.async_engine is not None:
+                logger.warning("Async engine already initialized")
+                return
+            
+            self.async_engine = create_async_engine(self.config.get_async_url(), **self._engine_kwargs(is_async=True))
+            if self.config.use_sqlite:
+                event.listen(self.async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+            
+            # Create async session maker
+            self.AsyncSessionLocal = async_sessionmaker(
+                self.async_engine,
+                class_=AsyncSession,
+                sync_session_class=DALSession,
+                expire_on_commit=False,
             )
-        
-        # Create async session maker
-        self.AsyncSessionLocal = async_sessionmaker(
-            self.async_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-        
-        logger.info(f"Async database engine initialized: {self.config.get_async_url().split('@')[-1]}")
+            
+            logger.info(f"Async database engine initialized: {self.config.get_async_url().split('@')[-1]}")
     
     def create_tables(self):
         """Create all database tables (synchronous)."""
+        if self._table_cache is not None:
+            return
+        
         if self.sync_engine is None:
             self.initialize_sync()
         
-        Base.metadata.create_all(bind=self.sync_engine)
+        create_all(self.sync_engine)
+        self._table_cache = frozenset(Base.metadata.tables)
         logger.info("Database tables created")
     
     async def create_tables_async(self):
         """Create all database tables (asynchronous)."""
+        if self._table_cache is not None:
+            return
+        
         if self.async_engine is None:
             await self.initialize_async()
         
         async with self.async_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(create_all)
         
+        self._table_cache = frozenset(Base.metadata.tables)
         logger.info("Database tables created (async)")
     
     def drop_tables(self):
@@ -128,7 +232,8 @@ class DatabaseManager:
         if self.sync_engine is None:
             self.initialize_sync()
         
-        Base.metadata.drop_all(bind=self.sync_engine)
+        self._table_cache = None
+        drop_all(self.sync_engine)
         logger.warning("All database tables dropped")
     
     async def drop_tables_async(self):
@@ -136,11 +241,27 @@ class DatabaseManager:
         if self.async_engine is None:
             await self.initialize_async()
         
+        self._table_cache = None
         async with self.async_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(drop_all)
         
         logger.warning("All database tables dropped (async)")
     
+    def get_table_names(self) -> frozenset:
+        """
+        Names of the tables in the database.
+        
+        Served from memory after create_tables; otherwise the schema is
+        inspected, which costs a catalog query per call.
+        """
+        if self._table_cache is not None:
+            return self._table_cache
+        
+        if self.sync_engine is None:
+            self.initialize_sync()
+        
+        return frozenset(inspect(self.sync_engine).get_table_names())
+    
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """
@@ -170,7 +291,7 @@ class DatabaseManager:
             session.close()
     
     @asynccontextmanager
-    async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
+    async def get_async_session(self, read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
         """
         Get an asynchronous database session.
         
@@ -180,6 +301,10 @@ class DatabaseManager:
                 session.add(obj)
                 await session.commit()
         
+        Args:
+            read_only: Run in autocommit mode and skip the closing commit,
+                saving the BEGIN/COMMIT round trips of a SELECT-only session
+        
         Yields:
             AsyncSession: SQLAlchemy async session
         """
@@ -188,8 +313,11 @@ class DatabaseManager:
         
         async with self.AsyncSessionLocal() as session:
             try:
+                if read_only:
+                    await session.connection(execution_options={'isolation_level': 'AUTOCOMMIT'})
                 yield session
-                await session.commit()
+                if not read_only:
+                    await session.commit()
             except Exception as e:
                 await session.rollback()
                 logger.error(f"Database async session error: {e}")
@@ -214,13 +342,18 @@ class DatabaseManager:
 
 # Global database manager instance
 _db_manager = None
+_db_manager_lock = threading.Lock()
 
 
 def get_db_manager() -> DatabaseManager:
     """Get or create global database manager instance."""
     global _db_manager
     if _db_manager is None:
-        _db_manager = DatabaseManager()
+        # Double-checked so concurrent cold starts build a single manager
+        # (and a single set of pools) without locking every later call
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
     return _db_manager
 
 
@@ -237,7 +370,7 @@ def get_session() -> Generator[Session, None, None]:
         yield session
 
 
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_async_session(read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
     """
     Get an asynchronous database session (convenience function).
     
@@ -246,7 +379,7 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             # Use session
     """
     db_manager = get_db_manager()
-    async with db_manager.get_async_session() as session:
+    async with db_manager.get_async_session(read_only=read_only) as session:
         yield session
 
 
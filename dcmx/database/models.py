@@ -10,22 +10,87 @@ All tables required for replacing in-memory and file-based storage:
 - System configuration (settings, admin actions, multisig)
 """
 
+import os
+import time
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Set
 
 from sqlalchemy import (
     Column, String, Integer, Float, Boolean, DateTime, Text, JSON, ForeignKey,
-    Enum as SQLEnum, Index, UniqueConstraint, CheckConstraint, DECIMAL, BigInteger
+    Enum as SQLEnum, Index, UniqueConstraint, CheckConstraint, DECIMAL, BigInteger,
+    inspect
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, INET, ARRAY as PG_ARRAY
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
 from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
+# Databases whose schema this process has already created
+_created_databases: Set[str] = set()
+
+
+def _database_key(bind) -> Optional[str]:
+    """Driver-neutral identity of a database, or None for in-memory SQLite."""
+    url = bind.engine.url
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return None
+    return url.set(drivername=url.get_backend_name()).render_as_string(hide_password=True)
+
+
+def create_all(bind) -> bool:
+    """
+    Create all tables once per database per process.
+    
+    DatabaseConnection and DatabaseManager (sync or async) share this
+    registry, so a process that uses several of them only checks the
+    schema for the first. That check is a single table-name listing;
+    per-table existence checks only run for tables it did not report,
+    so restarting against an existing schema issues no DDL at all.
+    
+    Args:
+        bind: Engine or Connection (async callers pass it via run_sync)
+        
+    Returns:
+        True if tables were created, False if already done
+    """
+    key = _database_key(bind)
+    if key is not None and key in _created_databases:
+        return False
+    existing = set(inspect(bind).get_table_names())
+    missing = [t for t in Base.metadata.sorted_tables if t.name not in existing]
+    if missing:
+        Base.metadata.create_all(bind=bind, tables=missing, checkfirst=True)
+    if key is not None:
+        _created_databases.add(key)
+    return True
+
+
+def drop_all(bind):
+    """Drop all tables and forget that they were created."""
+    Base.metadata.drop_all(bind=bind)
+    _created_databases.discard(_database_key(bind))
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7).
+    
+    The leading 48 bits are the Unix time in milliseconds, so new keys
+    land at the right edge of a btree index instead of at random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # variant
+    return uuid.UUID(int=value)
+
+
+def _transaction_id() -> str:
+    """Default platform transaction id."""
+    return f"tx_{uuid7().hex}"
+
 
 # Custom UUID type that works with both PostgreSQL and SQLite
 class UUID(TypeDecorator):
@@ -91,7 +156,7 @@ class AcceptanceRecord(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     __table_args__ = (
-        Index('idx_acceptance_user_doc', 'user_id', 'document_type'),
+        Index('idx_acceptance_user_doc_time', user_id, document_type, accepted_at.desc()),
         Index('idx_acceptance_wallet', 'wallet_address'),
         Index('idx_acceptance_date', 'accepted_at'),
     )
@@ -197,11 +262,18 @@ class Wallet(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     last_activity = Column(DateTime, default=datetime.utcnow)
     
-    # Relationships
-    nfts = relationship("MusicNFT", back_populates="artist_wallet_rel", foreign_keys="MusicNFT.artist_wallet")
-    reward_claims = relationship("RewardClaim", back_populates="user_wallet_rel")
-    transactions_from = relationship("Transaction", foreign_keys="Transaction.from_wallet", back_populates="from_wallet_rel")
-    transactions_to = relationship("Transaction", foreign_keys="Transaction.to_wallet", back_populates="to_wallet_rel")
+    # Relationships (collections raise on lazy load; query them explicitly
+    # or use selectinload)
+    nfts = relationship("MusicNFT", back_populates="artist_wallet_rel", foreign_keys="MusicNFT.artist_wallet", lazy="raise")
+    reward_claims = relationship("RewardClaim", back_populates="user_wallet_rel", lazy="raise")
+    transactions_from = relationship("Transaction", foreign_keys="Transaction.from_wallet", back_populates="from_wallet_rel", lazy="raise")
+    transactions_to = relationship("Transaction", foreign_keys="Transaction.to_wallet", back_populates="to_wallet_rel", lazy="raise")
+    
+    __table_args__ = (
+        # Partial index backing the total_artists count
+        Index('idx_wallet_artist', 'address',
+              postgresql_where=(is_artist == True), sqlite_where=(is_artist == True)),
+    )
 
 
 class User(Base):
@@ -234,7 +306,7 @@ class User(Base):
     
     # Relationships
     wallet = relationship("Wallet")
-    roles = relationship("UserRole", back_populates="user")
+    roles = relationship("UserRole", back_populates="user", foreign_keys="UserRole.user_id")
     sessions = relationship("UserSession", back_populates="user")
 
 
@@ -334,7 +406,7 @@ class MusicNFT(Base):
     # Metadata
     title = Column(String(255), nullable=False, index=True)
     artist = Column(String(255), nullable=False)
-    artist_wallet = Column(String(42), ForeignKey("wallets.address"), nullable=False)
+    artist_wallet = Column(String(42), ForeignKey("wallets.address"), nullable=False, index=True)
     artist_username = Column(String(255))
     
     # Edition
@@ -361,8 +433,8 @@ class MusicNFT(Base):
     # Relationships
     certificate = relationship("NFTCertificate")
     artist_wallet_rel = relationship("Wallet", back_populates="nfts", foreign_keys=[artist_wallet])
-    sales = relationship("NFTSale", back_populates="nft")
-    royalties = relationship("NFTRoyalty", back_populates="nft")
+    sales = relationship("NFTSale", back_populates="nft", lazy="raise")
+    royalties = relationship("NFTRoyalty", back_populates="nft", lazy="raise")
 
 
 class NFTSale(Base):
@@ -389,7 +461,7 @@ class NFTSale(Base):
     sale_date = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     
     # Relationships
-    nft = relationship("MusicNFT", back_populates="sales")
+    nft = relationship("MusicNFT", back_populates="sales", lazy="raise")
 
 
 class NFTRoyalty(Base):
@@ -589,7 +661,7 @@ class Transaction(Base):
     __tablename__ = "transactions"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    transaction_id = Column(String(255), unique=True, nullable=False, index=True)
+    transaction_id = Column(String(255), unique=True, nullable=False, index=True, default=_transaction_id)
     
     # Parties
     from_wallet = Column(String(42), ForeignKey("wallets.address"), nullable=False, index=True)
@@ -616,6 +688,11 @@ class Transaction(Base):
     # Relationships
     from_wallet_rel = relationship("Wallet", foreign_keys=[from_wallet], back_populates="transactions_from")
     to_wallet_rel = relationship("Wallet", foreign_keys=[to_wallet], back_populates="transactions_to")
+    
+    __table_args__ = (
+        Index('idx_tx_from_time', from_wallet, created_at.desc()),
+        Index('idx_tx_to_time', to_wallet, created_at.desc()),
+    )
 
 
 class VotingRecord(Base):
@@ -635,6 +712,8 @@ class VotingRecord(Base):
     
     __table_args__ = (
         Index('idx_vote_user_nft', 'user_wallet', 'nft_id', 'voted_at'),
+        Index('idx_vote_user_preference', 'user_wallet', 'preference'),
+        Index('idx_vote_user_time', user_wallet, voted_at.desc()),
     )
 
 
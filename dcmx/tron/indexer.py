@@ -4,10 +4,9 @@ import asyncio
 import logging
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
 
 from .client import TronClient
 from .config import TronConfig
@@ -140,45 +139,72 @@ class BlockchainIndexer:
                 logger.warning(f"Block {block_number} not found")
                 return
             
-            # Process transactions in block
+            # Process transactions in block, collecting rows for one bulk write
             transactions = block.get('transactions', [])
+            tx_rows = []
+            event_rows = []
             
             for tx in transactions:
-                await self._index_transaction(tx, block_number)
+                tx_row, tx_event_rows = await self._index_transaction(tx, block_number)
+                if tx_row:
+                    tx_rows.append(tx_row)
+                event_rows.extend(tx_event_rows)
+            
+            self._save_rows(TransactionIndex, tx_rows, "transactions")
+            self._save_rows(BlockchainEventModel, event_rows, "events")
             
         except Exception as e:
             logger.error(f"Failed to index block {block_number}: {e}")
     
-    async def _index_transaction(self, tx: Dict[str, Any], block_number: int):
+    def _save_rows(self, model, rows: List[Dict[str, Any]], label: str):
+        """Bulk insert indexed rows, skipping ones already indexed."""
+        try:
+            self.db.bulk_insert(model, rows, ignore_conflicts=True)
+        except Exception as e:
+            logger.error(f"Failed to save {label}: {e}")
+    
+    async def _index_transaction(
+        self,
+        tx: Dict[str, Any],
+        block_number: int
+    ) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
         """
         Index a transaction and its events.
         
         Args:
             tx: Transaction data
             block_number: Block number
+            
+        Returns:
+            Transaction row and blockchain event rows to insert
         """
         tx_hash = tx.get('txID', '')
         
         # Get transaction info (includes events/logs)
         tx_info = self.client.get_transaction_info(tx_hash)
         if not tx_info:
-            return
+            return None, []
         
         # Index transaction
-        await self._save_transaction(tx, tx_info, block_number)
+        tx_row = self._transaction_row(tx, tx_info, block_number)
         
         # Index events from logs
+        event_rows = []
         logs = tx_info.get('log', [])
         for log in logs:
-            await self._index_event(log, tx_hash, block_number)
+            event_row = await self._index_event(log, tx_hash, block_number)
+            if event_row:
+                event_rows.append(event_row)
+        
+        return tx_row, event_rows
     
-    async def _save_transaction(
+    def _transaction_row(
         self,
         tx: Dict[str, Any],
         tx_info: Dict[str, Any],
         block_number: int
-    ):
-        """Save transaction to database."""
+    ) -> Optional[Dict[str, Any]]:
+        """Build the transaction_index row for a transaction."""
         try:
             tx_hash = tx.get('txID', '')
             raw_data = tx.get('raw_data', {})
@@ -200,33 +226,28 @@ class BlockchainIndexer:
                 tx.get('raw_data', {}).get('timestamp', 0) / 1000
             )
             
-            # Save to database
-            with self.db.get_session() as session:
-                tx_record = TransactionIndex(
-                    tx_hash=tx_hash,
-                    from_address=from_address,
-                    to_address=to_address,
-                    value=value,
-                    token='TRX',
-                    block_number=block_number,
-                    timestamp=timestamp,
-                    status='success' if tx_info.get('receipt', {}).get('result') == 'SUCCESS' else 'failed',
-                    gas_used=tx_info.get('receipt', {}).get('energy_usage', 0),
-                )
-                session.add(tx_record)
-                
-        except IntegrityError:
-            # Transaction already indexed
-            pass
+            return {
+                'tx_hash': tx_hash,
+                'from_address': from_address,
+                'to_address': to_address,
+                'value': value,
+                'token': 'TRX',
+                'block_number': block_number,
+                'timestamp': timestamp,
+                'status': 'success' if tx_info.get('receipt', {}).get('result') == 'SUCCESS' else 'failed',
+                'gas_used': tx_info.get('receipt', {}).get('energy_usage', 0),
+            }
+            
         except Exception as e:
-            logger.error(f"Failed to save transaction: {e}")
+            logger.error(f"Failed to parse transaction: {e}")
+            return None
     
     async def _index_event(
         self,
         log: Dict[str, Any],
         tx_hash: str,
         block_number: int
-    ):
+    ) -> Optional[Dict[str, Any]]:
         """
         Index an event from transaction log.
         
@@ -234,47 +255,33 @@ class BlockchainIndexer:
             log: Event log data
             tx_hash: Transaction hash
             block_number: Block number
+            
+        Returns:
+            blockchain_events row to insert, or None if unparseable
         """
         try:
             # Parse event
             event = EventParser.parse_event(log)
             if not event:
-                return
-            
-            # Save to blockchain_events table
-            await self._save_event(event, tx_hash, block_number)
+                return None
             
             # Index to specific tables based on event type
             await self._index_specific_event(event)
             
+            # Row for blockchain_events table
+            return {
+                'event_type': event.event_type,
+                'contract_address': event.contract_address,
+                'transaction_hash': tx_hash,
+                'block_number': block_number,
+                'log_index': event.log_index,
+                'event_data': event.event_data,
+                'indexed_at': datetime.utcnow(),
+            }
+            
         except Exception as e:
             logger.error(f"Failed to index event: {e}")
-    
-    async def _save_event(
-        self,
-        event: BlockchainEvent,
-        tx_hash: str,
-        block_number: int
-    ):
-        """Save event to blockchain_events table."""
-        try:
-            with self.db.get_session() as session:
-                event_record = BlockchainEventModel(
-                    event_type=event.event_type,
-                    contract_address=event.contract_address,
-                    transaction_hash=tx_hash,
-                    block_number=block_number,
-                    log_index=event.log_index,
-                    event_data=event.event_data,
-                    indexed_at=datetime.utcnow(),
-                )
-                session.add(event_record)
-                
-        except IntegrityError:
-            # Event already indexed
-            pass
-        except Exception as e:
-            logger.error(f"Failed to save event: {e}")
+            return None
     
     async def _index_specific_event(self, event: BlockchainEvent):
         """
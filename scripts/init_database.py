@@ -106,7 +106,7 @@ def main():
     # Show status if requested
     if args.status:
         logger.info("Checking database migration status...")
-        status = migration.get_migration_status()
+        status = migration.get_migration_status(detailed=True)
         
         print("\n" + "="*60)
         print("DATABASE MIGRATION STATUS")
@@ -181,7 +181,7 @@ def main():
         
         # Show final status
         logger.info("\n" + "="*60)
-        status = migration.get_migration_status()
+        status = migration.get_migration_status(detailed=True)
         logger.info(f"Tables created: {status['table_count']}")
         logger.info(f"Configurations: {status.get('config_count', 0)}")
         logger.info("="*60)
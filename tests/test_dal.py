@@ -0,0 +1,574 @@
+"""Tests for DataAccessLayer functionality."""
+
+import asyncio
+import pytest
+import tempfile
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from dcmx.database import dal
+from dcmx.database.dal import DALSession, DataAccessLayer, invalidate_analytics_cache, invalidate_row_cache
+from dcmx.database.models import Base, ListeningReward, MusicNFT, SkipRecord, Transaction, VotingRecord, Wallet, uuid7
+
+
+@pytest.fixture
+async def session_factory():
+    """Create an async SQLite database with all tables."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmpdir) / 'dcmx.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        invalidate_analytics_cache()
+        invalidate_row_cache()
+        yield async_sessionmaker(
+            engine, class_=AsyncSession, sync_session_class=DALSession, expire_on_commit=False
+        )
+        await engine.dispose()
+
+
+async def _count(session_factory, model):
+    """Count committed rows of a model."""
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(model))
+
+
+@contextmanager
+def count_queries(session_factory):
+    """Collect the SQL statements executed on the factory's engine."""
+    engine = session_factory.kw["bind"].sync_engine
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class TestWriters:
+    """Test DAL writer transaction handling."""
+
+    @pytest.mark.asyncio
+    async def test_writer_commits_own_transaction(self, session_factory):
+        """Test a writer called on a fresh session commits."""
+        async with session_factory() as session:
+            wallet = await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+
+        assert wallet.id is not None
+        assert wallet.created_at is not None
+        assert await _count(session_factory, Wallet) == 1
+
+    @pytest.mark.asyncio
+    async def test_create_wallet_returns_existing(self, session_factory):
+        """Test creating a wallet twice returns the first one."""
+        async with session_factory() as session:
+            first = await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+        async with session_factory() as session:
+            second = await DataAccessLayer.create_wallet(session, "0xabc", "mallory")
+
+        assert second.id == first.id
+        assert second.username == "alice"
+        assert await _count(session_factory, Wallet) == 1
+
+    @pytest.mark.asyncio
+    async def test_writers_share_caller_transaction(self, session_factory):
+        """Test writers inside a caller's transaction only flush."""
+        async with session_factory() as session:
+            async with session.begin():
+                await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+                for i in range(3):
+                    vote = await DataAccessLayer.create_voting_record(
+                        session, "0xabc", f"nft{i}", "like", reward_tokens=1
+                    )
+                    assert vote.id is not None
+                assert await _count(session_factory, VotingRecord) == 0
+
+        assert await _count(session_factory, VotingRecord) == 3
+
+    @pytest.mark.asyncio
+    async def test_caller_rollback_discards_writes(self, session_factory):
+        """Test writes staged in a caller's transaction roll back with it."""
+        async with session_factory() as session:
+            await DataAccessLayer.get_wallet(session, "0xabc")
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+            await session.rollback()
+
+        assert await _count(session_factory, Wallet) == 0
+
+
+    @pytest.mark.asyncio
+    async def test_update_wallet_balance(self, session_factory):
+        """Test balance updates apply in SQL and refresh the loaded wallet."""
+        async with session_factory() as session:
+            wallet = await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+            await DataAccessLayer.update_wallet_balance(session, "0xabc", 10)
+            await DataAccessLayer.update_wallet_balance(session, "0xabc", 3, "subtract")
+            updated = await DataAccessLayer.update_wallet_balance(session, "0xabc", 2.5, "add")
+            balance = wallet.balance_dcmx
+
+            with pytest.raises(ValueError):
+                await DataAccessLayer.update_wallet_balance(session, "0xmissing", 1)
+            with pytest.raises(ValueError):
+                await DataAccessLayer.update_wallet_balance(session, "0xabc", 1, "multiply")
+
+        async with session_factory() as session:
+            stored = await DataAccessLayer.get_wallet(session, "0xabc")
+
+        assert updated is wallet
+        assert float(balance) == 9.5
+        assert float(stored.balance_dcmx) == 9.5
+
+    @pytest.mark.asyncio
+    async def test_writers_use_one_statement(self, session_factory):
+        """Test writers don't re-SELECT after INSERT or UPDATE."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+
+        async with session_factory() as session:
+            with count_queries(session_factory) as statements:
+                vote = await DataAccessLayer.create_voting_record(session, "0xabc", "nft0", "like")
+                wallet = await DataAccessLayer.update_wallet_balance(session, "0xabc", 1)
+
+        assert len(statements) == 2
+        assert vote.voted_at is not None
+        assert float(wallet.balance_dcmx) == 1.0
+
+class TestBulkWriters:
+    """Test batched telemetry ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_records(self, session_factory):
+        """Test bulk writers insert every row in one call."""
+        rows = [{"user_wallet": "0xabc", "nft_id": f"nft{i}"} for i in range(150)]
+
+        async with session_factory() as session:
+            assert await DataAccessLayer.bulk_create_voting_records(
+                session, [{**row, "preference": "like"} for row in rows]
+            ) == 150
+            assert await DataAccessLayer.bulk_create_skip_records(
+                session, [{**row, "completion_percentage": 10.0} for row in rows[:5]]
+            ) == 5
+            assert await DataAccessLayer.bulk_create_listening_rewards(
+                session,
+                [{**row, "listen_duration_seconds": 60, "completion_percentage": 50.0, "total_reward": 1}
+                 for row in rows[:3]],
+            ) == 3
+
+        assert await _count(session_factory, VotingRecord) == 150
+        assert await _count(session_factory, SkipRecord) == 5
+        assert await _count(session_factory, ListeningReward) == 3
+
+    def test_with_defaults_fills_client_defaults(self):
+        """Test rows prepared for COPY get ids and timestamps."""
+        row = DataAccessLayer._with_defaults(
+            VotingRecord, [{"user_wallet": "0xabc", "nft_id": "nft1", "preference": "like"}]
+        )[0]
+
+        assert row["id"] is not None
+        assert row["voted_at"] is not None
+        assert row["reward_tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_transactions(self, session_factory):
+        """Test bulk transactions return ids in row order."""
+        rows = [
+            {"from_wallet": "0xabc", "to_wallet": "0xdef", "amount_dcmx": i, "transaction_type": "transfer"}
+            for i in range(5)
+        ]
+
+        async with session_factory() as session:
+            ids = await DataAccessLayer.bulk_create_transactions(session, rows)
+
+        async with session_factory() as session:
+            stored = {t.id: t for t in (await session.scalars(select(Transaction))).all()}
+
+        assert [int(stored[i].amount_dcmx) for i in ids] == [0, 1, 2, 3, 4]
+        assert all(t.status == "completed" and t.transaction_id.startswith("tx_") for t in stored.values())
+
+    @pytest.mark.asyncio
+    async def test_transaction_ids_are_time_ordered(self, session_factory):
+        """Test default transaction ids sort in creation order."""
+        async with session_factory() as session:
+            first = await DataAccessLayer.create_transaction(session, "0xabc", "0xdef", 1, "transfer")
+            await asyncio.sleep(0.002)
+            second = await DataAccessLayer.create_transaction(session, "0xabc", "0xdef", 2, "transfer")
+            custom = await DataAccessLayer.create_transaction(
+                session, "0xabc", "0xdef", 3, "transfer", transaction_id="tx_custom"
+            )
+
+        assert first.transaction_id.startswith("tx_")
+        assert first.transaction_id < second.transaction_id
+        assert custom.transaction_id == "tx_custom"
+
+    def test_uuid7_layout(self):
+        """Test uuid7 sets the version and variant bits."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+
+
+class TestReads:
+    """Test DAL history queries."""
+
+    @pytest.mark.asyncio
+    async def test_user_transactions_merges_both_sides(self, session_factory):
+        """Test sent and received transactions are merged newest first."""
+        start = datetime(2024, 1, 1)
+        parties = [("0xabc", "0xdef"), ("0xdef", "0xabc"), ("0xabc", "0xabc"), ("0xdef", "0x123"), ("0x123", "0xabc")]
+        rows = [
+            {"from_wallet": src, "to_wallet": dst, "amount_dcmx": i,
+             "transaction_type": "transfer", "created_at": start + timedelta(minutes=i)}
+            for i, (src, dst) in enumerate(parties)
+        ]
+
+        async with session_factory() as session:
+            await DataAccessLayer.bulk_create_transactions(session, rows)
+            history = await DataAccessLayer.get_user_transactions(session, "0xabc")
+            latest = await DataAccessLayer.get_user_transactions(session, "0xabc", limit=2)
+
+        assert [int(t.amount_dcmx) for t in history] == [4, 2, 1, 0]
+        assert [int(t.amount_dcmx) for t in latest] == [4, 2]
+
+    @pytest.mark.asyncio
+    async def test_collections_raise_on_lazy_load(self, session_factory):
+        """Test hot relationships must be loaded explicitly."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice", is_artist=True)
+            await DataAccessLayer.create_nft(session, "nft0", "Song", "0xabc", 10, 1, 10, "hash0")
+            await DataAccessLayer.record_nft_purchase(session, "nft0", "0xdef", "0xabc", 10)
+
+        async with session_factory() as session:
+            wallet = await DataAccessLayer.get_wallet(session, "0xabc")
+            with pytest.raises(InvalidRequestError):
+                wallet.nfts
+
+            nft = await session.scalar(
+                select(MusicNFT).options(selectinload(MusicNFT.sales)).where(MusicNFT.nft_id == "nft0")
+            )
+            assert [float(sale.price_dcmx) for sale in nft.sales] == [10.0]
+
+    @pytest.mark.asyncio
+    async def test_streaming_readers(self, session_factory):
+        """Test iter_* readers stream every row across fetch batches."""
+        rows = [
+            {"user_wallet": "0xabc", "nft_id": f"nft{i}", "preference": "like",
+             "voted_at": datetime(2024, 1, 1) + timedelta(minutes=i)}
+            for i in range(5)
+        ]
+
+        async with session_factory() as session:
+            await DataAccessLayer.bulk_create_voting_records(session, rows)
+
+        async with session_factory() as session:
+            with patch.object(DataAccessLayer, "STREAM_BATCH_SIZE", 2):
+                streamed = [vote.nft_id async for vote in DataAccessLayer.iter_user_votes(session, "0xabc")]
+                latest = await DataAccessLayer.get_user_votes(session, "0xabc", limit=3)
+
+        assert streamed == ["nft4", "nft3", "nft2", "nft1", "nft0"]
+        assert [vote.nft_id for vote in latest] == ["nft4", "nft3", "nft2"]
+
+    @pytest.mark.asyncio
+    async def test_nft_reads_are_cached(self, session_factory):
+        """Test NFT lookups hit the row cache until a change to the NFT commits."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_nft(session, "nft1", "Song", "0xabc", 10, 1, 10, "hash1")
+        async with session_factory() as session:
+            await DataAccessLayer.get_nft(session, "nft1")
+
+        async with session_factory() as session:
+            with count_queries(session_factory) as statements:
+                cached = await DataAccessLayer.get_nft(session, "nft1")
+            assert statements == []
+            assert cached.title == "Song"
+            assert cached in session
+
+            cached.title = "Remix"
+            await session.commit()
+
+        async with session_factory() as session:
+            with count_queries(session_factory) as statements:
+                fresh = await DataAccessLayer.get_nft(session, "nft1")
+
+        assert len(statements) == 1
+        assert fresh.title == "Remix"
+
+    @pytest.mark.asyncio
+    async def test_plain_sessions_skip_row_cache(self, session_factory):
+        """Test sessions that are not DALSessions neither run the hooks nor use the cache."""
+        engine = session_factory.kw["bind"]
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await session.execute(
+                insert(MusicNFT),
+                {"nft_id": "nft1", "title": "Song", "artist": "Artist", "artist_wallet": "0xabc",
+                 "edition": 1, "max_editions": 10, "price_dcmx": 10, "content_hash": "hash1"},
+            )
+            assert "dcmx_session_wrote" not in session.info
+            await session.commit()
+
+        for _ in range(2):
+            async with AsyncSession(engine) as session:
+                with count_queries(session_factory) as statements:
+                    assert (await DataAccessLayer.get_nft(session, "nft1")).title == "Song"
+                assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_wallet_reads_not_cached(self, session_factory):
+        """Test wallets, whose balances change constantly, always come from the database."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+        async with session_factory() as session:
+            await DataAccessLayer.get_wallet(session, "0xabc")
+
+        async with session_factory() as session:
+            with count_queries(session_factory) as statements:
+                await DataAccessLayer.get_wallet(session, "0xabc")
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_rows_not_cached(self, session_factory):
+        """Test reads after a rolled-back write don't leak into the cache."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_nft(session, "nft1", "Song", "0xabc", 10, 1, 10, "hash1")
+
+        async with session_factory() as session:
+            async with session.begin():
+                nft = await DataAccessLayer.get_nft(session, "nft1")
+                nft.title = "Draft"
+                await session.flush()
+                await DataAccessLayer.get_nft(session, "nft1")
+                await session.rollback()
+
+        async with session_factory() as session:
+            nft = await DataAccessLayer.get_nft(session, "nft1")
+
+        assert nft.title == "Song"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reader_does_not_cache_pre_commit_row(self, session_factory):
+        """Test a row read while another session's write is pending is evicted when it commits."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_nft(session, "nft1", "Song", "0xabc", 10, 1, 10, "hash1")
+
+        async with session_factory() as writer:
+            nft = await DataAccessLayer.get_nft(writer, "nft1")
+            nft.title = "Remix"
+            await writer.flush()
+
+            async with session_factory() as reader:
+                assert (await DataAccessLayer.get_nft(reader, "nft1")).title == "Song"
+
+            await writer.commit()
+
+        async with session_factory() as session:
+            assert (await DataAccessLayer.get_nft(session, "nft1")).title == "Remix"
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_keeps_unflushed_edits(self, session_factory):
+        """Test a cached row never overwrites the session's own pending changes."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_nft(session, "nft1", "Song", "0xabc", 10, 1, 10, "hash1")
+        async with session_factory() as session:
+            await DataAccessLayer.get_nft(session, "nft1")
+
+        async with session_factory() as session:
+            nft = await DataAccessLayer.get_nft(session, "nft1")
+            nft.title = "changed"
+            again = await DataAccessLayer.get_nft(session, "nft1")
+
+        assert again is nft
+        assert again.title == "changed"
+
+    @pytest.mark.asyncio
+    async def test_write_flags_cleared_after_commit(self, session_factory):
+        """Test a session caches rows again once its writes are committed."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_nft(session, "nft1", "Song", "0xabc", 10, 1, 10, "hash1")
+            assert not session.info
+
+            await DataAccessLayer.get_nft(session, "nft1")
+
+        async with session_factory() as session:
+            with count_queries(session_factory) as statements:
+                await DataAccessLayer.get_nft(session, "nft1")
+        assert statements == []
+
+
+class TestAnalytics:
+    """Test DAL analytics queries."""
+
+    @pytest.mark.asyncio
+    async def test_platform_stats(self, session_factory):
+        """Test platform stats aggregate every table."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice", is_artist=True)
+            await DataAccessLayer.create_wallet(session, "0xdef", "bob")
+            await DataAccessLayer.update_wallet_balance(session, "0xdef", 5, "set")
+            await DataAccessLayer.create_voting_record(session, "0xdef", "nft1", "like")
+            await DataAccessLayer.create_skip_record(session, "0xdef", "nft1", 10.0)
+
+            stats = await DataAccessLayer.get_platform_stats(session)
+            approximate = await DataAccessLayer.get_platform_stats(session, approximate=True)
+
+        assert approximate == stats
+        assert stats == {
+            "total_users": 2,
+            "total_artists": 1,
+            "total_nfts": 0,
+            "total_votes": 1,
+            "total_skips": 1,
+            "total_platform_balance_dcmx": 5.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_platform_stats_cached_until_write(self, session_factory):
+        """Test repeated stats reads are cached and committed writes to their tables invalidate them."""
+        async with session_factory() as session:
+            first = await DataAccessLayer.get_platform_stats(session)
+        async with session_factory() as session:
+            assert await DataAccessLayer.get_platform_stats(session) is first
+
+        async with session_factory() as session:
+            await DataAccessLayer.create_voting_record(session, "0xdef", "nft1", "like")
+        async with session_factory() as session:
+            assert (await DataAccessLayer.get_platform_stats(session))["total_votes"] == 1
+
+        async with session_factory() as session:
+            await DataAccessLayer.create_skip_record(session, "0xdef", "nft1", 0.1)
+        async with session_factory() as session:
+            assert (await DataAccessLayer.get_platform_stats(session))["total_skips"] == 1
+
+        async with session_factory() as session:
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+        async with session_factory() as session:
+            stats = await DataAccessLayer.get_platform_stats(session)
+
+        assert stats["total_users"] == 1
+        assert stats["total_votes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_analytics_invalidated_by_table(self, session_factory):
+        """Test a write only drops cached results that read the written table."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_wallet(session, "0xart", "artist", is_artist=True)
+        async with session_factory() as session:
+            earnings = await DataAccessLayer.get_artist_earnings(session, "0xart")
+            await DataAccessLayer.get_platform_stats(session)
+
+        async with session_factory() as session:
+            await DataAccessLayer.create_voting_record(session, "0xdef", "nft1", "like")
+        async with session_factory() as session:
+            assert await DataAccessLayer.get_artist_earnings(session, "0xart") is earnings
+            assert (await DataAccessLayer.get_platform_stats(session))["total_votes"] == 1
+
+        async with session_factory() as session:
+            await DataAccessLayer.update_wallet_balance(session, "0xart", 5.0)
+        async with session_factory() as session:
+            assert await DataAccessLayer.get_artist_earnings(session, "0xart") is not earnings
+
+    @pytest.mark.asyncio
+    async def test_analytics_cache_bounded(self, session_factory, monkeypatch):
+        """Test the analytics cache never grows past its size bound."""
+        monkeypatch.setattr(dal, "STATS_CACHE_MAX_ENTRIES", 2)
+        async with session_factory() as session:
+            for i in range(5):
+                await DataAccessLayer.create_wallet(session, f"0x{i}", f"artist{i}", is_artist=True)
+        async with session_factory() as session:
+            for i in range(5):
+                await DataAccessLayer.get_artist_earnings(session, f"0x{i}")
+                assert len(dal._stats_cache) <= 2
+
+    @pytest.mark.asyncio
+    async def test_platform_stats_uncommitted_not_shared(self, session_factory):
+        """Test stats read inside an uncommitted write are neither cached nor served from cache."""
+        async with session_factory() as session:
+            await DataAccessLayer.get_platform_stats(session)
+
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+            assert (await DataAccessLayer.get_platform_stats(session))["total_users"] == 1
+
+            async with session_factory() as other:
+                assert (await DataAccessLayer.get_platform_stats(other))["total_users"] == 0
+
+            await session.rollback()
+
+        async with session_factory() as session:
+            assert (await DataAccessLayer.get_platform_stats(session))["total_users"] == 0
+
+    @pytest.mark.asyncio
+    async def test_platform_stats_cached_per_database(self, session_factory):
+        """Test two databases in one process don't share cached stats."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+        async with session_factory() as session:
+            assert (await DataAccessLayer.get_platform_stats(session))["total_users"] == 1
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmpdir) / 'other.db'}")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with AsyncSession(engine) as session:
+                assert (await DataAccessLayer.get_platform_stats(session))["total_users"] == 0
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_artist_earnings(self, session_factory):
+        """Test artist earnings aggregate NFT sales."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice", is_artist=True)
+            for i, price in enumerate((10, 15)):
+                await DataAccessLayer.create_nft(
+                    session, f"nft{i}", f"Song {i}", "0xabc", price, 1, 10, f"hash{i}"
+                )
+            await DataAccessLayer.create_wallet(session, "0xdef", "bob", is_artist=True)
+
+            with count_queries(session_factory) as statements:
+                earnings = await DataAccessLayer.get_artist_earnings(session, "0xabc")
+            empty = await DataAccessLayer.get_artist_earnings(session, "0xdef")
+
+            with pytest.raises(ValueError):
+                await DataAccessLayer.get_artist_earnings(session, "0xmissing")
+
+        assert len(statements) == 1
+        assert earnings["username"] == "alice"
+        assert earnings["nfts_created"] == 2
+        assert earnings["total_sales_dcmx"] == 25.0
+        assert sorted(song["id"] for song in earnings["songs"]) == ["nft0", "nft1"]
+        assert earnings["songs"][0]["edition"] == "1/10"
+        assert empty["nfts_created"] == 0
+        assert empty["total_sales_dcmx"] == 0.0
+        assert empty["songs"] == []
+
+    @pytest.mark.asyncio
+    async def test_user_profile_stats(self, session_factory):
+        """Test vote and skip totals are aggregated per user."""
+        async with session_factory() as session:
+            await DataAccessLayer.create_wallet(session, "0xabc", "alice")
+            await DataAccessLayer.create_voting_record(session, "0xabc", "nft0", "like", 2)
+            await DataAccessLayer.create_voting_record(session, "0xabc", "nft1", "like", 1)
+            await DataAccessLayer.create_voting_record(session, "0xabc", "nft2", "dislike", 1)
+            await DataAccessLayer.create_voting_record(session, "0xdef", "nft0", "like", 5)
+            await DataAccessLayer.create_skip_record(session, "0xabc", "nft0", 10.0, -0.5)
+            await DataAccessLayer.create_skip_record(session, "0xabc", "nft1", 90.0, 0)
+
+            with count_queries(session_factory) as statements:
+                stats = (await DataAccessLayer.get_user_profile_stats(session, "0xabc"))["statistics"]
+
+        assert len(statements) == 1
+        assert stats["votes_cast"] == 3
+        assert stats["likes"] == 2
+        assert stats["dislikes"] == 1
+        assert stats["songs_skipped"] == 2
+        assert stats["total_rewards_earned"] == 4.0
+        assert stats["total_skip_charges"] == 0.5
+        assert stats["net_earnings"] == 3.5
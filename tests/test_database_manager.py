@@ -0,0 +1,200 @@
+"""Tests for DatabaseManager functionality."""
+
+import pytest
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from dcmx.database import connection, database
+from dcmx.database.config import DatabaseConfig
+from dcmx.database.database import DatabaseManager
+from dcmx.database.models import Wallet
+
+
+@pytest.fixture
+def sqlite_config():
+    """Create a config for a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield DatabaseConfig(use_sqlite=True, sqlite_path=str(Path(tmpdir) / "dcmx.db"))
+
+
+def _pragma(session, name):
+    """Read one PRAGMA value through a session."""
+    return session.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_sqlite_sync_pragmas(sqlite_config):
+    """Test sync SQLite connections run in WAL mode with relaxed fsync."""
+    manager = DatabaseManager(sqlite_config)
+
+    with manager.get_session() as session:
+        assert _pragma(session, "journal_mode") == "wal"
+        assert _pragma(session, "synchronous") == 1
+        assert _pragma(session, "temp_store") == 2
+        assert _pragma(session, "cache_size") == -65536
+
+    manager.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_async_pragmas(sqlite_config):
+    """Test async SQLite connections get the same tuning."""
+    manager = DatabaseManager(sqlite_config)
+
+    async with manager.get_async_session() as session:
+        assert (await session.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+        assert (await session.execute(text("PRAGMA synchronous"))).scalar() == 1
+
+    await manager.close_async()
+
+
+def test_sqlite_file_connections_persist(sqlite_config):
+    """Test file-backed SQLite reuses one connection across sessions."""
+    manager = DatabaseManager(sqlite_config)
+    connections = []
+
+    for _ in range(3):
+        with manager.get_session() as session:
+            connections.append(session.connection().connection.dbapi_connection)
+
+    assert len({id(conn) for conn in connections}) == 1
+    manager.close()
+
+
+def test_sqlite_memory_database_shared():
+    """Test an in-memory database survives across sessions."""
+    manager = DatabaseManager(DatabaseConfig(use_sqlite=True, sqlite_path=":memory:"))
+
+    with manager.get_session() as session:
+        session.execute(text("CREATE TABLE probe (id INTEGER)"))
+    with manager.get_session() as session:
+        assert session.execute(text("SELECT count(*) FROM probe")).scalar() == 0
+
+    manager.close()
+
+
+def test_pgbouncer_pool_options():
+    """Test PgBouncer mode drops pre-ping and shortens recycling."""
+    direct = DatabaseManager(DatabaseConfig(pool_pre_ping=True, pool_recycle=3600))
+    bouncer = DatabaseManager(DatabaseConfig(pool_pre_ping=True, pool_recycle=3600, pgbouncer_mode=True))
+
+    assert direct._pool_health_options(3600) == {"pool_pre_ping": True, "pool_recycle": 3600}
+    assert bouncer._pool_health_options(3600) == {"pool_pre_ping": False, "pool_recycle": 60}
+
+
+@pytest.mark.asyncio
+async def test_postgresql_async_engine_pool():
+    """Test the asyncpg engine uses the asyncio-adapted queue pool."""
+    manager = DatabaseManager(DatabaseConfig(async_pool_size=3, async_pool_recycle=900))
+    await manager.initialize_async()
+
+    pool = manager.async_engine.pool
+    assert isinstance(pool, AsyncAdaptedQueuePool)
+    assert pool.size() == 3
+    assert pool._recycle == 900
+
+    await manager.close_async()
+
+
+def test_get_db_manager_single_instance_across_threads(monkeypatch):
+    """Test concurrent first calls share one global manager."""
+    created = []
+
+    def slow_manager():
+        time.sleep(0.05)
+        created.append(object())
+        return created[-1]
+
+    monkeypatch.setattr(database, "_db_manager", None)
+    monkeypatch.setattr(database, "DatabaseManager", slow_manager)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        managers = list(pool.map(lambda _: database.get_db_manager(), range(8)))
+
+    assert len(created) == 1
+    assert all(m is created[0] for m in managers)
+
+
+def test_initialize_sync_once_across_threads(sqlite_config, monkeypatch):
+    """Test concurrent initialization builds a single engine."""
+    manager = DatabaseManager(sqlite_config)
+    engines = []
+    real_create_engine = database.create_engine
+
+    def slow_create_engine(*args, **kwargs):
+        time.sleep(0.05)
+        engines.append(real_create_engine(*args, **kwargs))
+        return engines[-1]
+
+    monkeypatch.setattr(database, "create_engine", slow_create_engine)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: manager.initialize_sync(), range(4)))
+
+    assert len(engines) == 1
+    assert manager.sync_engine is engines[0]
+
+    manager.close()
+
+
+@pytest.mark.asyncio
+async def test_read_only_async_session_skips_commit(sqlite_config, monkeypatch):
+    """Test read-only sessions run in autocommit mode without a closing commit."""
+    manager = DatabaseManager(sqlite_config)
+    commits = []
+    real_commit = AsyncSession.commit
+
+    async def recording_commit(self):
+        commits.append(self)
+        await real_commit(self)
+
+    monkeypatch.setattr(AsyncSession, "commit", recording_commit)
+
+    async with manager.get_async_session(read_only=True) as session:
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+        connection = await session.connection()
+        assert connection.sync_connection.get_execution_options()["isolation_level"] == "AUTOCOMMIT"
+    assert commits == []
+
+    async with manager.get_async_session() as session:
+        await session.execute(text("SELECT 1"))
+    assert len(commits) == 1
+
+    await manager.close_async()
+
+
+def test_sync_session_objects_usable_after_commit(sqlite_config):
+    """Test objects keep their loaded state once the session commits and closes."""
+    manager = DatabaseManager(sqlite_config)
+    manager.create_tables()
+
+    with manager.get_session() as session:
+        wallet = Wallet(address="0xabc", username="artist")
+        session.add(wallet)
+
+    assert wallet.username == "artist"
+
+    manager.close()
+
+
+def test_engine_kwargs_shared_between_sync_and_async():
+    """Test both PostgreSQL engines get the same pool and startup tuning."""
+    config = DatabaseConfig(pool_timeout=7, pool_recycle=1200, async_pool_recycle=900)
+    manager = DatabaseManager(config)
+    sync_kwargs = manager._engine_kwargs(is_async=False)
+    async_kwargs = manager._engine_kwargs(is_async=True)
+
+    for kwargs in (sync_kwargs, async_kwargs):
+        assert kwargs["pool_timeout"] == 7
+        assert kwargs["pool_pre_ping"] == config.pool_pre_ping
+    assert sync_kwargs["pool_recycle"] == 1200
+    assert async_kwargs["pool_recycle"] == 900
+    assert "options" in sync_kwargs["connect_args"]
+    assert async_kwargs["connect_args"]["server_settings"] == connection.SERVER_SETTINGS
+
+    bouncer = DatabaseManager(DatabaseConfig(pgbouncer_mode=True))
+    assert "connect_args" not in bouncer._engine_kwargs(is_async=False)
+    assert bouncer._engine_kwargs(is_async=True)["connect_args"] == {"prepared_statement_cache_size": 0}
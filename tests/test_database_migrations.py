@@ -0,0 +1,158 @@
+"""Tests for DatabaseMigration functionality."""
+
+import pytest
+import tempfile
+from pathlib import Path
+from sqlalchemy import event, func, inspect, select, text
+from dcmx.database.config import DatabaseConfig
+from dcmx.database.database import DatabaseManager
+from dcmx.database.migrations import (
+    ADDED_INDEXES,
+    DEFAULT_SYSTEM_CONFIGS,
+    DatabaseMigration,
+)
+from dcmx.database.models import SystemConfiguration
+
+
+@pytest.fixture
+def manager():
+    """Create a manager for a temporary SQLite database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = DatabaseManager(
+            DatabaseConfig(use_sqlite=True, sqlite_path=str(Path(tmpdir) / "dcmx.db"))
+        )
+        yield manager
+        manager.close()
+
+
+def _config_count(session):
+    """Count system configuration rows."""
+    return session.execute(select(func.count()).select_from(SystemConfiguration)).scalar()
+
+
+def test_default_config_idempotent(manager):
+    """Test repeated initialization inserts each default once."""
+    migration = DatabaseMigration(manager)
+    migration.initialize_database()
+    migration.initialize_database()
+
+    with manager.get_session() as session:
+        assert _config_count(session) == len(DEFAULT_SYSTEM_CONFIGS)
+
+
+def test_default_config_fills_missing_keys(manager):
+    """Test initialization restores a deleted default without duplicating the rest."""
+    migration = DatabaseMigration(manager)
+    migration.initialize_database()
+
+    with manager.get_session() as session:
+        row = session.execute(
+            select(SystemConfiguration).where(SystemConfiguration.config_key == "platform_name")
+        ).scalar_one()
+        session.delete(row)
+
+    migration.initialize_database()
+
+    with manager.get_session() as session:
+        assert _config_count(session) == len(DEFAULT_SYSTEM_CONFIGS)
+
+
+@pytest.mark.asyncio
+async def test_default_config_idempotent_async(manager):
+    """Test repeated async initialization inserts each default once."""
+    migration = DatabaseMigration(manager)
+    await migration.initialize_database_async()
+    await migration.initialize_database_async()
+
+    async with manager.get_async_session() as session:
+        result = await session.execute(select(func.count()).select_from(SystemConfiguration))
+        assert result.scalar() == len(DEFAULT_SYSTEM_CONFIGS)
+
+
+def test_default_config_constant_unchanged(manager):
+    """Test seeding does not mutate the shared default rows."""
+    keys = [set(row) for row in DEFAULT_SYSTEM_CONFIGS]
+    DatabaseMigration(manager).initialize_database()
+
+    assert [set(row) for row in DEFAULT_SYSTEM_CONFIGS] == keys
+
+
+def test_verify_database_uses_table_cache(manager):
+    """Test verification after create_tables needs no schema queries."""
+    migration = DatabaseMigration(manager)
+    assert migration.verify_database() is False
+
+    migration.initialize_database()
+    statements = []
+    event.listen(manager.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    assert migration.verify_database() is True
+    assert statements == []
+
+    manager.drop_tables()
+    assert migration.verify_database() is False
+
+
+def test_migration_status(manager):
+    """Test status probes for configuration and counts it only on request."""
+    migration = DatabaseMigration(manager)
+    manager.create_tables()
+
+    status = migration.get_migration_status()
+    assert status['status'] == 'ready'
+    assert status['config_exists'] is False
+    assert 'config_count' not in status
+
+    migration.initialize_database()
+
+    assert migration.get_migration_status()['config_exists'] is True
+    assert migration.get_migration_status(detailed=True)['config_count'] == len(DEFAULT_SYSTEM_CONFIGS)
+
+
+@pytest.mark.asyncio
+async def test_verify_database_async(manager):
+    """Test async verification fails before and passes after initialization."""
+    migration = DatabaseMigration(manager)
+    assert await migration.verify_database_async() is False
+
+    await migration.initialize_database_async()
+    assert await migration.verify_database_async() is True
+
+
+def _index_names(manager):
+    """Names of every index in the database."""
+    inspector = inspect(manager.sync_engine)
+    return {
+        index["name"]
+        for table in inspector.get_table_names()
+        for index in inspector.get_indexes(table)
+    }
+
+
+def test_initialize_upgrades_existing_indexes(manager):
+    """Test initialization adds new indexes to tables created before them."""
+    migration = DatabaseMigration(manager)
+    migration.initialize_database()
+    with manager.sync_engine.begin() as conn:
+        for name in ADDED_INDEXES:
+            conn.execute(text(f"DROP INDEX {name}"))
+        conn.execute(text(
+            "CREATE INDEX idx_acceptance_user_doc ON acceptance_records (user_id, document_type)"
+        ))
+
+    migration.initialize_database()
+
+    names = _index_names(manager)
+    assert set(ADDED_INDEXES) <= names
+    assert "idx_acceptance_user_doc" not in names
+
+
+@pytest.mark.asyncio
+async def test_initialize_upgrades_indexes_async(manager):
+    """Test async initialization creates the new indexes and is repeatable."""
+    migration = DatabaseMigration(manager)
+    await migration.initialize_database_async()
+    await migration.initialize_database_async()
+
+    manager.initialize_sync()
+    assert set(ADDED_INDEXES) <= _index_names(manager)
@@ -0,0 +1,51 @@
+"""Tests for sliding-window audio fingerprints."""
+
+import numpy as np
+import pytest
+from dcmx.core import fingerprint
+from dcmx.core.fingerprint import window_fingerprints
+from dcmx.core.track import Track
+
+
+def _fnv1a(data: bytes) -> int:
+    """Reference 64-bit FNV-1a."""
+    h = 0xCBF29CE484222325
+    for byte in data:
+        h = ((h ^ byte) * 0x100000001B3) & 0xFFFFFFFFFFFFFFFF
+    return h
+
+
+def test_window_fingerprints_match_reference():
+    """Test each fingerprint is FNV-1a of its window."""
+    data = bytes(range(256)) * 4
+    fps = window_fingerprints(np.frombuffer(data, dtype=np.uint8), 64, 32)
+    
+    assert fps.dtype == np.uint64
+    assert len(fps) == (len(data) - 64) // 32 + 1
+    assert int(fps[0]) == _fnv1a(data[:64])
+    assert int(fps[3]) == _fnv1a(data[96:160])
+
+
+def test_numpy_fallback_matches():
+    """Test the numpy fallback gives the same fingerprints as the default path."""
+    buf = np.frombuffer(np.random.default_rng(1).bytes(10000), dtype=np.uint8)
+    count = (len(buf) - 256) // 100 + 1
+    
+    expected = window_fingerprints(buf, 256, 100)
+    assert np.array_equal(fingerprint._fnv1a_windows_numpy(buf, 256, 100, count), expected)
+
+
+def test_repeated_segment_shares_fingerprint():
+    """Test identical windows in different tracks fingerprint the same."""
+    segment = b"chorus" * 200
+    a = Track.compute_fingerprints(b"x" * 1024 + segment, window=1024, stride=1024)
+    b = Track.compute_fingerprints(segment + b"y" * 1024, window=1024, stride=1024)
+    
+    assert a[1] == b[0]
+
+
+def test_short_input_and_bad_arguments():
+    """Test inputs shorter than a window and invalid sizes."""
+    assert len(Track.compute_fingerprints(b"abc", window=16, stride=4)) == 0
+    with pytest.raises(ValueError):
+        window_fingerprints(np.zeros(10, dtype=np.uint8), 0, 1)
@@ -0,0 +1,288 @@
+"""
+Tests for KYC Verifier
+
+Tests:
+- Encrypted profile storage and retrieval
+- Legacy per-column encrypted rows
+- Transaction gating by KYC level
+- Verification revocation
+"""
+
+import pytest
+import sqlite3
+import tempfile
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from cryptography.fernet import Fernet
+
+from dcmx.compliance.kyc_verifier import (
+    KYCVerifier,
+    KYCLevel,
+    VerificationStatus,
+    DocumentType,
+    RiskLevel,
+    UserProfile,
+    DocumentVerification,
+    AddressVerification,
+    BiometricVerification,
+    RiskAssessment,
+    _pack_envelope,
+    _unpack_envelope,
+)
+
+
+@pytest.fixture
+def temp_db_path():
+    """Create temporary database path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield str(Path(tmpdir) / "kyc.db")
+
+
+@pytest.fixture
+def encryption_key():
+    """Generate a Fernet key."""
+    return Fernet.generate_key().decode()
+
+
+@pytest.fixture
+def verifier(temp_db_path, encryption_key):
+    """Create KYC verifier with temp database."""
+    return KYCVerifier(encryption_key=encryption_key, db_path=temp_db_path)
+
+
+@pytest.fixture
+def full_profile():
+    """Create a fully populated profile."""
+    return UserProfile(
+        user_id="user123",
+        wallet_address="0xabc123",
+        email="user@example.com",
+        email_verified=True,
+        kyc_level=KYCLevel.ENHANCED,
+        verification_status=VerificationStatus.APPROVED,
+        verification_timestamp="2024-01-01T00:00:00+00:00",
+        legal_name="Jane Doe",
+        date_of_birth="1990-01-01",
+        document_verification=DocumentVerification(
+            document_type=DocumentType.PASSPORT,
+            document_number="X1234567",
+            issuing_country="US",
+            verified=True,
+            confidence_score=0.95,
+        ),
+        address_verification=AddressVerification(
+            address_line1="1 Main St",
+            city="Springfield",
+            country="US",
+            verified=True,
+        ),
+        biometric_verification=BiometricVerification(
+            liveness_check_passed=True,
+            face_match_score=0.97,
+            face_match_passed=True,
+        ),
+        risk_assessment=RiskAssessment(
+            overall_score=10.0,
+            risk_level=RiskLevel.LOW,
+            factors={"email_verified": 0.0},
+            flags=["note"],
+        ),
+        source_of_funds="Salary",
+        source_of_funds_verified=True,
+        created_at="2024-01-01T00:00:00+00:00",
+        updated_at="2024-01-01T00:00:00+00:00",
+    )
+
+
+class TestProfileStorage:
+    """Test encrypted profile persistence."""
+
+    @pytest.mark.asyncio
+    async def test_store_and_load_roundtrip(self, verifier, full_profile, temp_db_path, encryption_key):
+        """Test profile survives a store/load cycle through the database."""
+        await verifier._store_profile(full_profile)
+
+        fresh = KYCVerifier(encryption_key=encryption_key, db_path=temp_db_path)
+        profile = await fresh.get_profile("user123")
+
+        assert profile == full_profile
+
+    @pytest.mark.asyncio
+    async def test_pii_not_stored_in_plaintext(self, verifier, full_profile, temp_db_path):
+        """Test PII is encrypted at rest."""
+        await verifier._store_profile(full_profile)
+
+        conn = sqlite3.connect(temp_db_path)
+        row = conn.execute("SELECT * FROM kyc_profiles WHERE user_id = ?", ("user123",)).fetchone()
+        conn.close()
+
+        stored = " ".join(str(v) for v in row)
+        assert "Jane Doe" not in stored
+        assert "user@example.com" not in stored
+        assert "X1234567" not in stored
+
+    @pytest.mark.asyncio
+    async def test_load_legacy_per_column_row(self, verifier, temp_db_path, encryption_key):
+        """Test rows written with one token per encrypted column still load."""
+        fernet = Fernet(encryption_key.encode())
+
+        def enc(value):
+            return fernet.encrypt(value.encode()).decode()
+
+        conn = sqlite3.connect(temp_db_path)
+        conn.execute("""
+            INSERT INTO kyc_profiles (
+                user_id, wallet_address, email_encrypted, email_verified,
+                kyc_level, verification_status, jurisdiction, pii_encrypted,
+                document_data_encrypted, source_of_funds_encrypted
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            "legacy",
+            "0xlegacy",
+            enc("legacy@example.com"),
+            1,
+            KYCLevel.STANDARD.value,
+            "approved",
+            "US",
+            enc(json.dumps({"legal_name": "Old User", "date_of_birth": "1980-05-05"})),
+            enc(json.dumps({
+                "document_type": "passport",
+                "document_number": "P999",
+                "issuing_country": "US",
+                "verified": True,
+            })),
+            enc("Savings"),
+        ))
+        conn.commit()
+        conn.close()
+
+        profile = await verifier.get_profile("legacy")
+
+        assert profile.email == "legacy@example.com"
+        assert profile.legal_name == "Old User"
+        assert profile.kyc_level == KYCLevel.STANDARD
+        assert profile.document_verification.document_type == DocumentType.PASSPORT
+        assert profile.source_of_funds == "Savings"
+
+    def test_unpack_rejects_unknown_version(self):
+        """Test envelopes with an unknown format byte are refused."""
+        blob = _pack_envelope({"email": "a@b.co"})
+
+        assert _unpack_envelope(blob)["email"] == "a@b.co"
+        with pytest.raises(ValueError):
+            _unpack_envelope(bytes([0xFF]) + blob[1:])
+
+    @pytest.mark.asyncio
+    async def test_verification_level_without_profile_load(self, verifier, full_profile, temp_db_path, encryption_key):
+        """Test level lookup reads the stored level without decrypting the profile."""
+        await verifier._store_profile(full_profile)
+
+        fresh = KYCVerifier(encryption_key=encryption_key, db_path=temp_db_path)
+        assert await fresh.get_verification_level("user123") == KYCLevel.ENHANCED
+        assert await fresh.get_verification_level("nobody") == KYCLevel.UNVERIFIED
+        assert "user123" not in fresh.verified_users
+
+    @pytest.mark.asyncio
+    async def test_risk_level_without_profile_load(self, verifier, full_profile, temp_db_path, encryption_key):
+        """Test risk level lookup reads the stored JSON in SQL."""
+        await verifier._store_profile(full_profile)
+
+        fresh = KYCVerifier(encryption_key=encryption_key, db_path=temp_db_path)
+        assert await fresh.get_risk_level("user123") == RiskLevel.LOW
+        assert await fresh.get_risk_level("nobody") is None
+        assert "user123" not in fresh.verified_users
+
+    @pytest.mark.asyncio
+    async def test_get_missing_profile(self, verifier):
+        """Test unknown user returns None."""
+        assert await verifier.get_profile("nobody") is None
+
+
+class TestTransactionGating:
+    """Test KYC thresholds on transactions."""
+
+    @pytest.mark.asyncio
+    async def test_small_transaction_allowed(self, verifier):
+        """Test transactions under the threshold need no KYC."""
+        result = await verifier.is_transaction_allowed("nobody", 100.0, 0.0)
+        assert result["allowed"] is True
+        assert result["current_level"] is None
+
+    @pytest.mark.asyncio
+    async def test_small_transaction_skips_level_lookup(self, verifier):
+        """Test transactions under the threshold never read the KYC level."""
+        with patch.object(verifier, "get_verification_level", new_callable=AsyncMock) as mock_level:
+            result = await verifier.is_transaction_allowed("user123", 2_000.0, 8_000.0)
+
+        assert result["allowed"] is True
+        mock_level.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_standard_required(self, verifier):
+        """Test Standard KYC is required above $10K."""
+        result = await verifier.is_transaction_allowed("nobody", 5_000.0, 8_000.0)
+        assert result["allowed"] is False
+        assert result["required_level"] == KYCLevel.STANDARD.value
+
+    @pytest.mark.asyncio
+    async def test_enhanced_required(self, verifier, full_profile):
+        """Test Enhanced KYC is required above $50K."""
+        full_profile.kyc_level = KYCLevel.STANDARD
+        await verifier._store_profile(full_profile)
+
+        result = await verifier.is_transaction_allowed("user123", 10_000.0, 45_000.0)
+        assert result["allowed"] is False
+        assert result["required_level"] == KYCLevel.ENHANCED.value
+
+    @pytest.mark.asyncio
+    async def test_enhanced_allowed(self, verifier, full_profile):
+        """Test Enhanced users may exceed $50K."""
+        await verifier._store_profile(full_profile)
+
+        result = await verifier.is_transaction_allowed("user123", 10_000.0, 45_000.0)
+        assert result["allowed"] is True
+        assert result["current_level"] == KYCLevel.ENHANCED.value
+
+
+class TestRevocation:
+    """Test verification revocation."""
+
+    @pytest.mark.asyncio
+    async def test_revoke_verification(self, verifier, full_profile, temp_db_path, encryption_key):
+        """Test revocation is persisted and keeps encrypted data intact."""
+        await verifier._store_profile(full_profile)
+
+        assert await verifier.revoke_verification("user123", "fraud") is True
+
+        fresh = KYCVerifier(encryption_key=encryption_key, db_path=temp_db_path)
+        profile = await fresh.get_profile("user123")
+
+        assert profile.kyc_level == KYCLevel.UNVERIFIED
+        assert profile.verification_status == VerificationStatus.REJECTED
+        assert "revoked:fraud" in profile.risk_assessment.flags
+        assert profile.legal_name == "Jane Doe"
+        assert profile.email == "user@example.com"
+
+    @pytest.mark.asyncio
+    async def test_revoke_does_not_reencrypt(self, verifier, full_profile, temp_db_path):
+        """Test revocation leaves the encrypted envelope untouched."""
+        await verifier._store_profile(full_profile)
+
+        def envelope():
+            conn = sqlite3.connect(temp_db_path)
+            value = conn.execute(
+                "SELECT envelope_encrypted FROM kyc_profiles WHERE user_id = ?", ("user123",)
+            ).fetchone()[0]
+            conn.close()
+            return value
+
+        before = envelope()
+        await verifier.revoke_verification("user123", "fraud")
+        assert envelope() == before
+
+    @pytest.mark.asyncio
+    async def test_revoke_missing_profile(self, verifier):
+        """Test revoking unknown user fails."""
+        assert await verifier.revoke_verification("nobody", "fraud") is False
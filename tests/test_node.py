@@ -0,0 +1,139 @@
+"""Tests for Node functionality."""
+
+import asyncio
+import pytest
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+from dcmx.core.node import Node
+from dcmx.core.track import Track
+from dcmx.network.peer import Peer
+
+
+@pytest.fixture
+def node():
+    """Create a node with a temporary data directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Node(data_dir=Path(tmpdir))
+
+
+def test_discover_track(node):
+    """Test discovering peers that advertise a track."""
+    peer1 = Peer(peer_id="peer1", available_tracks={"hash1", "hash2"})
+    peer2 = Peer(peer_id="peer2", available_tracks={"hash2"})
+    node._register_peer(peer1)
+    node._register_peer(peer2)
+
+    assert node.discover_track("hash1") == [peer1]
+    assert set(node.discover_track("hash2")) == {peer1, peer2}
+    assert node.discover_track("missing") == []
+
+
+def test_reregister_peer_updates_index(node):
+    """Test re-registering a peer replaces its advertised tracks."""
+    node._register_peer(Peer(peer_id="peer1", available_tracks={"hash1"}))
+    node._register_peer(Peer(peer_id="peer1", available_tracks={"hash2"}))
+
+    assert node.discover_track("hash1") == []
+    assert [p.peer_id for p in node.discover_track("hash2")] == ["peer1"]
+
+
+def test_remove_peer(node):
+    """Test removed peers are no longer discovered."""
+    node._register_peer(Peer(peer_id="peer1", available_tracks={"hash1"}))
+
+    assert node.remove_peer("peer1") is True
+    assert node.discover_track("hash1") == []
+    assert "hash1" not in node._track_to_peers
+    assert node.remove_peer("peer1") is False
+
+
+def test_peer_track_changes_update_index(node):
+    """Test tracks added or removed through the node are discovered correctly."""
+    peer = Peer(peer_id="peer1", available_tracks={"hash1"})
+    node._register_peer(peer)
+
+    assert node.add_peer_track("peer1", "hash2") is True
+    assert node.discover_track("hash2") == [peer]
+
+    assert node.remove_peer_track("peer1", "hash1") is True
+    assert node.discover_track("hash1") == []
+    assert "hash1" not in node._track_to_peers
+    assert node.add_peer_track("unknown", "hash1") is False
+
+
+def test_discover_track_skips_stale_index(node):
+    """Test peers that dropped a track outside the node are not returned."""
+    peer = Peer(peer_id="peer1", available_tracks={"hash1"})
+    node._register_peer(peer)
+
+    peer.remove_track("hash1")
+    assert node.discover_track("hash1") == []
+
+    node.peers["peer1"] = Peer(peer_id="peer1", available_tracks={"hash2"})
+    node._register_peer(Peer(peer_id="peer2", available_tracks={"hash1"}))
+    assert [p.peer_id for p in node.discover_track("hash1")] == ["peer2"]
+
+
+def _peers_with_track(node, content_hash, count):
+    """Register peers that all advertise one track."""
+    peers = [Peer(peer_id=f"peer{i}", available_tracks={content_hash}) for i in range(count)]
+    for peer in peers:
+        node._register_peer(peer)
+    return peers
+
+
+@pytest.mark.asyncio
+async def test_request_track_first_verified_wins(node):
+    """Test the fastest valid response is used and slower requests are cancelled."""
+    content = b"audio bytes"
+    content_hash = Track.compute_content_hash(content)
+    slow, fast, corrupt = _peers_with_track(node, content_hash, 3)
+    cancelled = []
+
+    async def request_content(peer, requested_hash):
+        if peer is slow:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(peer.peer_id)
+                raise
+        if peer is corrupt:
+            return b"tampered"
+        await asyncio.sleep(0.01)
+        return content
+
+    with patch.object(node.protocol, "request_content", side_effect=request_content):
+        result = await asyncio.wait_for(node.request_track(content_hash), timeout=5)
+
+    assert result == content
+    assert cancelled == ["peer0"]
+    assert node.get_track_content(content_hash) == content
+
+
+@pytest.mark.asyncio
+async def test_request_track_tries_next_batch(node):
+    """Test later peers are tried when a whole batch fails."""
+    content = b"audio bytes"
+    content_hash = Track.compute_content_hash(content)
+    peers = _peers_with_track(node, content_hash, Node.MAX_PARALLEL_DOWNLOADS + 1)
+    good = peers[-1]
+
+    async def request_content(peer, requested_hash):
+        if peer is good:
+            return content
+        raise ConnectionError("peer down")
+
+    with patch.object(node.protocol, "request_content", side_effect=request_content):
+        assert await node.request_track(content_hash) == content
+
+
+@pytest.mark.asyncio
+async def test_request_track_rejects_bad_hash(node):
+    """Test content that doesn't match its hash is never returned."""
+    content_hash = Track.compute_content_hash(b"real")
+    _peers_with_track(node, content_hash, 2)
+
+    with patch.object(node.protocol, "request_content", new_callable=AsyncMock, return_value=b"fake"):
+        assert await node.request_track(content_hash) is None
+    assert node.get_track_content(content_hash) is None
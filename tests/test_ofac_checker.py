@@ -9,6 +9,7 @@ Tests:
 - Network error handling with cache fallback
 """
 
+import asyncio
 import pytest
 import tempfile
 import json
@@ -17,12 +18,24 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, patch, MagicMock
 
+import numpy as np
+
 from dcmx.compliance.ofac_checker import (
     OFACChecker,
     BloomFilter,
+    PerfectHashIndex,
+    SortedKeyIndex,
+    LRUCache,
     SDNEntry,
+    NUMBA_AVAILABLE,
+    _encode_name,
+    _levenshtein_py,
+    _normalize_query,
 )
 
+if NUMBA_AVAILABLE:
+    from dcmx.compliance.ofac_checker import _levenshtein_codes
+
 
 class TestBloomFilter:
     """Test bloom filter for O(1) lookups."""
@@ -32,7 +45,7 @@ class TestBloomFilter:
         bf = BloomFilter(size=1000, hash_count=5)
         assert bf.size == 1000
         assert bf.hash_count == 5
-        assert len(bf.bit_array) == 1000
+        assert bf.blocks.shape == (2, 8)  # two 512-bit blocks
 
     def test_add_and_check(self):
         """Test adding items and checking membership."""
@@ -61,6 +74,30 @@ class TestBloomFilter:
         assert bf.might_contain("0xabcdef") is True
         assert bf.might_contain("0xABCDEF") is True
 
+    def test_for_capacity(self):
+        """Test sizing bloom filter from expected item count."""
+        bf = BloomFilter.for_capacity(1000, error_rate=0.001)
+        assert bf.size >= 14000
+        assert bf.hash_count == 8  # capped at one probe per block word
+
+        items = [f"0x{i:040x}" for i in range(1000)]
+        for item in items:
+            bf.add(item)
+        assert all(bf.might_contain(item) for item in items)
+
+    def test_might_contain_many(self):
+        """Test vectorized batch membership matches single lookups."""
+        bf = BloomFilter.for_capacity(500)
+        for i in range(500):
+            bf.add(f"0x{i:040x}")
+
+        queries = [f"0x{i:040X}" for i in range(0, 1000, 7)]
+        result = bf.might_contain_many(queries)
+
+        assert result.tolist() == [bf.might_contain(q) for q in queries]
+        assert all(result[:72])  # first 72 queries are members
+        assert bf.might_contain_many([]).tolist() == []
+
     def test_clear(self):
         """Test clearing bloom filter."""
         bf = BloomFilter(size=1000)
@@ -71,6 +108,85 @@ class TestBloomFilter:
         assert bf.might_contain("test") is False
 
 
+class TestPerfectHashIndex:
+    """Test static perfect hash address index."""
+
+    def test_contains_all_keys(self):
+        """Test every key is found in its own slot."""
+        keys = np.array(sorted(f"0x{i * 7919:040x}".encode() for i in range(5000)), dtype=bytes)
+        index = PerfectHashIndex(keys)
+
+        assert len(index) == 5000
+        assert all(key in index for key in keys.tolist())
+        assert sorted(index.slots.tolist()) == list(range(5000))
+        assert index.table.dtype == np.int32
+
+    def test_missing_keys(self):
+        """Test absent keys are rejected."""
+        keys = np.array([b"0xaaa", b"0xbbb", b"0xccc"], dtype=bytes)
+        index = PerfectHashIndex(keys)
+
+        assert b"0xddd" not in index
+        assert b"0xaa" not in index
+
+    def test_empty(self):
+        """Test empty index."""
+        index = PerfectHashIndex(np.empty(0, dtype="S1"))
+        assert len(index) == 0
+        assert b"0xabc" not in index
+
+    def test_duplicate_keys(self):
+        """Test repeated keys are indexed once instead of stalling the build."""
+        keys = np.array([b"0xaaa", b"0xaaa", b"0xbbb", b"0xbbb", b"0xccc"], dtype=bytes)
+        index = PerfectHashIndex(keys)
+
+        assert len(index) == 3
+        assert all(key in index for key in (b"0xaaa", b"0xbbb", b"0xccc"))
+        assert b"0xddd" not in index
+
+    def test_colliding_hashes_raise(self, monkeypatch):
+        """Test keys with identical hashes fail instead of looping forever."""
+        monkeypatch.setattr("dcmx.compliance.ofac_checker._phf_hash", lambda key: (1, 1, 1))
+
+        keys = np.array([b"0xaaa", b"0xbbb"], dtype=bytes)
+        with pytest.raises(ValueError):
+            PerfectHashIndex(keys)
+
+    def test_from_table(self):
+        """Test a saved table answers lookups without rebuilding."""
+        keys = np.array(sorted(f"0x{i * 7919:040x}".encode() for i in range(500)), dtype=bytes)
+        table = PerfectHashIndex(keys).table.copy()
+
+        index = PerfectHashIndex.from_table(keys, table)
+        assert all(key in index for key in keys.tolist())
+        assert b"0xmissing" not in index
+
+        with pytest.raises(ValueError):
+            PerfectHashIndex.from_table(keys[:-1], table)
+
+
+class TestLRUCache:
+    """Test bounded LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted at capacity."""
+        cache = LRUCache(maxsize=2)
+        cache["a"] = True
+        cache["b"] = False
+        assert cache.get("a") is True
+        cache["c"] = True
+        
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_get_missing(self):
+        """Test missing keys return the default."""
+        cache = LRUCache(maxsize=2)
+        assert cache.get("x") is None
+        assert cache.get("x", False) is False
+
+
 class TestSDNEntry:
     """Test SDN entry dataclass."""
 
@@ -164,6 +280,109 @@ class TestOFACChecker:
         assert "0xtest123" in checker.entity_cache
         assert checker.entity_cache["0xtest123"] is True
 
+    @pytest.mark.asyncio
+    async def test_rebuild_clears_entity_cache(self, checker):
+        """Test cached verdicts don't survive a list refresh."""
+        checker._build_indexes()
+        assert await checker.check_address("0xnew") is False
+        
+        checker.crypto_addresses = {"0xnew"}
+        checker._build_indexes()
+        assert await checker.check_address("0xnew") is True
+
+    @pytest.mark.asyncio
+    async def test_checker_falls_back_to_sorted_lookup(self, checker, monkeypatch):
+        """Test address checks still work when the perfect hash can't be built."""
+        monkeypatch.setattr(PerfectHashIndex, "MAX_DISPLACEMENT", 0)
+        checker.crypto_addresses = {f"0xaddr{i}" for i in range(100)}
+        checker._build_indexes()
+
+        assert isinstance(checker.address_table, SortedKeyIndex)
+        assert await checker.check_address("0xaddr42") is True
+        assert await checker.check_address("0xaddr100") is False
+
+    @pytest.mark.asyncio
+    async def test_check_addresses_logs_blocked(self, checker, caplog):
+        """Test batch screening reports how many wallets were blocked."""
+        checker.crypto_addresses = {"0xsanctioned123", "0xabcdef123456"}
+        checker._build_indexes()
+
+        result = await checker.check_addresses(
+            ["0xclean", "0xSANCTIONED123", "", None, "0xabcdef123456", "0xzzzzzzzzzzzzzzzzzzzz"]
+        )
+        assert result == [False, True, False, False, True, False]
+        assert "2 sanctioned wallets in batch of 6" in caplog.text
+
+    def test_build_releases_address_set(self, checker):
+        """Test the staged address set is dropped once the indexes hold it."""
+        checker.crypto_addresses = {"0xsanctioned123", "0x" + "ab" * 20}
+        checker._build_indexes()
+
+        assert checker.crypto_addresses == set()
+        assert sorted(checker._index_addresses()) == ["0x" + "ab" * 20, "0xsanctioned123"]
+
+    @pytest.mark.asyncio
+    async def test_eth_addresses_stored_as_raw_bytes(self, checker):
+        """Test ETH addresses go to the compact 20-byte index."""
+        eth = "0x1234567890ABCDEF1234567890abcdef12345678"
+        eth_zero_tail = "0x1234567890abcdef1234567890abcdef12340000"
+        checker.crypto_addresses = {eth, eth_zero_tail, "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"}
+        checker._build_indexes()
+        
+        assert checker.eth_index.dtype == np.dtype("S20")
+        assert len(checker.eth_index) == 2
+        assert len(checker.address_index) == 1
+        
+        assert await checker.check_address(eth.lower()) is True
+        assert await checker.check_address(eth_zero_tail) is True
+        assert await checker.check_address("0x1234567890abcdef1234567890abcdef12340001") is False
+        assert await checker.check_address("1a1zp1ep5qgefi2dmptftl5slmv7divfna") is True
+        
+        checker.entity_cache.clear()
+        blocked = await checker.check_addresses([
+            eth, "0x" + "0" * 40, eth_zero_tail, "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa",
+        ])
+        assert blocked == [True, False, True, True]
+
+    @pytest.mark.asyncio
+    async def test_check_addresses_no_list_loaded(self, checker):
+        """Test batch screening with no sanctions list loaded."""
+        checker._build_indexes()
+        assert await checker.check_addresses(["0xabc"]) == [False]
+
+    @pytest.mark.asyncio
+    async def test_check_addresses(self, checker):
+        """Test batched async checks match per-address checks and fill the cache."""
+        checker.crypto_addresses = {"0xsanctioned123", "0xabcdef123456"}
+        checker._build_indexes()
+        
+        wallets = ["0xSanctioned123", "0xclean", None, "0xabcdef123456", "0xsanctioned123"]
+        result = await checker.check_addresses(wallets)
+        
+        assert result == [True, False, False, True, True]
+        assert checker.entity_cache["0xclean"] is False
+        assert await checker.check_addresses([]) == []
+
+    @pytest.mark.asyncio
+    async def test_check_addresses_uses_cache(self, checker):
+        """Test cached verdicts skip the bloom probe."""
+        checker._build_indexes()
+        checker.entity_cache["0xcached"] = True
+        
+        with patch.object(checker.bloom_filter, 'might_contain_many') as probe:
+            assert await checker.check_addresses(["0xCACHED"]) == [True]
+        probe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_check_addresses_fails_closed(self, checker):
+        """Test a failing exact match blocks the batch without caching verdicts."""
+        checker.crypto_addresses = {"0xsanctioned123"}
+        checker._build_indexes()
+        
+        with patch.object(checker, '_match_addresses', side_effect=RuntimeError("index gone")):
+            assert await checker.check_addresses(["0xsanctioned123", "0xclean"]) == [True, True]
+        assert "0xsanctioned123" not in checker.entity_cache
+
     @pytest.mark.asyncio
     async def test_check_name_exact_match(self, checker):
         """Test exact name matching."""
@@ -176,6 +395,18 @@ class TestOFACChecker:
         assert result["blocked"] is True
         assert result["score"] == 1.0
 
+    @pytest.mark.asyncio
+    async def test_check_name_ignores_control_characters(self, checker):
+        """Test control characters embedded in a name don't evade an exact match."""
+        checker.sdn_entries = {
+            "123": SDNEntry(uid="123", name="Bad Actor Corp", entry_type="Entity")
+        }
+        checker._build_indexes()
+        
+        result = await checker.check_name("Bad\x00 Act\x1bor Corp")
+        assert result["blocked"] is True
+        assert result["score"] == 1.0
+
     @pytest.mark.asyncio
     async def test_check_name_fuzzy_match(self, checker):
         """Test fuzzy name matching."""
@@ -189,6 +420,28 @@ class TestOFACChecker:
         assert result["blocked"] is True
         assert result["score"] >= 0.7
 
+    def test_fuzzy_candidates_pruned(self, checker):
+        """Test the q-gram index only returns names that could match."""
+        checker.sdn_entries = {
+            "1": SDNEntry(uid="1", name="Bad Actor Corporation", entry_type="Entity"),
+            "2": SDNEntry(uid="2", name="Zyxwvut Holdings", entry_type="Entity"),
+            "3": SDNEntry(uid="3", name="Quiet Harbor Shipping", entry_type="Entity"),
+        }
+        checker._build_indexes()
+        
+        candidates = set(checker._fuzzy_candidates("bad acctor corporation", 0.85))
+        assert candidates == {"bad actor corporation"}
+
+    def test_fuzzy_candidates_short_query_scans_all(self, checker):
+        """Test queries too short for the q-gram bound fall back to every name."""
+        checker.sdn_entries = {
+            "1": SDNEntry(uid="1", name="Evil Corp", entry_type="Entity"),
+            "2": SDNEntry(uid="2", name="Acme", entry_type="Entity"),
+        }
+        checker._build_indexes()
+        
+        assert set(checker._fuzzy_candidates("acne", 0.7)) == {"evil corp", "acme"}
+
     @pytest.mark.asyncio
     async def test_check_name_no_match(self, checker):
         """Test name with no match."""
@@ -218,22 +471,19 @@ class TestOFACChecker:
         result = await checker.check_entity("Sanctioned Entity")
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_is_list_stale_no_update(self, checker):
+    def test_is_list_stale_no_update(self, checker):
         """Test stale check with no update."""
-        assert await checker.is_list_stale() is True
+        assert checker.is_list_stale() is True
 
-    @pytest.mark.asyncio
-    async def test_is_list_stale_fresh(self, checker):
+    def test_is_list_stale_fresh(self, checker):
         """Test stale check with fresh data."""
         checker.last_update = datetime.now()
-        assert await checker.is_list_stale() is False
+        assert checker.is_list_stale() is False
 
-    @pytest.mark.asyncio
-    async def test_is_list_stale_old(self, checker):
+    def test_is_list_stale_old(self, checker):
         """Test stale check with old data."""
         checker.last_update = datetime.now() - timedelta(days=10)
-        assert await checker.is_list_stale() is True
+        assert checker.is_list_stale() is True
 
     def test_fuzzy_similarity_exact(self, checker):
         """Test fuzzy similarity with exact match."""
@@ -250,6 +500,26 @@ class TestOFACChecker:
         score = checker._fuzzy_similarity("hello world", "xyz abc")
         assert score < 0.5
 
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_levenshtein_kernel_matches_python(self):
+        """Test the JIT Levenshtein kernel agrees with the pure-Python DP."""
+        pairs = [("kitten", "sitting"), ("bad actor", "bad acctor"), ("", "abc"), ("müller", "muller")]
+        for s1, s2 in pairs:
+            assert _levenshtein_codes(_encode_name(s1), _encode_name(s2)) == _levenshtein_py(s1, s2)
+
+    def test_score_names_matches_fuzzy_similarity(self, checker):
+        """Test batch scoring agrees with per-pair similarity above the cutoff."""
+        names = ["bad actor corp", "bad acctor corp", "good company", "bad"]
+        scored = dict(checker._score_names("bad actor corp", names, 0.7))
+        expected = {
+            name: checker._fuzzy_similarity("bad actor corp", name)
+            for name in names
+            if checker._fuzzy_similarity("bad actor corp", name) >= 0.7
+        }
+        assert scored.keys() == expected.keys()
+        for name, score in scored.items():
+            assert score == pytest.approx(expected[name])
+
     def test_fuzzy_similarity_empty(self, checker):
         """Test fuzzy similarity with empty strings."""
         assert checker._fuzzy_similarity("", "test") == 0.0
@@ -260,6 +530,43 @@ class TestOFACChecker:
         assert checker._normalize_name("  John  DOE  ") == "john doe"
         assert checker._normalize_name("O'Brien, Inc.") == "obrien inc"
         assert checker._normalize_name("Test-Corp!") == "testcorp"
+        assert checker._normalize_name("Al_Qaida") == "al_qaida"
+        assert checker._normalize_name("Müller’s «Firm»") == "müllers firm"
+        assert checker._normalize_name("Ev\x00il\x07 Corp\x7f") == "evil corp"
+        assert checker._normalize_name("Evil\x1f\tCorp") == "evil corp"
+        assert checker._normalize_name("Ev\x00il Müller") == checker._normalize_name("Evil Müller")
+
+    def test_parse_sdn_csv(self, checker):
+        """Test parsing SDN and address CSVs with quoted commas."""
+        sdn_csv = (
+            '36,"AEROCARIBBEAN AIRLINES","-0- ","CUBA","-0- ","-0- ","-0- ","-0- ","-0- ","-0- ","-0- ","-0- "\n'
+            '42,"BAD ACTOR, LTD.","Entity","CYBER2","-0- ","-0- ","-0- ","-0- ","-0- ","-0- ","-0- ",'
+            '"Digital Currency Address - ETH 0x1234567890abcdef1234567890abcdef12345678;"\n'
+        )
+        add_csv = '42,25,"1 Main St","Springfield, IL","United States","-0- "\n'
+        
+        checker._parse_sdn_csv(sdn_csv, add_csv)
+        
+        assert set(checker.sdn_entries) == {"36", "42"}
+        entry = checker.sdn_entries["42"]
+        assert entry.name == "BAD ACTOR, LTD."
+        assert entry.programs == ["CYBER2"]
+        assert entry.crypto_addresses == ["0x1234567890abcdef1234567890abcdef12345678"]
+        assert entry.addresses == ["1 Main St, Springfield, IL, United States"]
+        assert "0x1234567890abcdef1234567890abcdef12345678" in checker.crypto_addresses
+
+    @pytest.mark.asyncio
+    async def test_check_name_memoizes_normalization(self, checker):
+        """Test repeated query names reuse the cached normalization."""
+        checker._build_indexes()
+        _normalize_query.cache_clear()
+        
+        await checker.check_name("Repeat  Query, Inc.")
+        await checker.check_name("Repeat  Query, Inc.")
+        
+        info = _normalize_query.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
 
     def test_extract_crypto_addresses(self, checker):
         """Test extracting crypto addresses from remarks."""
@@ -273,6 +580,20 @@ class TestOFACChecker:
         addresses = checker._extract_crypto_addresses(remarks)
         assert "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa" in addresses
 
+    def test_extract_multiple_addresses(self, checker):
+        """Test extracting tagged addresses of several currencies in one pass."""
+        remarks = (
+            "Digital Currency Address - XBT 1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa; "
+            "alt. Digital Currency Address - XMR 4AdUndXHHZ6cfufTMvppY6JwXNouMBzSkbLYfpAV5Usx3skxNgYeYTRj5UzqtReoS44qo9mtmXCqY45DJ852K5Jv2684Rge; "
+            "alt. Digital Currency Address - XBT bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq;"
+        )
+        addresses = checker._extract_crypto_addresses(remarks)
+        assert sorted(addresses) == sorted([
+            "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa",
+            "4AdUndXHHZ6cfufTMvppY6JwXNouMBzSkbLYfpAV5Usx3skxNgYeYTRj5UzqtReoS44qo9mtmXCqY45DJ852K5Jv2684Rge",
+            "bc1qar0srrr7xfkvy5l643lydnw9re59gtzzwf5mdq",
+        ])
+
     @pytest.mark.asyncio
     async def test_cache_save_and_load(self, checker, temp_cache_dir):
         """Test saving and loading cache."""
@@ -286,6 +607,7 @@ class TestOFACChecker:
         }
         checker.crypto_addresses = {"0xtest123"}
         checker.last_update = datetime.now()
+        checker._build_indexes()
         
         await checker._save_to_cache()
         
@@ -294,7 +616,126 @@ class TestOFACChecker:
         
         assert result is True
         assert "123" in new_checker.sdn_entries
-        assert "0xtest123" in new_checker.crypto_addresses
+        assert new_checker.sdn_entries == checker.sdn_entries
+        assert await new_checker.check_address("0xtest123") is True
+
+    @pytest.mark.asyncio
+    async def test_download_fetches_concurrently(self, checker):
+        """Test SDN and ADD files are downloaded concurrently."""
+        in_flight = 0
+        peak = 0
+        
+        async def fake_fetch(session, url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if url == checker.SDN_CSV_URL:
+                return '42,"BAD ACTOR","Entity","CYBER2"'
+            return ""
+        
+        with patch.object(checker, '_fetch_csv', side_effect=fake_fetch):
+            await checker._download_and_parse_sdn()
+        await checker.close()
+        
+        assert peak == 2
+        assert "42" in checker.sdn_entries
+
+    @pytest.mark.asyncio
+    async def test_session_reused_across_refreshes(self, checker):
+        """Test one HTTP session serves every download until closed."""
+        first = await checker._get_session()
+        assert await checker._get_session() is first
+        
+        await checker.close()
+        assert first.closed
+        assert checker.session is None
+        
+        second = await checker._get_session()
+        assert second is not first
+        await checker.close()
+
+    @pytest.mark.asyncio
+    async def test_load_legacy_json_cache(self, checker):
+        """Test a JSON cache from older releases is still read."""
+        checker.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(checker.LEGACY_CACHE_FILE, 'w') as f:
+            json.dump({
+                'timestamp': datetime.now().isoformat(),
+                'entries': {"7": {"uid": "7", "name": "Old Entity", "entry_type": "Entity"}},
+                'crypto_addresses': ["0xold"],
+            }, f)
+        
+        assert await checker._load_from_cache() is True
+        assert checker.sdn_entries["7"].name == "Old Entity"
+        assert await checker.check_address("0xold") is True
+
+    @pytest.mark.asyncio
+    async def test_load_corrupted_cache(self, checker):
+        """Test an unreadable cache file is treated as missing."""
+        checker.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        checker.CACHE_FILE.write_bytes(b"not gzip")
+        
+        assert await checker._load_from_cache() is False
+
+    @pytest.mark.asyncio
+    async def test_cache_address_index_mmap(self, checker, temp_cache_dir):
+        """Test persisted address index is memory-mapped on load."""
+        checker.crypto_addresses = {"0xtest123", "0xABCdef456", "0x" + "ab" * 20}
+        checker.last_update = datetime.now()
+        checker._build_indexes()
+
+        await checker._save_to_cache()
+        assert checker.ADDRESS_INDEX_FILE.exists()
+
+        new_checker = OFACChecker(cache_dir=temp_cache_dir)
+        with patch.object(PerfectHashIndex, '__init__', side_effect=AssertionError("rebuilt")):
+            assert await new_checker._load_from_cache() is True
+        assert isinstance(new_checker.address_index, np.memmap)
+        assert isinstance(new_checker.address_table.table, np.memmap)
+        assert new_checker.crypto_addresses == set()
+        assert new_checker.get_stats()["crypto_addresses"] == 3
+        assert await new_checker.check_address("0x" + "AB" * 20) is True
+
+        assert await new_checker.check_address("0xabcdef456") is True
+        assert await new_checker.check_address("0xTEST123") is True
+        assert await new_checker.check_address("0xtest12") is False
+
+    @pytest.mark.asyncio
+    async def test_cache_address_index_rejected_for_other_list(self, checker, temp_cache_dir):
+        """Test sidecars built from a different same-sized list are rebuilt."""
+        checker.crypto_addresses = {"0xinnocent"}
+        checker.last_update = datetime.now()
+        checker._build_indexes()
+        await checker._save_to_cache()
+        stale = {path: path.read_bytes() for path in checker._index_files()}
+
+        checker.crypto_addresses = {"0xsanctioned"}
+        checker._build_indexes()
+        await checker._save_to_cache()
+        for path, data in stale.items():
+            path.write_bytes(data)
+
+        new_checker = OFACChecker(cache_dir=temp_cache_dir)
+        assert await new_checker._load_from_cache() is True
+        assert not isinstance(new_checker.address_index, np.memmap)
+        assert await new_checker.check_address("0xsanctioned") is True
+        assert await new_checker.check_address("0xinnocent") is False
+
+    @pytest.mark.asyncio
+    async def test_cache_address_index_missing_sidecar(self, checker, temp_cache_dir):
+        """Test a cache whose sidecars are incomplete rebuilds from the address list."""
+        checker.crypto_addresses = {"0xsanctioned"}
+        checker.last_update = datetime.now()
+        checker._build_indexes()
+        await checker._save_to_cache()
+        checker.ADDRESS_TABLE_FILE.unlink()
+
+        new_checker = OFACChecker(cache_dir=temp_cache_dir)
+        assert await new_checker._load_from_cache() is True
+        assert not isinstance(new_checker.address_index, np.memmap)
+        assert await new_checker.check_address("0xsanctioned") is True
 
     @pytest.mark.asyncio
     async def test_cache_expiry(self, checker, temp_cache_dir):
@@ -314,6 +755,7 @@ class TestOFACChecker:
         checker.sdn_entries = {"1": SDNEntry(uid="1", name="Cached", entry_type="Entity")}
         checker.crypto_addresses = {"0xcached"}
         checker.last_update = datetime.now() - timedelta(days=10)
+        checker._build_indexes()
         await checker._save_to_cache()
         
         new_checker = OFACChecker(cache_dir=temp_cache_dir)
@@ -323,12 +765,13 @@ class TestOFACChecker:
             await new_checker.load_sdn_list()
         
         assert "1" in new_checker.sdn_entries
-        assert "0xcached" in new_checker.crypto_addresses
+        assert await new_checker.check_address("0xcached") is True
 
     def test_get_stats(self, checker):
         """Test getting statistics."""
         checker.sdn_entries = {"1": SDNEntry(uid="1", name="Test", entry_type="Entity")}
         checker.crypto_addresses = {"0x1", "0x2"}
+        checker._build_indexes()
         checker.entity_cache = {"0x1": True}
         checker.last_update = datetime.now()
         
@@ -338,6 +781,7 @@ class TestOFACChecker:
         assert stats["crypto_addresses"] == 2
         assert stats["cached_lookups"] == 1
         assert stats["last_update"] is not None
+        assert stats["is_stale"] is False
 
     @pytest.mark.asyncio
     async def test_refresh_if_stale(self, checker):
@@ -381,6 +825,7 @@ class TestOFACCheckerIntegration:
         with patch.object(checker, '_fetch_csv', new_callable=AsyncMock) as mock_fetch:
             mock_fetch.side_effect = [mock_sdn_csv, mock_add_csv]
             await checker.load_sdn_list(force_refresh=True)
+        await checker.close()
         
         assert len(checker.sdn_entries) == 2
         
@@ -1,7 +1,8 @@
 """Tests for Track functionality."""
 
+import sys
 import pytest
-from dcmx.core.track import Track
+from dcmx.core.track import Track, _canonical_json
 
 
 def test_track_creation():
@@ -112,6 +113,24 @@ def test_track_from_dict():
     assert track.duration == 180
 
 
+def test_track_msgpack_roundtrip():
+    """Test track survives msgpack transport serialization."""
+    track = Track(
+        title="Test Song",
+        artist="Test Artist",
+        content_hash="abc123",
+        duration=180,
+        size=5000000,
+        year=2024,
+        metadata={"bpm": 120, "tags": ["lofi"]},
+    )
+    
+    restored = Track.from_msgpack(track.to_msgpack())
+    
+    assert restored == track
+    assert restored.get_metadata_hash() == track.get_metadata_hash()
+
+
 def test_track_str_repr():
     """Test string representations."""
     track = Track(
@@ -130,3 +149,138 @@ def test_track_str_repr():
     repr_str = repr(track)
     assert "Track" in repr_str
     assert "Test Song" in repr_str
+
+
+def test_content_digest():
+    """Test raw digest matches the hex content hash."""
+    data = b"fake audio data"
+    digest = Track.compute_content_digest(data)
+    track = Track(
+        title="Test Song",
+        artist="Test Artist",
+        content_hash=Track.compute_content_hash(data),
+        duration=180,
+        size=len(data),
+    )
+    
+    assert len(digest) == 32
+    assert track.content_digest == digest
+    assert digest.hex() == track.content_hash
+
+
+def test_dedupe_hashes():
+    """Test duplicate content is detected across a catalog."""
+    hashes = [Track.compute_content_hash(data) for data in (b"a", b"b", b"a", b"c", b"b")]
+    tracks = [
+        Track(title=f"Song {i}", artist="Artist", content_hash=h, duration=1, size=1)
+        for i, h in enumerate(hashes)
+    ]
+    
+    matrix = Track.digest_matrix(tracks)
+    
+    assert matrix.shape == (5, 32)
+    assert Track.dedupe_hashes(matrix).tolist() == [0, 1, 3]
+    assert Track.dedupe_hashes(Track.digest_matrix([])).tolist() == []
+
+
+def test_compute_content_hash_stream(tmp_path):
+    """Test streaming hash matches the in-memory hash."""
+    content = bytes(range(256)) * 5000
+    path = tmp_path / "track.mp3"
+    path.write_bytes(content)
+    
+    expected = Track.compute_content_hash(content)
+    
+    assert Track.compute_content_hash_stream(path) == expected
+    assert Track.compute_content_hash_stream(str(path), chunk_size=4096) == expected
+    with open(path, "rb") as f:
+        assert Track.compute_content_hash_stream(f, chunk_size=1000) == expected
+
+
+def test_compute_content_hashes(tmp_path):
+    """Test batch hashing returns each file's content hash."""
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"track{i}.mp3"
+        path.write_bytes(f"audio {i}".encode() * 1000)
+        paths.append(path)
+    
+    hashes = Track.compute_content_hashes(paths, max_workers=2)
+    
+    assert list(hashes) == paths
+    for path in paths:
+        assert hashes[path] == Track.compute_content_hash(path.read_bytes())
+    assert Track.compute_content_hashes([]) == {}
+
+
+def test_track_metadata_hash_distinguishes_fields():
+    """Test metadata hash changes with any field and separates None from text."""
+    base = dict(title="Test Song", artist="Test Artist", content_hash="abc123",
+                duration=180, size=5000000, timestamp="2024-01-01T00:00:00+00:00")
+    track = Track(**base)
+    
+    assert Track(**base).get_metadata_hash() == track.get_metadata_hash()
+    assert Track(**{**base, "duration": 181}).get_metadata_hash() != track.get_metadata_hash()
+    assert Track(**base, album="None").get_metadata_hash() != track.get_metadata_hash()
+    assert (
+        Track(**base, metadata={"b": 1, "a": 2}).get_metadata_hash()
+        == Track(**base, metadata={"a": 2, "b": 1}).get_metadata_hash()
+    )
+
+
+def test_track_metadata_hash_json_canonical():
+    """Test metadata JSON bytes are pinned for floats, NaN and non-str keys."""
+    metadata = {"big": 1e16, "small": 1e-7, "nan": float("nan"), 2: "two", "1": "one", None: [1.5]}
+    
+    assert _canonical_json(metadata) == (
+        b'{"1":"one","2":"two","big":1e+16,"nan":NaN,"null":[1.5],"small":1e-07}'
+    )
+
+
+def test_track_metadata_hash_mixed_keys():
+    """Test metadata with int and str keys hashes instead of raising."""
+    base = dict(
+        title="Test Song", artist="Test Artist", content_hash="abc123", duration=180, size=5000000,
+        timestamp="2024-01-01T00:00:00+00:00",
+    )
+    
+    assert (
+        Track(**base, metadata={1: "x", "a": 1.5}).get_metadata_hash()
+        == Track(**base, metadata={"a": 1.5, 1: "x"}).get_metadata_hash()
+    )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+def test_track_has_no_instance_dict():
+    """Test Track instances are slotted."""
+    track = Track(title="Test Song", artist="Test Artist", content_hash="abc123", duration=180, size=5000000)
+    
+    assert not hasattr(track, "__dict__")
+    with pytest.raises(AttributeError):
+        track.unknown_field = 1
+
+
+def test_batch_timestamp():
+    """Test tracks share the batch timestamp inside the block only."""
+    ts = "2024-01-01T00:00:00+00:00"
+    with Track.batch_timestamp(ts) as stamp:
+        tracks = [
+            Track(title=f"Song {i}", artist="Artist", content_hash=str(i), duration=1, size=1)
+            for i in range(3)
+        ]
+        explicit = Track(title="x", artist="y", content_hash="z", duration=1, size=1, timestamp="explicit")
+    
+    assert stamp == ts
+    assert all(track.timestamp == ts for track in tracks)
+    assert explicit.timestamp == "explicit"
+    assert Track(title="x", artist="y", content_hash="z", duration=1, size=1).timestamp != ts
+
+
+def test_batch_timestamp_reset_on_error():
+    """Test the batch timestamp is cleared when the block raises."""
+    ts = "2024-01-01T00:00:00+00:00"
+    with pytest.raises(RuntimeError):
+        with Track.batch_timestamp(ts):
+            raise RuntimeError("load failed")
+    
+    assert Track(title="x", artist="y", content_hash="z", duration=1, size=1).timestamp != ts